@@ -24,16 +24,26 @@ WARNING: This performs PERMANENT, UNRECOVERABLE data destruction.
 Use only for authorized emergency protection.
 """
 
-import subprocess
 import sys
 import os
+import errno
 import platform
-import shutil
-
-# Auto-install dependencies
-def check_dependencies():
+import stat
+import struct
+import array
+import json
+import mmap
+import re
+import fnmatch
+
+# Third-party packages are imported lazily inside the functions that need
+# them, so each mode only pays for what it uses.
+REQUIRED_PACKAGES = {'pycryptodome': 'Crypto', 'requests': 'requests', 'psutil': 'psutil'}
+
+# Dependency check/auto-install (opt-in with --check-deps)
+def check_dependencies(required=REQUIRED_PACKAGES):
     """Check and install required dependencies."""
-    required = {'pycryptodome': 'Crypto', 'requests': 'requests', 'psutil': 'psutil'}
+    import subprocess
     missing = []
 
     for package, import_name in required.items():
@@ -52,20 +62,14 @@ def check_dependencies():
             print(f"\033[91m❌ Failed to install dependencies. Please run: pip install {' '.join(missing)}\033[0m")
             sys.exit(1)
 
-check_dependencies()
-
-from Crypto.Cipher import AES
-from Crypto.Protocol.KDF import PBKDF2
-from Crypto.Random import get_random_bytes
-import argparse
 from time import sleep
-import requests
 import time
 import logging
 from datetime import datetime, timedelta
 import random
 import string
-import psutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 # Detect OS
 CURRENT_OS = platform.system()  # 'Windows', 'Darwin' (Mac), or 'Linux'
@@ -82,7 +86,7 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
-print(f'''{Colors.OKCYAN}
+BANNER = f'''{Colors.OKCYAN}
 ╔═══════════════════════════════════════════════════════════════╗
 ║                                                               ║
 ║   ██████╗ ██╗    ██╗██╗██████╗ ███████╗                     ║
@@ -106,7 +110,7 @@ print(f'''{Colors.OKCYAN}
     {Colors.FAIL}⚠️  NEW: TRUE DELETION - Not just encryption!{Colors.ENDC}
     {Colors.WARNING}Platform: {CURRENT_OS} | Multi-Pass Overwrite Enabled{Colors.ENDC}
 
-''')
+'''
 
 def setup_logging(verbose=False):
     """Setup logging configuration."""
@@ -119,8 +123,291 @@ def setup_logging(verbose=False):
 
 def secure_random_data(size):
     """Generate cryptographically secure random data."""
+    from Crypto.Random import get_random_bytes
     return get_random_bytes(size)
 
+def random_keystream():
+    """
+    Create a fresh AES-256-CTR keystream for filling buffers in place.
+
+    Encrypting a borrowed buffer into itself yields CSPRNG output without
+    allocating a new bytes object per chunk.
+    """
+    from Crypto.Cipher import AES
+    from Crypto.Random import get_random_bytes
+    return AES.new(get_random_bytes(32), AES.MODE_CTR, nonce=get_random_bytes(8))
+
+def fill_pattern(view, pattern):
+    """Fill a writable memoryview with a repeated byte pattern, in place."""
+    size = len(view)
+    if size == 0:
+        return
+    view[:len(pattern)] = pattern
+    filled = len(pattern)
+    while filled < size:
+        step = min(filled, size - filled)
+        view[filled:filled + step] = view[:step]
+        filled += step
+
+def parse_size(text):
+    """Parse a size such as '512K', '64M' or '1G' into bytes."""
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+    text = str(text).strip().upper().rstrip('B').rstrip('I')
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+def parse_duration(text):
+    """Parse a duration such as '90', '30m', '12h' or '7d' into seconds."""
+    units = {'S': 1, 'M': 60, 'H': 3600, 'D': 86400, 'W': 604800}
+    text = str(text).strip().upper()
+    if text and text[-1] in units:
+        return float(text[:-1]) * units[text[-1]]
+    return float(text)
+
+def format_duration(seconds):
+    """Format seconds as a short human duration such as '45s', '12m 5s' or '3h 20m'."""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+
+WIPE_METHODS = ('secure', 'wipe', 'encrypt')
+WIPE_PASSES = (1, 3, 7, 35)
+PRIORITY_RANGE = (-128, 127)  # Stored in the manifest's signed-char priority column
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1MB
+MIN_CHUNK_SIZE = 64 * 1024       # 64KB
+DEFAULT_SPLIT_THRESHOLD = 1024 * 1024 * 1024  # Files this large are overwritten in ranges
+DEFAULT_RANGE_SIZE = 64 * 1024 * 1024
+
+class BufferPool:
+    """
+    Fixed-size wipe buffers shared by all workers under one memory budget.
+
+    Workers borrow a buffer for the file they are wiping and return it when
+    done. Buffers are allocated lazily up to the budget; once it is reached,
+    acquire() blocks until another worker gives one back (backpressure).
+    The chunk size shrinks (down to MIN_CHUNK_SIZE) so every worker can hold
+    a buffer within the budget; a budget below MIN_CHUNK_SIZE is rejected
+    (ValueError), since even one buffer would exceed it.
+
+    With shared=True buffers are multiprocessing.shared_memory blocks, so a
+    CryptoOffload process pool can fill them in place; close() frees them.
+    With aligned=True buffers are anonymous mmaps, which start on a page
+    boundary (shared blocks always do).
+    """
+
+    def __init__(self, budget=None, workers=1, chunk_size=DEFAULT_CHUNK_SIZE, shared=False,
+                 aligned=False):
+        if budget is not None:
+            if budget < MIN_CHUNK_SIZE:
+                raise ValueError(f"Memory budget must be at least {MIN_CHUNK_SIZE // 1024}K")
+            while chunk_size > MIN_CHUNK_SIZE and chunk_size * workers > budget:
+                chunk_size //= 2
+            self.capacity = max(1, budget // chunk_size)
+        else:
+            self.capacity = max(1, workers)
+        self.buffer_size = chunk_size
+        self.budget = budget
+        self.shared = shared
+        self.aligned = aligned
+        self._segments = {}  # id(buffer) -> SharedMemory
+        self._free = []
+        self._allocated = 0
+        self._cond = threading.Condition()
+        self.in_use = 0
+        self.peak = 0
+        self.waits = 0
+
+    def acquire(self):
+        """Borrow a buffer, blocking while the pool is exhausted."""
+        with self._cond:
+            while not self._free and self._allocated >= self.capacity:
+                self.waits += 1
+                self._cond.wait()
+            if self._free:
+                buf = self._free.pop()
+            elif self.shared:
+                from multiprocessing import shared_memory
+                segment = shared_memory.SharedMemory(create=True, size=self.buffer_size)
+                buf = segment.buf[:self.buffer_size]  # The block may be rounded up to a page
+                self._segments[id(buf)] = segment
+                self._allocated += 1
+            elif self.aligned:
+                buf = mmap.mmap(-1, self.buffer_size)
+                self._allocated += 1
+            else:
+                buf = bytearray(self.buffer_size)
+                self._allocated += 1
+            self.in_use += 1
+            self.peak = max(self.peak, self.in_use)
+            return buf
+
+    def release(self, buf):
+        """Return a borrowed buffer to the pool."""
+        with self._cond:
+            self._free.append(buf)
+            self.in_use -= 1
+            self._cond.notify()
+
+    @property
+    def peak_bytes(self):
+        return self.peak * self.buffer_size
+
+    def shared_name(self, buf):
+        """Name of the shared memory block behind a borrowed buffer."""
+        return self._segments[id(buf)].name
+
+    def close(self):
+        """Free shared memory blocks; the pool must not be in use."""
+        with self._cond:
+            for buf in self._free:
+                segment = self._segments.pop(id(buf), None)
+                if segment is not None:
+                    buf.release()
+                    segment.close()
+                    segment.unlink()
+            self._free = []
+            self._allocated = 0
+
+_OFFLOAD_SEGMENTS = {}
+
+def _offload_attach(name):
+    """Attach (once per process) to a shared buffer created by the parent."""
+    segment = _OFFLOAD_SEGMENTS.get(name)
+    if segment is None:
+        from multiprocessing import shared_memory
+        # Spawned workers share the parent's resource tracker, which unlinks
+        # the block once, when the parent does
+        segment = _OFFLOAD_SEGMENTS[name] = shared_memory.SharedMemory(name=name)
+    return segment.buf
+
+def _offload_random(name, length):
+    """Process-pool task: fill the first length bytes of a shared buffer with random data."""
+    view = _offload_attach(name)[:length]
+    random_keystream().encrypt(view, output=view)
+
+def _offload_encrypt(name, length, key, iv):
+    """Process-pool task: AES-256-CBC encrypt a shared buffer in place, returning the next IV."""
+    from Crypto.Cipher import AES
+    view = _offload_attach(name)[:length]
+    AES.new(key, AES.MODE_CBC, iv).encrypt(view, output=view)
+    return bytes(view[length - AES.block_size:length])
+
+class CryptoOffload:
+    """
+    Process pool for the CPU-heavy parts of a wipe: random pass data and
+    the encryption layer.
+
+    Buffers come from a shared BufferPool, so only the block name and a
+    length cross the process boundary - the data is never pickled. Writer
+    threads stay in this process and wait on the result, which lets
+    several writers keep several cores busy. CBC chaining is kept across
+    chunks by passing the last ciphertext block on as the next IV.
+    """
+
+    def __init__(self, processes):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        self.processes = processes
+        # spawn: forking a process that already runs writer threads is unsafe
+        self._executor = ProcessPoolExecutor(max_workers=processes,
+                                             mp_context=multiprocessing.get_context('spawn'))
+
+    def fill_random(self, pool, buf, length):
+        self._executor.submit(_offload_random, pool.shared_name(buf), length).result()
+
+    def encrypt(self, pool, buf, length, key, iv):
+        """Encrypt buf[:length] in place; returns the IV for the next chunk."""
+        return self._executor.submit(_offload_encrypt, pool.shared_name(buf), length, key, iv).result()
+
+    def close(self):
+        self._executor.shutdown()
+
+class IOThrottle:
+    """
+    Token bucket shared by all wipe workers to cap bandwidth and IOPS.
+
+    Each write or fsync consumes tokens; a worker that overdraws the bucket
+    sleeps until the debt is paid back, so the aggregate rate across all
+    workers stays at max_mbps / max_iops with at most one second of burst.
+
+    With adaptive=True the device utilization reported by
+    psutil.disk_io_counters() is sampled about once a second, and an extra
+    per-operation delay is doubled while any disk is busier than
+    util_threshold percent and halved again once it calms down.
+    """
+
+    def __init__(self, max_mbps=None, max_iops=None, adaptive=False, util_threshold=80.0):
+        self.byte_rate = max_mbps * 1024 * 1024 if max_mbps else None
+        self.op_rate = max_iops or None
+        self.byte_tokens = self.byte_rate or 0
+        self.op_tokens = self.op_rate or 0
+        self.adaptive = adaptive
+        self.util_threshold = util_threshold
+        self.backoff = 0.0
+        self.throttled_seconds = 0.0
+        self.peak_utilization = 0.0
+        self._lock = threading.Lock()
+        self._last = time.monotonic()
+        self._sample_at = self._last
+        self._busy = self._disk_busy_times() if adaptive else None
+        if adaptive and self._busy is None:
+            logging.warning("Adaptive throttling unavailable: disk busy time not reported on this platform")
+            self.adaptive = False
+
+    @staticmethod
+    def _disk_busy_times():
+        try:
+            import psutil
+            counters = psutil.disk_io_counters(perdisk=True)
+            if not counters or not hasattr(next(iter(counters.values())), 'busy_time'):
+                return None
+            return {name: c.busy_time for name, c in counters.items()}
+        except Exception:
+            return None
+
+    def _sample_utilization(self, now):
+        busy = self._disk_busy_times()
+        elapsed_ms = (now - self._sample_at) * 1000
+        if busy is None or elapsed_ms <= 0:
+            return
+        utilization = max((busy[name] - self._busy.get(name, busy[name])) / elapsed_ms * 100
+                          for name in busy) if busy else 0.0
+        self.peak_utilization = max(self.peak_utilization, utilization)
+        if utilization > self.util_threshold:
+            self.backoff = min(1.0, max(0.01, self.backoff * 2))
+        else:
+            self.backoff = self.backoff / 2 if self.backoff > 0.001 else 0.0
+        self._busy = busy
+        self._sample_at = now
+
+    def consume(self, nbytes=0, ops=1):
+        """Account for one I/O operation, sleeping if the bucket is overdrawn."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last
+            self._last = now
+            delay = 0.0
+            if self.byte_rate:
+                self.byte_tokens = min(self.byte_rate, self.byte_tokens + elapsed * self.byte_rate) - nbytes
+                if self.byte_tokens < 0:
+                    delay = -self.byte_tokens / self.byte_rate
+            if self.op_rate:
+                self.op_tokens = min(self.op_rate, self.op_tokens + elapsed * self.op_rate) - ops
+                if self.op_tokens < 0:
+                    delay = max(delay, -self.op_tokens / self.op_rate)
+            if self.adaptive:
+                if now - self._sample_at >= 1.0:
+                    self._sample_utilization(now)
+                delay += self.backoff
+            self.throttled_seconds += delay
+        if delay > 0:
+            sleep(delay)
+
 def get_file_size(file_path):
     """Get file size in bytes."""
     try:
@@ -128,6 +415,452 @@ def get_file_size(file_path):
     except:
         return 0
 
+# FIEMAP ioctl (linux/fiemap.h) - physical extent mapping for reflink detection
+FS_IOC_FIEMAP = 0xC020660B
+FIEMAP_MAX_OFFSET = (1 << 64) - 1
+FIEMAP_EXTENT_LAST = 0x00000001
+FIEMAP_EXTENT_SHARED = 0x00002000
+_FIEMAP_HEADER = struct.Struct('=QQLLLL')
+_FIEMAP_EXTENT = struct.Struct('=QQQQQLLLL')
+
+def get_file_extents(file_path, batch=128):
+    """
+    Map the physical extents of a file using the FIEMAP ioctl (Linux only).
+
+    Returns:
+        List of (logical, physical, length, flags) tuples, or None if FIEMAP
+        is not supported by the platform or filesystem.
+    """
+    if CURRENT_OS != 'Linux':
+        return None
+    try:
+        import fcntl
+    except ImportError:
+        return None
+
+    extents = []
+    start = 0
+    try:
+        with open(file_path, 'rb') as f:
+            while True:
+                buf = bytearray(_FIEMAP_HEADER.size + _FIEMAP_EXTENT.size * batch)
+                _FIEMAP_HEADER.pack_into(buf, 0, start, FIEMAP_MAX_OFFSET - start, 0, 0, batch, 0)
+                fcntl.ioctl(f.fileno(), FS_IOC_FIEMAP, buf)
+                mapped = _FIEMAP_HEADER.unpack_from(buf, 0)[3]
+                if mapped == 0:
+                    break
+
+                last = False
+                for i in range(mapped):
+                    fe = _FIEMAP_EXTENT.unpack_from(buf, _FIEMAP_HEADER.size + i * _FIEMAP_EXTENT.size)
+                    logical, physical, length, flags = fe[0], fe[1], fe[2], fe[5]
+                    extents.append((logical, physical, length, flags))
+                    last = bool(flags & FIEMAP_EXTENT_LAST)
+                if last:
+                    break
+                start = logical + length
+    except OSError:
+        return None
+    return extents
+
+# Manifest record states
+STATE_PENDING = 0
+STATE_DONE = 1
+STATE_FAILED = 2
+
+class Manifest:
+    """
+    Compact, array-backed list of files to wipe.
+
+    Tens of millions of files do not fit in a dict or tuple per file, so
+    every name is a row across parallel `array` columns and all name and
+    directory strings live back to back in one bytes arena:
+
+        name_off  Q  offset of the file name in the arena     8 bytes
+        name_len  H  length of the file name                  2 bytes
+        parent    I  index of the parent directory            4 bytes
+        size      Q  st_size                                  8 bytes
+        inode     Q  st_ino                                   8 bytes
+        device    H  index into the (small) device table      2 bytes
+        priority  b  scheduling priority (higher runs first)  1 byte
+        state     B  STATE_PENDING / STATE_DONE / FAILED      1 byte
+        next_link i  next name of the same inode, -1 = none   4 bytes
+
+    Per file name that is 38 bytes of columns plus the encoded name, plus
+    4 bytes per inode in `primaries`, plus 12 bytes (dir_off, dir_len) and
+    the path per directory, shared by its files. Hardlinks are chained
+    through next_link; only inodes with st_nlink > 1 also take an entry in
+    the dedupe dict. On the `rwipe_bench.py manifest` tree (23-byte names,
+    200 files per directory, 2% hardlinked) this measures ~65 bytes per
+    file in columns and arena, ~71 bytes of heap with array growth slack
+    and the dict.
+
+    A manifest can be saved to disk and re-opened memory-mapped, so the
+    columns are paged in by the kernel instead of held on the heap.
+    """
+
+    COLUMNS = (('name_off', 'Q'), ('name_len', 'H'), ('parent', 'I'), ('size', 'Q'),
+               ('inode', 'Q'), ('device', 'H'), ('priority', 'b'), ('state', 'B'),
+               ('next_link', 'i'))
+    MAGIC = b'RWIPEMF1'
+
+    def __init__(self):
+        self.arena = bytearray()
+        for name, code in self.COLUMNS:
+            setattr(self, name, array.array(code))
+        self.dir_off = array.array('Q')
+        self.dir_len = array.array('I')
+        self.devices = []
+        self.primaries = array.array('I')  # First name of every inode
+        self._device_index = {}
+        self._links = {}
+        self._mmap = None
+
+    def __len__(self):
+        return len(self.size)
+
+    def _intern(self, data):
+        offset = len(self.arena)
+        self.arena += data
+        return offset
+
+    def add_directory(self, path):
+        """Intern a directory path and return its index."""
+        data = os.fsencode(path)
+        self.dir_off.append(self._intern(data))
+        self.dir_len.append(len(data))
+        return len(self.dir_off) - 1
+
+    def add(self, parent, name, st, size, priority=0):
+        """
+        Append one file name. Returns True if it starts a new inode, False
+        if it is another hardlink to an inode already in the manifest.
+        """
+        data = os.fsencode(name)
+        index = len(self.size)
+        dev = self._device_index.get(st.st_dev)
+        if dev is None:
+            dev = self._device_index[st.st_dev] = len(self.devices)
+            self.devices.append(st.st_dev)
+
+        self.name_off.append(self._intern(data))
+        self.name_len.append(len(data))
+        self.parent.append(parent)
+        self.size.append(size)
+        self.inode.append(st.st_ino)
+        self.device.append(dev)
+        self.priority.append(priority)
+        self.state.append(STATE_PENDING)
+        self.next_link.append(-1)
+
+        if st.st_nlink > 1:
+            key = (st.st_dev, st.st_ino)
+            last = self._links.get(key)
+            self._links[key] = index
+            if last is not None:
+                self.next_link[last] = index
+                return False
+        self.primaries.append(index)
+        return True
+
+    def directory(self, index):
+        off = self.dir_off[index]
+        return os.fsdecode(bytes(self.arena[off:off + self.dir_len[index]]))
+
+    def name(self, index):
+        off = self.name_off[index]
+        return os.fsdecode(bytes(self.arena[off:off + self.name_len[index]]))
+
+    def path(self, index):
+        """Full path of one record."""
+        return os.path.join(self.directory(self.parent[index]), self.name(index))
+
+    def links(self, index):
+        """All record indices for the inode whose first name is `index`."""
+        indices = [index]
+        while self.next_link[indices[-1]] != -1:
+            indices.append(self.next_link[indices[-1]])
+        return indices
+
+    def key(self, index):
+        return (self.devices[self.device[index]], self.inode[index])
+
+    @property
+    def nbytes(self):
+        """Bytes held by the arena and columns (0 for mapped storage)."""
+        if self._mmap is not None:
+            return 0
+        columns = [getattr(self, name) for name, _ in self.COLUMNS]
+        columns += [self.dir_off, self.dir_len, self.primaries]
+        return len(self.arena) + sum(c.itemsize * len(c) for c in columns)
+
+    def save(self, path):
+        """Write the manifest to disk in a layout load() can memory-map."""
+        columns = [(name, getattr(self, name)) for name, _ in self.COLUMNS]
+        columns += [('dir_off', self.dir_off), ('dir_len', self.dir_len), ('primaries', self.primaries)]
+        header = json.dumps({
+            'byteorder': sys.byteorder,
+            'devices': self.devices,
+            'sections': [[name, c.typecode if hasattr(c, 'typecode') else c.format, len(c)]
+                         for name, c in columns] + [['arena', 'B', len(self.arena)]],
+        }).encode()
+        with open(path, 'wb') as f:
+            f.write(self.MAGIC + struct.pack('=Q', len(header)) + header)
+            for _, column in columns + [('arena', self.arena)]:
+                f.write(b'\0' * (-f.tell() % 8))  # Keep every section 8-byte aligned
+                f.write(memoryview(column).cast('B'))
+
+    @classmethod
+    def load(cls, path, use_mmap=True):
+        """
+        Open a saved manifest. With use_mmap the columns are views over a
+        private (copy-on-write) mapping of the file instead of heap arrays.
+        """
+        manifest = cls()
+        with open(path, 'rb') as f:
+            if use_mmap:
+                data = manifest._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            else:
+                data = f.read()
+        view = memoryview(data)
+        if bytes(view[:8]) != cls.MAGIC:
+            raise ValueError(f"Not an rwipe manifest: {path}")
+        header_len = struct.unpack_from('=Q', view, 8)[0]
+        header = json.loads(bytes(view[16:16 + header_len]))
+        if header['byteorder'] != sys.byteorder:
+            raise ValueError("Manifest was written on a machine with a different byte order")
+
+        manifest.devices = header['devices']
+        offset = 16 + header_len
+        for name, code, count in header['sections']:
+            offset += -offset % 8
+            size = array.array(code).itemsize * count
+            section = view[offset:offset + size]
+            if name == 'arena':
+                manifest.arena = section
+            else:
+                setattr(manifest, name, section.cast(code) if use_mmap else array.array(code, section.tobytes()))
+            offset += size
+        return manifest
+
+class ScanFilter:
+    """
+    Include/exclude rules compiled into one matcher, applied during the scan.
+
+    Globs without a '/' match the entry name (e.g. '.git', '*.sqlite');
+    globs with a '/' and all regexes match the path relative to the target,
+    using '/' separators. Excluded directories are pruned without being
+    descended into. Files must then match an include rule (if any were
+    given) and the size and age predicates.
+
+    Args:
+        include/exclude: Glob patterns
+        include_regex/exclude_regex: Regular expressions (re.search)
+        min_size/max_size: File size bounds in bytes
+        older_than/newer_than: Modification age bounds in seconds
+    """
+
+    def __init__(self, include=(), exclude=(), include_regex=(), exclude_regex=(),
+                 min_size=None, max_size=None, older_than=None, newer_than=None, now=None):
+        self.include = self._compile(include, include_regex)
+        self.exclude = self._compile(exclude, exclude_regex)
+        self.min_size = min_size
+        self.max_size = max_size
+        now = time.time() if now is None else now
+        self.mtime_before = now - older_than if older_than is not None else None
+        self.mtime_after = now - newer_than if newer_than is not None else None
+
+    @staticmethod
+    def _compile(globs, regexes):
+        """Fold globs and regexes into (name_re, path_glob_re, path_re), or None."""
+        def join(patterns):
+            return re.compile('|'.join(f'(?:{p})' for p in patterns)) if patterns else None
+
+        rules = (join([fnmatch.translate(g) for g in globs if '/' not in g]),
+                 join([fnmatch.translate(g.strip('/')) for g in globs if '/' in g]),
+                 join(list(regexes)))
+        return rules if any(rules) else None
+
+    @staticmethod
+    def _matches(rules, relpath, name):
+        name_re, path_glob_re, path_re = rules
+        return bool((name_re and name_re.match(name)) or
+                    (path_glob_re and path_glob_re.match(relpath)) or
+                    (path_re and path_re.search(relpath)))
+
+    @property
+    def active(self):
+        return any(x is not None for x in (self.include, self.exclude, self.min_size, self.max_size,
+                                           self.mtime_before, self.mtime_after))
+
+    def prune(self, relpath, name):
+        """True if a directory should be skipped without descending into it."""
+        return self.exclude is not None and self._matches(self.exclude, relpath, name)
+
+    def match(self, relpath, name, st):
+        """True if a file should be wiped."""
+        if self.exclude is not None and self._matches(self.exclude, relpath, name):
+            return False
+        if self.include is not None and not self._matches(self.include, relpath, name):
+            return False
+        if self.min_size is not None and st.st_size < self.min_size:
+            return False
+        if self.max_size is not None and st.st_size > self.max_size:
+            return False
+        if self.mtime_before is not None and st.st_mtime > self.mtime_before:
+            return False
+        if self.mtime_after is not None and st.st_mtime < self.mtime_after:
+            return False
+        return True
+
+def scan_directories(location, scan_filter=None, info=None):
+    """
+    Walk a tree with os.scandir, yielding (directory, relpath, entries).
+
+    `entries` are the non-directory DirEntry objects of that directory;
+    subdirectories rejected by scan_filter.prune() are never opened.
+    Symlinks to directories are neither followed nor returned, like
+    os.walk(). Pruned directory counts go to info['pruned_dirs'].
+    """
+    stack = [(location, '')]
+    while stack:
+        directory, relpath = stack.pop()
+        files = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    rel = f"{relpath}/{entry.name}" if relpath else entry.name
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if scan_filter is not None and scan_filter.prune(rel, entry.name):
+                            if info is not None:
+                                info['pruned_dirs'] += 1
+                            continue
+                        stack.append((entry.path, rel))
+                    elif not entry.is_symlink() or not os.path.isdir(entry.path):
+                        files.append(entry)
+        except OSError as e:
+            logging.debug(f"Cannot scan {directory}: {e}")
+            continue
+        yield directory, relpath, files
+
+def build_manifest(location, detect_reflinks=True, scan_filter=None, priority=0):
+    """
+    Scan a directory into a compact Manifest, grouping names by inode.
+
+    Hardlinked names resolve to the same (st_dev, st_ino), so each inode is
+    overwritten once and all of its names are unlinked afterwards. Where
+    FIEMAP is available, extents shared through reflinks are detected too:
+    overwriting them only breaks the share (copy-on-write), so the other
+    owner keeps the old data and the operator needs to know.
+
+    An optional ScanFilter is applied while scanning; info reports how
+    many directories were pruned and files excluded versus matched.
+
+    Returns:
+        (manifest, info) - info holds totals for the summary.
+    """
+    manifest = Manifest()
+    info = {
+        'names': 0,
+        'inodes': 0,
+        'hardlinks': 0,
+        'total_size': 0,
+        'allocated_size': 0,
+        'fiemap': False,
+        'reflinked_inodes': 0,
+        'shared_extents': 0,
+        'shared_bytes': 0,
+        'shared_within_target': 0,
+        'pruned_dirs': 0,
+        'excluded_files': 0,
+    }
+    if scan_filter is not None and not scan_filter.active:
+        scan_filter = None
+
+    for root, relpath, files in scan_directories(location, scan_filter, info):
+        parent = None
+        for entry in files:
+            try:
+                # Symlinks are recorded as themselves (size 0): only the name
+                # is unlinked, the target is never followed or overwritten
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+
+            if scan_filter is not None:
+                rel = f"{relpath}/{entry.name}" if relpath else entry.name
+                if not scan_filter.match(rel, entry.name, st):
+                    info['excluded_files'] += 1
+                    continue
+
+            if parent is None:
+                parent = manifest.add_directory(root)
+            info['names'] += 1
+            size = st.st_size if stat.S_ISREG(st.st_mode) else 0
+            if manifest.add(parent, entry.name, st, size, priority):
+                info['total_size'] += size
+                blocks = getattr(st, 'st_blocks', None)
+                info['allocated_size'] += size if blocks is None else min(size, blocks * 512)
+            else:
+                info['hardlinks'] += 1
+
+    info['inodes'] = len(manifest.primaries)
+
+    if detect_reflinks:
+        owners = {}
+        for index in manifest.primaries:
+            if manifest.size[index] == 0:
+                continue
+            extents = get_file_extents(manifest.path(index))
+            if extents is None:
+                continue
+            info['fiemap'] = True
+            shared = [e for e in extents if e[3] & FIEMAP_EXTENT_SHARED]
+            if not shared:
+                continue
+            info['reflinked_inodes'] += 1
+            info['shared_extents'] += len(shared)
+            info['shared_bytes'] += sum(e[2] for e in shared)
+            for logical, physical, length, flags in shared:
+                owners.setdefault((manifest.device[index], physical), set()).add(index)
+        info['shared_within_target'] = sum(1 for keys in owners.values() if len(keys) > 1)
+
+    return manifest, info
+
+def remove_empty_directories(location, scan_filter=None):
+    """Remove directories left empty below location, skipping pruned subtrees."""
+    directories = []
+    for root, dirs, _ in os.walk(location):
+        if scan_filter is not None:
+            rel = os.path.relpath(root, location).replace(os.sep, '/')
+            rel = '' if rel == '.' else rel
+            dirs[:] = [d for d in dirs if not scan_filter.prune(f"{rel}/{d}" if rel else d, d)]
+        directories.extend(os.path.join(root, d) for d in dirs)
+    for directory in reversed(directories):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            pass
+
+def remove_name(file_path, dir_fd=None):
+    """
+    Randomize and unlink an additional hardlink name of a wiped inode.
+
+    With dir_fd, the name is renamed and unlinked relative to that parent
+    directory descriptor, like the primary name in secure_delete_file.
+    """
+    try:
+        name = os.path.basename(file_path) if dir_fd is not None else file_path
+        os.remove(randomize_filename(name, dir_fd=dir_fd), dir_fd=dir_fd)
+        return True
+    except Exception as e:
+        logging.error(f"Unlink failed for {file_path}: {e}")
+        return False
+
 def is_ssd(file_path):
     """Detect if file is on SSD (for TRIM optimization)."""
     try:
@@ -147,7 +880,314 @@ def is_ssd(file_path):
     except:
         return False
 
-def secure_overwrite_file(file_path, passes=3):
+# Fallback throughput when a device has no calibrated profile. Deliberately
+# conservative: an estimate that runs long is safer than one that runs short.
+DEVICE_PROFILES = {
+    'ssd': {'write_mbps': 400.0, 'fsync_ms': 2.0, 'file_ms': 0.5},
+    'hdd': {'write_mbps': 120.0, 'fsync_ms': 12.0, 'file_ms': 8.0},
+}
+
+def device_kind(path):
+    """Return 'ssd' or 'hdd' for the block device holding path, None if unknown (Linux only)."""
+    try:
+        dev = os.stat(path).st_dev
+        base = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}"
+        for queue in (f"{base}/queue/rotational", f"{base}/../queue/rotational"):  # Disk, partition
+            if os.path.exists(queue):
+                with open(queue) as f:
+                    return 'hdd' if f.read().strip() == '1' else 'ssd'
+    except (OSError, AttributeError):
+        pass
+    return None
+
+def device_identity(path):
+    """
+    Identify the device holding path for the profile cache.
+
+    Returns:
+        (key, fingerprint) - key is 'major:minor'; the fingerprint combines
+        model, serial and size from sysfs so a swapped disk that reuses
+        the same device number is detected as a different device.
+    """
+    dev = os.stat(path).st_dev
+    key = f"{os.major(dev)}:{os.minor(dev)}" if hasattr(os, 'major') else str(dev)
+    parts = []
+    base = f"/sys/dev/block/{key}"
+    for name in ('device/model', 'device/serial', 'device/wwid', 'size',
+                 '../device/model', '../device/serial', '../device/wwid'):
+        try:
+            with open(os.path.join(base, name)) as f:
+                parts.append(f.read().strip())
+        except OSError:
+            continue
+    if not parts:
+        # No sysfs (other OS, tmpfs, overlay): fall back to the filesystem identity
+        st = os.statvfs(path) if hasattr(os, 'statvfs') else None
+        parts.append(f"{st.f_blocks}:{st.f_bsize}" if st else key)
+    return key, '|'.join(parts)
+
+def profile_cache_path():
+    """Location of the per-device calibration cache."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'rwipe', 'device_profiles.json')
+
+def load_profiles():
+    try:
+        with open(profile_cache_path()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_profiles(profiles):
+    path = profile_cache_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump(profiles, f, indent=2)
+    os.replace(tmp, path)
+
+def calibrated_profile(path):
+    """Cached calibration for the device holding path, or None if missing or stale."""
+    try:
+        key, fingerprint = device_identity(path)
+    except OSError:
+        return None
+    profile = load_profiles().get(key)
+    if profile is None:
+        return None
+    if profile.get('fingerprint') != fingerprint:
+        logging.warning(f"Device {key} changed since calibration; run '-m calibrate' again")
+        return None
+    return profile
+
+def device_profile(path):
+    """
+    Throughput profile used to estimate wipe time for the device holding path.
+
+    A calibrated profile from the cache is preferred; otherwise a default
+    for the device type is used.
+
+    Returns:
+        Dict with write_mbps, fsync_ms (latency per fsync), file_ms (per-file
+        metadata cost) and source ('calibrated', 'default-ssd', ...).
+    """
+    cached = calibrated_profile(path)
+    if cached is not None:
+        profile = {name: cached[name] for name in ('write_mbps', 'fsync_ms', 'file_ms')}
+        profile['source'] = 'calibrated'
+        return profile
+    kind = device_kind(path)
+    profile = dict(DEVICE_PROFILES[kind or 'hdd'])
+    profile['source'] = f"default-{kind or 'unknown'}"
+    return profile
+
+CALIBRATE_CHUNKS = (64 * 1024, 256 * 1024, 1024 * 1024, 4 * 1024 * 1024)
+CALIBRATE_WORKERS = (1, 2, 4, 8)
+CALIBRATE_QUEUE_DEPTHS = (1, 2, 4, 8)
+
+def probe_write(directory, total, chunk_size, workers=1, queue_depth=1):
+    """
+    Time one write probe: `workers` scratch files written concurrently,
+    each by `queue_depth` threads issuing pwrite() on disjoint ranges,
+    then fsync'ed. Scratch files are removed afterwards.
+
+    Returns:
+        Throughput in MB/s.
+    """
+    per_file = max(chunk_size, total // workers)
+    per_stream = -(-per_file // queue_depth)
+    data = os.urandom(chunk_size)
+    paths = [os.path.join(directory, f"probe-{i}") for i in range(workers)]
+    fds = [os.open(p, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600) for p in paths]
+
+    def stream(fd, start, end):
+        offset = start
+        while offset < end:
+            offset += os.pwrite(fd, data[:min(chunk_size, end - offset)], offset)
+
+    try:
+        threads = []
+        started = time.perf_counter()
+        for fd in fds:
+            for q in range(queue_depth):
+                start = q * per_stream
+                end = min(per_file, start + per_stream)
+                threads.append(threading.Thread(target=stream, args=(fd, start, end)))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for fd in fds:
+            os.fsync(fd)
+        elapsed = time.perf_counter() - started
+    finally:
+        for fd, p in zip(fds, paths):
+            os.close(fd)
+            os.remove(p)
+    return per_file * workers / elapsed / (1024 * 1024)
+
+def probe_latency(directory, rounds=20):
+    """
+    Measure per-fsync and per-file metadata latency.
+
+    Returns:
+        (fsync_ms, file_ms)
+    """
+    path = os.path.join(directory, 'probe-sync')
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        started = time.perf_counter()
+        for i in range(rounds):
+            os.pwrite(fd, b'\0' * 4096, i * 4096)
+            os.fsync(fd)
+        fsync_ms = (time.perf_counter() - started) * 1000 / rounds
+    finally:
+        os.close(fd)
+        os.remove(path)
+
+    started = time.perf_counter()
+    for i in range(rounds):
+        name = os.path.join(directory, f"probe-meta-{i}")
+        with open(name, 'wb') as f:
+            f.write(b'\0')
+        renamed = name + '-r'
+        os.rename(name, renamed)
+        os.remove(renamed)
+    file_ms = (time.perf_counter() - started) * 1000 / rounds
+    return fsync_ms, file_ms
+
+def calibrate_device(location, probe_size=32 * 1024 * 1024, progress=None):
+    """
+    Find the best chunk size, queue depth and worker count for the device
+    holding location with short write probes in a scratch directory, and
+    store the result in the per-device profile cache.
+
+    Each parameter is swept in turn with the best value found so far for
+    the others; a setting must beat the current best by 5% to be chosen,
+    so ties go to the cheaper setting.
+
+    Args:
+        location: Directory on the device to calibrate (scratch files go here)
+        probe_size: Bytes written per probe
+        progress: Optional callback(label, mbps) for each probe
+
+    Returns:
+        The stored profile dict.
+    """
+    import tempfile
+
+    key, fingerprint = device_identity(location)
+    if hasattr(os, 'statvfs'):
+        st = os.statvfs(location)
+        probe_size = max(MIN_CHUNK_SIZE * 8, min(probe_size, st.f_bavail * st.f_frsize // 4))
+
+    scratch = tempfile.mkdtemp(prefix='.rwipe-calibrate-', dir=location)
+    try:
+        best = {'chunk_size': DEFAULT_CHUNK_SIZE, 'queue_depth': 1, 'workers': 1}
+
+        def sweep(name, values):
+            best_mbps = None
+            for value in values:
+                trial = dict(best, **{name: value})
+                mbps = probe_write(scratch, probe_size, trial['chunk_size'],
+                                   trial['workers'], trial['queue_depth'])
+                if progress:
+                    progress(f"{name}={value}", mbps)
+                if best_mbps is None or mbps > best_mbps * 1.05:
+                    best_mbps = mbps
+                    best[name] = value
+            return best_mbps
+
+        sweep('chunk_size', CALIBRATE_CHUNKS)
+        sweep('queue_depth', CALIBRATE_QUEUE_DEPTHS)
+        write_mbps = sweep('workers', CALIBRATE_WORKERS)
+        fsync_ms, file_ms = probe_latency(scratch)
+    finally:
+        try:
+            for name in os.listdir(scratch):
+                os.remove(os.path.join(scratch, name))
+            os.rmdir(scratch)
+        except OSError as e:
+            logging.debug(f"Could not remove calibration scratch directory: {e}")
+
+    profile = dict(best, write_mbps=round(write_mbps, 1), fsync_ms=round(fsync_ms, 3),
+                   file_ms=round(file_ms, 3), fingerprint=fingerprint,
+                   kind=device_kind(location), probe_size=probe_size,
+                   calibrated_at=datetime.now().isoformat(timespec='seconds'))
+    profiles = load_profiles()
+    profiles[key] = profile
+    save_profiles(profiles)
+    return profile
+
+def get_data_extents(fd, file_size):
+    """
+    Enumerate the allocated ranges of a file using SEEK_DATA/SEEK_HOLE.
+
+    Holes in sparse files (VM images, preallocations) are skipped so the
+    overwrite does not turn them into allocated blocks. Falls back to the
+    whole file where the platform or filesystem does not support it.
+
+    Returns:
+        List of (offset, length) tuples covering the data regions.
+    """
+    if not hasattr(os, 'SEEK_DATA'):
+        return [(0, file_size)]
+
+    extents = []
+    offset = 0
+    try:
+        while offset < file_size:
+            try:
+                start = os.lseek(fd, offset, os.SEEK_DATA)
+            except OSError as e:
+                if e.errno == errno.ENXIO:  # No data after offset
+                    break
+                raise
+            if start >= file_size:
+                break
+            end = min(os.lseek(fd, start, os.SEEK_HOLE), file_size)
+            extents.append((start, end - start))
+            offset = end
+    except OSError:
+        return [(0, file_size)]
+    return extents
+
+def overwrite_patterns(passes):
+    """
+    Byte pattern of every overwrite pass; None stands for random data.
+
+    DoD 5220.22-M: zeros, ones, random - extended to 7 passes with
+    0x55, 0xAA and two more random passes. More than 7 passes are capped.
+    """
+    patterns = [
+        b'\x00',  # Pass 1: Zeros
+        b'\xFF',  # Pass 2: Ones
+        None,     # Pass 3: Random (special case)
+    ]
+    if passes >= 7:
+        patterns.extend([
+            b'\x55',  # Pass 4: 01010101
+            b'\xAA',  # Pass 5: 10101010
+            None,     # Pass 6: Random
+            None,     # Pass 7: Random
+        ])
+    return patterns[:passes]
+
+def align_extents(extents, block_size):
+    """Round (offset, length) extents out to block_size boundaries, merging overlaps."""
+    aligned = []
+    for offset, length in extents:
+        start = offset - offset % block_size
+        end = -(-(offset + length) // block_size) * block_size
+        if aligned and start <= aligned[-1][0] + aligned[-1][1]:
+            prev_start = aligned[-1][0]
+            aligned[-1] = (prev_start, max(end, prev_start + aligned[-1][1]) - prev_start)
+        else:
+            aligned.append((start, end - start))
+    return aligned
+
+def secure_overwrite_file(file_path, passes=3, stats=None, pool=None, throttle=None, offload=None,
+                          fd=None, align=False):
     """
     Securely overwrite file with multiple passes.
 
@@ -156,82 +1196,150 @@ def secure_overwrite_file(file_path, passes=3):
     - Pass 2: Write ones (0xFF)
     - Pass 3: Write random data
 
+    Only allocated extents are overwritten, so sparse files keep their holes.
+
     Args:
         file_path: Path to file
         passes: Number of overwrite passes (3, 7, or 35)
+        stats: Optional dict accumulating 'logical_bytes', 'allocated_bytes'
+               and 'bytes_written'
+        pool: Optional BufferPool to borrow the chunk buffer from
+        throttle: Optional IOThrottle shared with other workers
+        offload: Optional CryptoOffload generating random passes (needs a shared pool)
+        fd: Optional descriptor already open read/write on the file; the
+            path is then only used for log messages
+        align: Round every pass out to st_blksize so the slack after EOF in
+               the last block is overwritten too, and every write is aligned
     """
     try:
-        file_size = get_file_size(file_path)
+        file_size = os.fstat(fd).st_size if fd is not None else get_file_size(file_path)
         if file_size == 0:
             return True
 
-        # Patterns for DoD 5220.22-M
-        patterns = [
-            b'\x00',  # Pass 1: Zeros
-            b'\xFF',  # Pass 2: Ones
-            None,     # Pass 3: Random (special case)
-        ]
-
-        # Extended patterns for 7-pass
-        if passes >= 7:
-            patterns.extend([
-                b'\x55',  # Pass 4: 01010101
-                b'\xAA',  # Pass 5: 10101010
-                None,     # Pass 6: Random
-                None,     # Pass 7: Random
-            ])
-
-        with open(file_path, 'r+b') as f:
-            for pass_num in range(min(passes, len(patterns))):
-                pattern = patterns[pass_num]
-
-                # Write pattern
-                f.seek(0)
-                if pattern is None:
-                    # Random data
-                    chunk_size = 1024 * 1024  # 1MB chunks
-                    bytes_written = 0
-                    while bytes_written < file_size:
-                        chunk = min(chunk_size, file_size - bytes_written)
-                        f.write(secure_random_data(chunk))
-                        bytes_written += chunk
-                else:
-                    # Fixed pattern
-                    f.write(pattern * file_size)
+        patterns = overwrite_patterns(passes)
 
-                f.flush()
-                os.fsync(f.fileno())  # Force write to disk
+        if pool is None:
+            chunk_size = min(DEFAULT_CHUNK_SIZE, file_size)
+            if align:
+                # Page-aligned buffer of whole blocks, so every write stays aligned
+                block = (os.fstat(fd) if fd is not None else os.stat(file_path)).st_blksize or 4096
+                chunk_size = -(-chunk_size // block) * block
+            pool = BufferPool(chunk_size=chunk_size, aligned=align)
+        buf = pool.acquire()
+        try:
+            view = memoryview(buf)
+            chunk_size = len(buf)
+
+            with open(fd, 'r+b', closefd=False) if fd is not None else open(file_path, 'r+b') as f:
+                extents = get_data_extents(f.fileno(), file_size)
+                if align:
+                    extents = align_extents(extents, os.fstat(f.fileno()).st_blksize or 4096)
+                allocated = sum(length for _, length in extents)
+                pass_count = len(patterns)
+
+                for pattern in patterns:
+                    if pattern is None:
+                        keystream = None if offload else random_keystream()
+                    else:
+                        fill_pattern(view, pattern)
+
+                    # Write pattern over each data extent, leaving holes alone
+                    for offset, length in extents:
+                        f.seek(offset)
+                        bytes_written = 0
+                        while bytes_written < length:
+                            chunk = min(chunk_size, length - bytes_written)
+                            if pattern is None:
+                                # Random data
+                                if offload:
+                                    offload.fill_random(pool, buf, chunk)
+                                else:
+                                    keystream.encrypt(view[:chunk], output=view[:chunk])
+                            if throttle:
+                                throttle.consume(chunk)
+                            f.write(view[:chunk])
+                            bytes_written += chunk
+
+                    f.flush()
+                    if throttle:
+                        throttle.consume()
+                    os.fsync(f.fileno())  # Force write to disk
+        finally:
+            pool.release(buf)
+
+        if stats is not None:
+            stats['logical_bytes'] = stats.get('logical_bytes', 0) + file_size
+            stats['allocated_bytes'] = stats.get('allocated_bytes', 0) + allocated
+            stats['bytes_written'] = stats.get('bytes_written', 0) + allocated * pass_count
 
         return True
     except Exception as e:
         logging.error(f"Secure overwrite failed for {file_path}: {e}")
         return False
 
-def encrypt_data(data, key):
-    """Encrypt data with AES-256-CBC."""
-    # Pad to AES block size
-    block_size = AES.block_size
-    padded = data + b"\0" * (block_size - len(data) % block_size)
+def encrypt_file_extents(file_path, key, pool=None, throttle=None, offload=None, fd=None):
+    """
+    Encrypt the data extents of a file in place with AES-256-CBC.
 
-    iv = get_random_bytes(AES.block_size)
-    cipher = AES.new(key, AES.MODE_CBC, iv)
-    return iv + cipher.encrypt(padded)
+    Works chunk by chunk through a pooled buffer so memory stays bounded.
+    Ciphertext is cut to the original length instead of growing into holes
+    or past EOF (the key is discarded, so nothing is lost). With offload the cipher runs in
+    the CryptoOffload process pool; with fd the open descriptor is used.
+    """
+    from Crypto.Cipher import AES
+    from Crypto.Random import get_random_bytes
 
-def randomize_filename(file_path):
-    """Randomize filename before deletion (metadata wiping)."""
+    if pool is None:
+        pool = BufferPool(chunk_size=DEFAULT_CHUNK_SIZE)
+    buf = pool.acquire()
+    try:
+        view = memoryview(buf)
+        with open(fd, 'r+b', closefd=False) if fd is not None else open(file_path, 'r+b') as f:
+            iv = get_random_bytes(AES.block_size)
+            cipher = None if offload else AES.new(key, AES.MODE_CBC, iv)
+            for offset, length in get_data_extents(f.fileno(), os.fstat(f.fileno()).st_size):
+                done = 0
+                while done < length:
+                    f.seek(offset + done)
+                    n = f.readinto(view[:min(len(buf), length - done)])
+                    if not n:
+                        break
+                    padded = -(-n // AES.block_size) * AES.block_size
+                    view[n:padded] = bytes(padded - n)
+                    if offload:
+                        iv = offload.encrypt(pool, buf, padded, key, iv)
+                    else:
+                        cipher.encrypt(view[:padded], output=view[:padded])
+                    f.seek(offset + done)
+                    if throttle:
+                        throttle.consume(n)
+                    f.write(view[:n])
+                    done += n
+    finally:
+        pool.release(buf)
+
+def randomize_filename(file_path, dir_fd=None):
+    """
+    Randomize filename before deletion (metadata wiping).
+
+    With dir_fd, file_path is a bare name relative to that directory
+    descriptor and the returned new name is relative to it as well.
+    """
     try:
         directory = os.path.dirname(file_path)
         random_name = ''.join(random.choices(string.ascii_lowercase + string.digits, k=16))
         ext = os.path.splitext(file_path)[1]
         new_path = os.path.join(directory, random_name + ext)
 
-        os.rename(file_path, new_path)
+        os.rename(file_path, new_path, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
         return new_path
     except Exception as e:
         logging.debug(f"Filename randomization failed: {e}")
         return file_path
 
-def secure_delete_file(file_path, passes=3, encrypt=True, key=None):
+def secure_delete_file(file_path, passes=3, encrypt=True, key=None, stats=None, pool=None,
+                       throttle=None, offload=None, overwrite=True, dir_fd=None, align=False,
+                       fd=None):
     """
     TRUE SECURE DELETION - Multi-step process:
 
@@ -246,28 +1354,56 @@ def secure_delete_file(file_path, passes=3, encrypt=True, key=None):
         passes: Number of overwrite passes
         encrypt: Whether to encrypt after overwrite
         key: Encryption key (if encrypt=True)
+        stats: Optional dict for logical/allocated byte accounting
+        pool: Optional BufferPool shared with other workers
+        throttle: Optional IOThrottle shared with other workers
+        offload: Optional CryptoOffload for random data and encryption
+        overwrite: False when the caller already ran the overwrite passes
+        dir_fd: Optional descriptor of the parent directory; the file is then
+                opened, renamed and unlinked relative to it, so the path is
+                resolved once by the caller instead of at every step
+        align: Block-aligned passes covering file slack; the file is then
+               truncated to zero before it is unlinked
+        fd: Optional descriptor the caller already opened on the file (and
+            keeps ownership of)
+
+    The file is opened once, without following symlinks, and every pass
+    works on that descriptor. Symlinks and other non-regular entries are
+    not opened; only their name is randomized and unlinked.
     """
     try:
-        # Step 1: Multi-pass secure overwrite
-        if not secure_overwrite_file(file_path, passes):
-            return False
-
-        # Step 2: Optional encryption layer (defense in depth)
-        if encrypt and key:
+        name = os.path.basename(file_path) if dir_fd is not None else file_path
+        owned = fd is None
+        if owned:
+            fd = open_regular(name, dir_fd=dir_fd)
+        if fd is not None:
             try:
-                with open(file_path, 'rb') as f:
-                    data = f.read()
-                encrypted = encrypt_data(data, key)
-                with open(file_path, 'wb') as f:
-                    f.write(encrypted)
-            except Exception as e:
-                logging.warning(f"Encryption layer failed: {e}")
+                # Step 1: Multi-pass secure overwrite
+                if overwrite and not secure_overwrite_file(file_path, passes, stats=stats, pool=pool,
+                                                           throttle=throttle, offload=offload, fd=fd,
+                                                           align=align):
+                    return False
+
+                # Step 2: Optional encryption layer (defense in depth)
+                if encrypt and key:
+                    try:
+                        encrypt_file_extents(file_path, key, pool=pool, throttle=throttle,
+                                             offload=offload, fd=fd)
+                    except Exception as e:
+                        logging.warning(f"Encryption layer failed: {e}")
+
+                if align:
+                    # Release the blocks before the name goes, so no stale size lingers
+                    os.ftruncate(fd, 0)
+            finally:
+                if owned:
+                    os.close(fd)
 
         # Step 3: Randomize filename (metadata wiping)
-        file_path = randomize_filename(file_path)
+        name = randomize_filename(name, dir_fd=dir_fd)
 
         # Step 4: Delete file
-        os.remove(file_path)
+        os.remove(name, dir_fd=dir_fd)
 
         # Step 5: Platform-specific cleanup
         if CURRENT_OS == 'Windows':
@@ -292,8 +1428,39 @@ def secure_delete_file(file_path, passes=3, encrypt=True, key=None):
         logging.error(f"Secure deletion failed for {file_path}: {e}")
         return False
 
+def open_regular(name, dir_fd=None):
+    """
+    Open a regular file for overwriting without following a symlink.
+
+    The entry is checked with lstat() before it is opened, so device nodes
+    and FIFOs are never opened, and the descriptor is checked against that
+    lstat() afterwards in case the name was swapped in between.
+
+    Returns:
+        The descriptor, or None if name is a symlink or other non-regular
+        entry (nothing to overwrite: only the name is removed).
+    """
+    before = os.lstat(name, dir_fd=dir_fd)
+    if not stat.S_ISREG(before.st_mode):
+        return None
+    flags = os.O_RDWR | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_NOFOLLOW', 0) | getattr(os, 'O_NONBLOCK', 0)
+    try:
+        fd = os.open(name, flags, dir_fd=dir_fd)
+    except OSError as e:
+        if e.errno in (errno.ELOOP, errno.EMLINK):
+            return None  # O_NOFOLLOW on a symlink (EMLINK on FreeBSD)
+        raise
+    after = os.fstat(fd)
+    if (after.st_dev, after.st_ino) != (before.st_dev, before.st_ino):
+        os.close(fd)
+        return None
+    return fd
+
 def create_key(password):
     """Derive encryption key from password using PBKDF2."""
+    from Crypto.Protocol.KDF import PBKDF2
+    from Crypto.Random import get_random_bytes
+
     salt = get_random_bytes(16)
     key = PBKDF2(password, salt, dkLen=32, count=1000000)
     return key, salt
@@ -305,28 +1472,825 @@ def count_files(location):
         total += len(files)
     return total
 
-def destroy_directory(location, password, confirm=True, passes=3, method='secure'):
+class WipePlan:
+    """Manifest of one target, its method/passes/priority, and scan totals."""
+
+    def __init__(self, location, manifest, info, method='secure', passes=3, priority=0):
+        self.location = location
+        self.manifest = manifest
+        self.info = info
+        self.method = method
+        self.passes = passes
+        self.priority = priority
+
+    @property
+    def total_files(self):
+        return self.info['names']
+
+    @property
+    def total_size(self):
+        return self.info['total_size']
+
+
+class WipeResult:
+    """Structured outcome of a WipeEngine run."""
+
+    def __init__(self, location, method, passes):
+        self.location = location
+        self.method = method
+        self.passes = passes
+        self.destroyed = 0
+        self.failed = 0
+        self.failures = []
+        self.bytes_destroyed = 0
+        self.logical_bytes = 0
+        self.allocated_bytes = 0
+        self.bytes_written = 0
+        self.inodes = 0
+        self.hardlinks = 0
+        self.reflinked_inodes = 0
+        self.shared_extents = 0
+        self.shared_bytes = 0
+        self.shared_within_target = 0
+        self.pruned_dirs = 0
+        self.excluded_files = 0
+        self.pool_peak_bytes = 0
+        self.pool_peak_buffers = 0
+        self.pool_buffer_size = 0
+        self.pool_waits = 0
+        self.throttle_seconds = 0.0
+        self.peak_utilization = None
+        self.cancelled = False
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def elapsed(self):
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return (self.finished_at - self.started_at).total_seconds()
+
+    @classmethod
+    def combine(cls, results):
+        """Aggregate per-target results into one overall WipeResult."""
+        methods = {r.method for r in results}
+        passes = {r.passes for r in results}
+        total = cls([r.location for r in results],
+                    methods.pop() if len(methods) == 1 else 'mixed',
+                    passes.pop() if len(passes) == 1 else 'mixed')
+        for r in results:
+            for name, value in r.__dict__.items():
+                if name in ('passes', 'peak_utilization') or name.startswith('pool_') \
+                        or name == 'throttle_seconds':
+                    continue
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    setattr(total, name, getattr(total, name) + value)
+            total.failures.extend(r.failures)
+            total.cancelled = total.cancelled or r.cancelled
+        if results:
+            # Pool and throttle are shared, so every result carries the same totals
+            first = results[0]
+            for name in ('pool_peak_bytes', 'pool_peak_buffers', 'pool_buffer_size', 'pool_waits',
+                         'throttle_seconds', 'peak_utilization'):
+                setattr(total, name, getattr(first, name))
+            total.started_at = min(r.started_at for r in results if r.started_at)
+            total.finished_at = max(r.finished_at for r in results if r.finished_at)
+        return total
+
+    def to_dict(self):
+        """Plain-dict view for JSON serialisation."""
+        data = dict(self.__dict__)
+        data['started_at'] = self.started_at.isoformat() if self.started_at else None
+        data['finished_at'] = self.finished_at.isoformat() if self.finished_at else None
+        data['elapsed'] = self.elapsed
+        return data
+
+
+# dir_fd-relative open/rename/unlink (POSIX); elsewhere files are handled by path
+DIR_FD_SUPPORTED = all(f in os.supports_dir_fd for f in (os.open, os.rename, os.unlink))
+
+class DirFDCache:
+    """
+    Open descriptors of the parent directories being wiped, shared by all
+    workers.
+
+    Files are opened, renamed and unlinked relative to their parent's
+    descriptor, so a deep directory path is resolved once per directory
+    instead of several times per file. Descriptors are reference counted
+    and the least recently used idle ones are closed beyond capacity.
     """
-    Destroy all files in directory.
+
+    def __init__(self, capacity=256):
+        from collections import OrderedDict
+        self.capacity = capacity
+        self._fds = OrderedDict()  # key -> [fd, refs]
+        self._lock = threading.Lock()
+
+    def acquire(self, key, path):
+        """Return an open descriptor for directory path, opening it if needed."""
+        with self._lock:
+            entry = self._fds.get(key)
+            if entry is None:
+                fd = os.open(path, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+                entry = self._fds[key] = [fd, 0]
+                self._evict()
+            else:
+                self._fds.move_to_end(key)
+            entry[1] += 1
+            return entry[0]
+
+    def release(self, key):
+        with self._lock:
+            self._fds[key][1] -= 1
+            self._evict()
+
+    def _evict(self):
+        if len(self._fds) <= self.capacity:
+            return
+        for key, (fd, refs) in list(self._fds.items()):
+            if refs == 0:
+                os.close(fd)
+                del self._fds[key]
+                if len(self._fds) <= self.capacity:
+                    break
+
+    def close(self):
+        with self._lock:
+            for fd, _ in self._fds.values():
+                os.close(fd)
+            self._fds.clear()
+
+class RangeWipe:
+    """
+    Overwrite of one large file split into ranges that run on the engine's
+    shared worker pool.
+
+    The work is a sequence of batches: the ranges of one pass (split into
+    up to range_streams contiguous streams written concurrently with
+    os.pwrite, as calibrate_device() probes queue depth), then an fsync
+    barrier, then the next
+    pass, and finally encryption/rename/unlink. A batch is only issued
+    once the previous one has completed, so pass ordering on disk is the
+    same as with a single writer.
+    """
+
+    def __init__(self, engine, plan, index, paths, key):
+        self.engine = engine
+        self.plan = plan
+        self.index = index
+        self.paths = paths
+        self.key = key
+        self.ok = True
+        self.stats = {}
+        self.outstanding = 0
+        self._steps = self._run()
+
+    def next_batch(self):
+        """Callables for the next step (never empty), or None when the file is done."""
+        if not self.ok:
+            self._steps.close()
+            return None
+        try:
+            batch = next(self._steps)
+            while not batch:
+                # A file with no data extents has no ranges to write; an
+                # empty batch would never complete and the file never be deleted
+                batch = next(self._steps)
+            return batch
+        except StopIteration:
+            return None
+        except OSError as e:
+            logging.error(f"Secure overwrite failed for {self.paths[0]}: {e}")
+            self.ok = False
+            return None
+
+    def _run(self):
+        engine = self.engine
+        size = self.plan.manifest.size[self.index]
+        # One open for the whole file, relative to the cached parent directory;
+        # the same descriptor is handed to the final encrypt/unlink step
+        dir_key, dir_fd = engine._acquire_parent(self.plan, self.index)
+        try:
+            name = os.path.basename(self.paths[0]) if dir_fd is not None else self.paths[0]
+            fd = open_regular(name, dir_fd=dir_fd)
+            if fd is None:
+                raise OSError(errno.EINVAL, "Not a regular file", self.paths[0])
+            try:
+                extents = get_data_extents(fd, size)
+                if engine.cover_slack:
+                    extents = align_extents(extents, os.fstat(fd).st_blksize or 4096)
+                ranges = [(offset + start, min(engine.range_size, length - start))
+                          for offset, length in extents
+                          for start in range(0, length, engine.range_size)]
+                streams = min(engine.range_streams, len(ranges)) or 1
+                per_stream = max(1, -(-len(ranges) // streams))
+                groups = [ranges[i:i + per_stream] for i in range(0, len(ranges), per_stream)]
+                patterns = overwrite_patterns(self.plan.passes)
+                for pattern in patterns:
+                    yield [lambda g=group, p=pattern: self._write_ranges(fd, g, p) for group in groups]
+                    yield [lambda: self._sync(fd)]
+
+                allocated = sum(length for _, length in extents)
+                self.stats.update(logical_bytes=size, allocated_bytes=allocated,
+                                  bytes_written=allocated * len(patterns))
+                yield [lambda: self._finish(fd)]
+            finally:
+                os.close(fd)
+        finally:
+            if dir_key is not None:
+                engine.dir_fds.release(dir_key)
+
+    def _write_ranges(self, fd, ranges, pattern):
+        ok = True
+        for offset, length in ranges:
+            ok = self._write_range(fd, offset, length, pattern) and ok
+        return ok
+
+    def _write_range(self, fd, offset, length, pattern):
+        engine = self.engine
+        pool, throttle, offload = engine.pool, engine.throttle, engine.offload
+        buf = pool.acquire()
+        try:
+            view = memoryview(buf)
+            chunk_size = len(buf)
+            if pattern is None:
+                keystream = None if offload else random_keystream()
+            else:
+                fill_pattern(view, pattern)
+            done = 0
+            while done < length:
+                chunk = min(chunk_size, length - done)
+                if pattern is None:
+                    if offload:
+                        offload.fill_random(pool, buf, chunk)
+                    else:
+                        keystream.encrypt(view[:chunk], output=view[:chunk])
+                if throttle:
+                    throttle.consume(chunk)
+                done += os.pwrite(fd, view[:chunk], offset + done)
+            return True
+        except OSError as e:
+            logging.error(f"Range overwrite failed for {self.paths[0]} at {offset}: {e}")
+            return False
+        finally:
+            pool.release(buf)
+
+    def _sync(self, fd):
+        if self.engine.throttle:
+            self.engine.throttle.consume()
+        try:
+            os.fsync(fd)
+            return True
+        except OSError as e:
+            logging.error(f"fsync failed for {self.paths[0]}: {e}")
+            return False
+
+    def _finish(self, fd):
+        ok, stats = self.engine._wipe_entry(self.plan, self.index, self.paths, self.key,
+                                            overwrite=False, fd=fd)
+        self.stats.update(stats)
+        return ok
+
+class WipeEngine:
+    """
+    Importable wipe engine: plan() targets, execute() them, get WipeResults.
+
+    The engine never prints or prompts. Per-file outcomes are delivered to
+    the optional progress callback as progress(path, size, ok, result), always on
+    the thread that called execute(). The key is derived once per engine,
+    so a long-lived process can run many jobs without repeating the KDF.
+
+    Several plans (each with its own method, passes and priority) can run
+    through one worker pool with execute_all(): files from every target are
+    interleaved by priority, so there is no idle gap at target boundaries.
+    Files of split_threshold bytes or more are overwritten as range_size
+    ranges on the same pool by up to range_streams concurrent writers per
+    file (default: workers; see RangeWipe).
+
+    Example:
+        engine = WipeEngine(password='...', method='wipe', workers=4)
+        result = engine.execute(engine.plan('/srv/old_tenant'))
+    """
+
+    def __init__(self, password=None, key=None, passes=3, method='secure', workers=1,
+                 memory_budget=None, throttle=None, progress=None, scan_filter=None,
+                 chunk_size=DEFAULT_CHUNK_SIZE, offload_processes=0,
+                 split_threshold=DEFAULT_SPLIT_THRESHOLD, range_size=DEFAULT_RANGE_SIZE,
+                 cover_slack=False, range_streams=None):
+        if method not in WIPE_METHODS:
+            raise ValueError(f"Invalid method: {method}")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.password = password
+        self.key = key
+        self.passes = passes
+        self.method = method
+        self.workers = workers
+        self.memory_budget = memory_budget
+        self.throttle = throttle
+        self.progress = progress
+        self.scan_filter = scan_filter
+        self.split_threshold = split_threshold
+        self.range_size = max(range_size, chunk_size)
+        self.range_streams = max(1, range_streams or workers)
+        self.cover_slack = cover_slack
+        self.pool = BufferPool(memory_budget, workers=workers, chunk_size=chunk_size,
+                               shared=offload_processes > 0, aligned=cover_slack)
+        self.offload = CryptoOffload(offload_processes) if offload_processes > 0 else None
+        self.dir_fds = DirFDCache() if DIR_FD_SUPPORTED else None
+        self._cancel = threading.Event()
+
+    def get_key(self, method=None):
+        """Derive (once) and return the encryption key, if the method needs one."""
+        method = method or self.method
+        if self.key is None and method in ('secure', 'encrypt'):
+            if not self.password:
+                raise ValueError(f"A password or key is required for the '{method}' method")
+            self.key, _ = create_key(self.password)
+        return self.key
+
+    def plan(self, location, manifest_path=None, method=None, passes=None, priority=0):
+        """
+        Scan a directory into a WipePlan without modifying anything.
+
+        method/passes default to the engine's; priority orders targets in
+        execute_all() (higher first). With manifest_path the manifest is
+        written to that file and re-opened memory-mapped, freeing the heap
+        copy for the wipe phase.
+        """
+        method = method or self.method
+        if method not in WIPE_METHODS:
+            raise ValueError(f"Invalid method: {method}")
+        if not PRIORITY_RANGE[0] <= priority <= PRIORITY_RANGE[1]:
+            raise ValueError(f"Invalid priority: {priority} (must be {PRIORITY_RANGE[0]} to {PRIORITY_RANGE[1]})")
+        manifest, info = build_manifest(location, scan_filter=self.scan_filter, priority=priority)
+        if manifest_path:
+            manifest.save(manifest_path)
+            manifest = Manifest.load(manifest_path)
+        return WipePlan(location, manifest, info, method, passes or self.passes, priority)
+
+    def estimate(self, plan):
+        """
+        Estimate the I/O and wall time of a plan without touching any file.
+
+        Bytes to write follow the allocated (sparse-aware) size of each
+        inode times the effective passes; syscall counts mirror what
+        secure_delete_file() issues per file. Wall time comes from the
+        device profile, capped by the throttle if one is set.
+
+        Returns:
+            Dict with bytes_written, syscalls (per call), seconds and profile.
+        """
+        manifest = plan.manifest
+        chunk = self.pool.buffer_size
+        ratio = plan.info['allocated_size'] / plan.total_size if plan.total_size else 0
+        passes = min(plan.passes, 7)  # secure_overwrite_file() has 7 patterns at most
+        files = len(plan.manifest.primaries)
+        extra_names = plan.info['hardlinks']
+
+        chunks = 0
+        for index in manifest.primaries:
+            chunks += -(-int(manifest.size[index] * ratio) // chunk)
+        allocated = plan.info['allocated_size']
+
+        calls = {'open': files, 'stat': files, 'read': 0, 'write': 0, 'lseek': 0,
+                 'fsync': 0, 'sync': 0, 'rename': 0, 'unlink': 0}
+        written = 0
+        if plan.method in ('secure', 'wipe'):
+            calls['lseek'] += 2 * files + passes * files  # SEEK_DATA/SEEK_HOLE, then once per pass
+            calls['write'] += passes * chunks
+            calls['fsync'] += passes * files
+            written += passes * allocated
+            if plan.method == 'secure':
+                calls['read'] += chunks
+                calls['write'] += chunks
+                calls['lseek'] += 2 * chunks + 2 * files
+                written += allocated
+            calls['rename'] += files
+            calls['unlink'] += files + extra_names
+            if CURRENT_OS == 'Linux':
+                calls['sync'] += files
+        else:
+            calls['read'] += chunks
+            calls['write'] += chunks
+            calls['lseek'] += 2 * chunks + 2 * files
+            written += allocated
+
+        profile = device_profile(plan.location)
+        mbps = profile['write_mbps']
+        if self.throttle and self.throttle.byte_rate:
+            mbps = min(mbps, self.throttle.byte_rate / (1024 * 1024))
+        seconds = written / (mbps * 1024 * 1024)
+        # fsync and metadata latency overlaps across workers; bandwidth does not
+        seconds += (calls['fsync'] * profile['fsync_ms'] + files * profile['file_ms']) / 1000 / self.workers
+        if self.throttle and self.throttle.op_rate:
+            seconds = max(seconds, (calls['write'] + calls['fsync']) / self.throttle.op_rate)
+
+        return {'bytes_written': written, 'syscalls': calls, 'seconds': seconds, 'profile': profile}
+
+    def cancel(self):
+        """
+        Stop scheduling new files; files already in flight complete.
+
+        A cancel issued before or while execute_all() plans and derives its
+        key applies to that run; the request is consumed when a run ends.
+        """
+        self._cancel.set()
+
+    def close(self):
+        """Stop the offload processes and free shared buffers (offload only)."""
+        if self.offload is not None:
+            self.offload.close()
+            self.offload = None
+            self.pool.close()
+
+    def _acquire_parent(self, plan, index):
+        """Cached descriptor of an inode's parent directory: (key to release, fd), or (None, None)."""
+        if self.dir_fds is None:
+            return None, None
+        parent = plan.manifest.parent[index]
+        key = (id(plan.manifest), parent)
+        try:
+            return key, self.dir_fds.acquire(key, plan.manifest.directory(parent))
+        except OSError as e:
+            logging.debug(f"Falling back to path-based deletion for {plan.manifest.path(index)}: {e}")
+            return None, None
+
+    def _wipe_entry(self, plan, index, paths, key, overwrite=True, fd=None):
+        """Wipe one inode on a worker thread; returns (ok, stats)."""
+        fname = paths[0]
+        file_stats = {}
+
+        if plan.method in ('secure', 'wipe'):
+            # Work relative to the cached parent directory descriptor
+            dir_key, dir_fd = self._acquire_parent(plan, index)
+            try:
+                # 'secure' adds the encryption layer, 'wipe' is overwrite + delete
+                ok = secure_delete_file(fname, passes=plan.passes, encrypt=(plan.method == 'secure'),
+                                        key=key, stats=file_stats, pool=self.pool,
+                                        throttle=self.throttle, offload=self.offload,
+                                        overwrite=overwrite, dir_fd=dir_fd, align=self.cover_slack,
+                                        fd=fd)
+            finally:
+                if dir_key is not None:
+                    self.dir_fds.release(dir_key)
+            if ok:
+                for link in plan.manifest.links(index)[1:]:
+                    if not self._remove_link(plan, link):
+                        file_stats['unlink_failed'] = file_stats.get('unlink_failed', 0) + 1
+            return ok, file_stats
+
+        # Encryption-only mode: in place, chunk by chunk through the pool
+        try:
+            fd = open_regular(fname)
+            if fd is None:
+                return True, file_stats  # Symlink or special file: nothing to encrypt
+            try:
+                encrypt_file_extents(fname, key, pool=self.pool, throttle=self.throttle,
+                                     offload=self.offload, fd=fd)
+            finally:
+                os.close(fd)
+            return True, file_stats
+        except Exception as e:
+            logging.debug(f"Encryption failed for {fname}: {e}")
+            return False, file_stats
+
+    def _remove_link(self, plan, index):
+        """Unlink one extra name of an inode relative to its own cached parent descriptor."""
+        dir_key, dir_fd = self._acquire_parent(plan, index)
+        try:
+            return remove_name(plan.manifest.path(index), dir_fd=dir_fd)
+        finally:
+            if dir_key is not None:
+                self.dir_fds.release(dir_key)
+
+    def _unlink_names(self, plan, index):
+        """Unlink names of an inode another target overwrites; returns (ok, stats)."""
+        failed = sum(not self._remove_link(plan, link) for link in plan.manifest.links(index))
+        return True, {'names_only': True, 'unlink_failed': failed}
+
+    def _record(self, plan, result, index, paths, ok, file_stats):
+        manifest = plan.manifest
+        names = len(paths)
+        manifest.state[index] = STATE_DONE if ok else STATE_FAILED
+        if ok:
+            unlinked = names - file_stats.get('unlink_failed', 0)
+            result.destroyed += unlinked
+            result.failed += names - unlinked
+            if plan.method != 'encrypt' and not file_stats.get('names_only'):
+                result.bytes_destroyed += manifest.size[index]
+            result.logical_bytes += file_stats.get('logical_bytes', 0)
+            result.allocated_bytes += file_stats.get('allocated_bytes', 0)
+            result.bytes_written += file_stats.get('bytes_written', 0)
+        else:
+            result.failed += names
+            result.failures.append(paths[0])
+        if self.progress:
+            self.progress(paths[0], manifest.size[index], ok, result)
+
+    @staticmethod
+    def _schedule(plans):
+        """
+        Yield (plan, index) for every pending inode across all plans.
+
+        Targets run in descending priority; targets with equal priority are
+        interleaved round-robin so they share the workers evenly.
+        """
+        for priority in sorted({plan.priority for plan in plans}, reverse=True):
+            cursors = [(plan, iter(plan.manifest.primaries)) for plan in plans if plan.priority == priority]
+            while cursors:
+                for cursor in list(cursors):
+                    plan, it = cursor
+                    index = next(it, None)
+                    if index is None:
+                        cursors.remove(cursor)
+                    elif plan.manifest.state[index] == STATE_PENDING:
+                        yield plan, index
+
+    def execute(self, plan):
+        """Wipe every inode in the plan and return a WipeResult."""
+        return self.execute_all([plan])[0]
+
+    def execute_all(self, plans):
+        """
+        Wipe several plans through one shared worker pool; returns a WipeResult per plan.
+
+        Targets must not repeat or contain one another (ValueError). An
+        inode hardlinked into several targets is overwritten once; its
+        names in the other targets are only unlinked.
+        """
+        overlap = overlapping_targets([plan.location for plan in plans])
+        if overlap:
+            raise ValueError(f"Targets overlap: {overlap[0]} and {overlap[1]}")
+        results = {}
+        for plan in plans:
+            result = results[id(plan)] = WipeResult(plan.location, plan.method, plan.passes)
+            for name in ('inodes', 'hardlinks', 'reflinked_inodes', 'shared_extents',
+                         'shared_bytes', 'shared_within_target', 'pruned_dirs', 'excluded_files'):
+                setattr(result, name, plan.info[name])
+            result.started_at = datetime.now()
+        try:
+            return self._execute_all(plans, results)
+        finally:
+            self._cancel.clear()
+
+    def _execute_all(self, plans, results):
+        keys = {plan.method: self.get_key(plan.method) for plan in plans}
+        cancelled = False
+        claimed = set()  # (device, inode) already being overwritten, across targets
+
+        # Keep a bounded number of files in flight so huge trees do not
+        # queue millions of futures at once; paths are only materialised
+        # for the files in flight. Large files are RangeWipe jobs whose
+        # next batch is submitted when the current one completes.
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = {}
+
+            def submit_batch(job):
+                batch = job.next_batch()
+                if batch is None:
+                    self._record(job.plan, results[id(job.plan)], job.index, job.paths, job.ok, job.stats)
+                    return
+                job.outstanding = len(batch)
+                for step in batch:
+                    pending[executor.submit(step)] = job
+
+            def collect(futures):
+                for future in futures:
+                    entry = pending.pop(future)
+                    if isinstance(entry, RangeWipe):
+                        entry.ok = future.result() and entry.ok
+                        entry.outstanding -= 1
+                        if entry.outstanding == 0:
+                            submit_batch(entry)
+                    else:
+                        plan, index, paths = entry
+                        self._record(plan, results[id(plan)], index, paths, *future.result())
+
+            for plan, index in self._schedule(plans):
+                if self._cancel.is_set():
+                    cancelled = True
+                    break
+                if len(pending) >= self.workers * 4:
+                    collect(wait(pending, return_when=FIRST_COMPLETED).done)
+                manifest = plan.manifest
+                paths = [manifest.path(i) for i in manifest.links(index)]
+                if len(plans) > 1:
+                    inode = manifest.key(index)
+                    if inode in claimed:
+                        if plan.method in ('secure', 'wipe'):
+                            future = executor.submit(self._unlink_names, plan, index)
+                            pending[future] = (plan, index, paths)
+                        else:
+                            manifest.state[index] = STATE_DONE
+                        continue
+                    if plan.method in ('secure', 'wipe'):
+                        claimed.add(inode)
+                if (self.workers > 1 and plan.method in ('secure', 'wipe')
+                        and manifest.size[index] >= self.split_threshold):
+                    submit_batch(RangeWipe(self, plan, index, paths, keys[plan.method]))
+                    continue
+                future = executor.submit(self._wipe_entry, plan, index, paths, keys[plan.method])
+                pending[future] = (plan, index, paths)
+            while pending:
+                collect(wait(pending, return_when=FIRST_COMPLETED).done)
+        if self.dir_fds is not None:
+            self.dir_fds.close()
+
+        finished_at = datetime.now()
+        for plan in plans:
+            result = results[id(plan)]
+            result.cancelled = cancelled
+            if plan.method != 'encrypt' and not cancelled:
+                remove_empty_directories(plan.location, self.scan_filter)
+            result.pool_peak_bytes = self.pool.peak_bytes
+            result.pool_peak_buffers = self.pool.peak
+            result.pool_buffer_size = self.pool.buffer_size
+            result.pool_waits = self.pool.waits
+            if self.throttle:
+                result.throttle_seconds = self.throttle.throttled_seconds
+                if self.throttle.adaptive:
+                    result.peak_utilization = self.throttle.peak_utilization
+            result.finished_at = finished_at
+        return [results[id(plan)] for plan in plans]
+
+
+def load_job_file(path, method='secure', passes=3):
+    """
+    Load targets from a JSON job file.
+
+    Format - a list of targets (or {"targets": [...]}), each a path string
+    or an object with "path" and optional "method", "passes", "priority":
+
+        [{"path": "/srv/a", "method": "wipe", "passes": 7, "priority": 10},
+         "/srv/b"]
+
+    Returns:
+        List of target dicts with path, method, passes and priority.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get('targets', [])
+    if not isinstance(data, list):
+        raise ValueError("Job file must contain a list of targets")
+
+    targets = []
+    for item in data:
+        if isinstance(item, str):
+            item = {'path': item}
+        if not isinstance(item, dict) or not item.get('path'):
+            raise ValueError(f"Invalid job file target: {item!r}")
+        target = {
+            'path': item['path'],
+            'method': item.get('method', method),
+            'passes': int(item.get('passes', passes)),
+            'priority': int(item.get('priority', 0)),
+        }
+        if target['method'] not in WIPE_METHODS:
+            raise ValueError(f"Invalid method for {target['path']}: {target['method']}")
+        if target['passes'] not in WIPE_PASSES:
+            raise ValueError(f"Invalid passes for {target['path']}: {target['passes']}")
+        if not PRIORITY_RANGE[0] <= target['priority'] <= PRIORITY_RANGE[1]:
+            raise ValueError(f"Invalid priority for {target['path']}: {target['priority']} "
+                             f"(must be {PRIORITY_RANGE[0]} to {PRIORITY_RANGE[1]})")
+        targets.append(target)
+    return targets
+
+
+def as_targets(location):
+    """Normalise a path, or a list of paths / target dicts, into target dicts."""
+    if isinstance(location, (str, os.PathLike)):
+        location = [location]
+    return [t if isinstance(t, dict) else {'path': t} for t in location]
+
+def overlapping_targets(paths):
+    """
+    Find targets that repeat or contain one another.
+
+    Returns:
+        (outer, inner) for the first such pair, or None.
+    """
+    roots = [(os.path.realpath(p), p) for p in paths]
+    for i, (a, path_a) in enumerate(roots):
+        for b, path_b in roots[i + 1:]:
+            if a == b or b.startswith(a.rstrip(os.sep) + os.sep):
+                return path_a, path_b
+            if a.startswith(b.rstrip(os.sep) + os.sep):
+                return path_b, path_a
+    return None
+
+def destroy_directory(location, password, confirm=True, passes=3, method='secure',
+                      workers=1, memory_budget=None, throttle=None, manifest_path=None,
+                      scan_filter=None, dry_run=False, chunk_size=DEFAULT_CHUNK_SIZE,
+                      offload_processes=0, split_threshold=DEFAULT_SPLIT_THRESHOLD,
+                      range_size=DEFAULT_RANGE_SIZE, cover_slack=False, range_streams=None):
+    """
+    Destroy all files in one or more directories.
 
     Methods:
     - 'secure': Multi-pass overwrite + encrypt + delete (RECOMMENDED)
     - 'encrypt': Encrypt only (faster, less secure)
     - 'wipe': Multi-pass overwrite + delete (no encryption)
+
+    Interactive front end for WipeEngine: shows the confirmation banner,
+    prints each file as it completes and a summary at the end. `location`
+    is a path, or a list of paths / target dicts (path, method, passes,
+    priority) that all run through one worker pool. With manifest_path
+    the scan is kept in memory-mapped files that are wiped themselves once
+    the run is over. With dry_run only the plan and its I/O and time
+    estimates are shown; nothing is modified.
     """
-    if confirm:
-        total_files = count_files(location)
-        total_size = sum(get_file_size(os.path.join(root, f))
-                        for root, _, files in os.walk(location)
-                        for f in files) / (1024*1024)  # MB
+    targets = as_targets(location)
+    overlap = overlapping_targets([t['path'] for t in targets])
+    if overlap:
+        raise ValueError(f"Targets overlap: {overlap[0]} and {overlap[1]}")
+
+    def show_progress(path, size, ok, result):
+        if not ok:
+            print(f"{Colors.FAIL}✗ FAILED{Colors.ENDC} {path}")
+        elif result.method == 'secure':
+            print(f"{Colors.OKGREEN}✓ DESTROYED{Colors.ENDC} {path} ({size/1024:.1f} KB)")
+        elif result.method == 'wipe':
+            print(f"{Colors.OKGREEN}✓ WIPED{Colors.ENDC} {path}")
+        else:
+            print(f"{Colors.WARNING}✓ ENCRYPTED{Colors.ENDC} {path}")
+
+    engine = WipeEngine(password=password, passes=passes, method=method, workers=workers,
+                        memory_budget=memory_budget, throttle=throttle, progress=show_progress,
+                        scan_filter=scan_filter, chunk_size=chunk_size,
+                        offload_processes=0 if dry_run else offload_processes,
+                        split_threshold=split_threshold, range_size=range_size,
+                        cover_slack=cover_slack, range_streams=range_streams)
+    manifest_paths = []
+    plans = []
+    for i, target in enumerate(targets):
+        target_manifest = None
+        if manifest_path:
+            target_manifest = manifest_path if len(targets) == 1 else f"{manifest_path}.{i}"
+            manifest_paths.append(target_manifest)
+        plans.append(engine.plan(target['path'], manifest_path=target_manifest,
+                                 method=target.get('method'), passes=target.get('passes'),
+                                 priority=target.get('priority', 0)))
+
+    def remove_manifests():
+        # The manifests list every destroyed file name
+        for path in manifest_paths:
+            secure_delete_file(path, passes=passes, encrypt=False)
+
+    if confirm or dry_run:
+        total_files = sum(plan.total_files for plan in plans)
+        total_size = sum(plan.total_size for plan in plans) / (1024*1024)  # MB
+        info = {name: sum(plan.info[name] for plan in plans)
+                for name in ('pruned_dirs', 'excluded_files', 'hardlinks', 'inodes',
+                             'reflinked_inodes', 'shared_bytes', 'allocated_size')}
+
+        # Targets on one device share its bandwidth; separate devices run in parallel
+        estimates = [engine.estimate(plan) for plan in plans]
+        device_seconds = {}
+        for plan, estimate in zip(plans, estimates):
+            dev = plan.manifest.devices[0] if plan.manifest.devices else plan.location
+            device_seconds[dev] = device_seconds.get(dev, 0) + estimate['seconds']
+        written = sum(e['bytes_written'] for e in estimates) / (1024*1024)  # MB
+        syscalls = sum(sum(e['syscalls'].values()) for e in estimates)
+        profiles = sorted({f"{e['profile']['write_mbps']:.0f} MB/s {e['profile']['source']}" for e in estimates})
 
         print(f"\n{Colors.FAIL}╔{'═'*60}╗{Colors.ENDC}")
-        print(f"{Colors.FAIL}║{'CRITICAL WARNING':^60}║{Colors.ENDC}")
+        print(f"{Colors.FAIL}║{'DRY RUN - NOTHING WILL BE MODIFIED' if dry_run else 'CRITICAL WARNING':^60}║{Colors.ENDC}")
         print(f"{Colors.FAIL}╠{'═'*60}╣{Colors.ENDC}")
-        print(f"{Colors.FAIL}║  This will PERMANENTLY DESTROY {total_files} files ({total_size:.1f} MB){'':>10}║{Colors.ENDC}")
-        print(f"{Colors.FAIL}║  Location: {location[:45]:<45}║{Colors.ENDC}")
-        print(f"{Colors.FAIL}║  Method: {method.upper():<51}║{Colors.ENDC}")
-        print(f"{Colors.FAIL}║  Passes: {passes:<51}║{Colors.ENDC}")
+        print(f"{Colors.FAIL}║  {'Would destroy' if dry_run else 'This will PERMANENTLY DESTROY'} {total_files} files ({total_size:.1f} MB){'':>10}║{Colors.ENDC}")
+        if len(plans) == 1:
+            print(f"{Colors.FAIL}║  Location: {plans[0].location[:45]:<45}║{Colors.ENDC}")
+            print(f"{Colors.FAIL}║  Method: {plans[0].method.upper():<51}║{Colors.ENDC}")
+            print(f"{Colors.FAIL}║  Passes: {plans[0].passes:<51}║{Colors.ENDC}")
+        else:
+            print(f"{Colors.FAIL}║  Targets: {len(plans):<50}║{Colors.ENDC}")
+            for plan in sorted(plans, key=lambda p: -p.priority):
+                line = f"{plan.location[:30]} {plan.method}/{plan.passes}p prio {plan.priority}"
+                print(f"{Colors.FAIL}║   - {line:<55}║{Colors.ENDC}")
+        if info['pruned_dirs'] or info['excluded_files']:
+            print(f"{Colors.FAIL}║  Filtered: {info['pruned_dirs']} dirs pruned, {info['excluded_files']} files excluded{'':>6}║{Colors.ENDC}")
+        if info['hardlinks']:
+            print(f"{Colors.FAIL}║  Hardlinks: {info['hardlinks']} extra names, {info['inodes']} unique inodes{'':>10}║{Colors.ENDC}")
+        if info['reflinked_inodes']:
+            print(f"{Colors.FAIL}║  Reflinks: {info['reflinked_inodes']} files share {info['shared_bytes']/(1024*1024):.1f} MB of extents{'':>8}║{Colors.ENDC}")
+        lines = [f"Allocated: {info['allocated_size']/(1024*1024):.1f} MB | To write: {written:.1f} MB",
+                 f"Syscalls: ~{syscalls} | Est. time: ~{format_duration(max(device_seconds.values(), default=0))}",
+                 f"Throughput: {', '.join(profiles)}"]
+        for line in lines:
+            print(f"{Colors.FAIL}║  {line[:58]:<58}║{Colors.ENDC}")
+        if dry_run:
+            import textwrap
+            totals = {}
+            for estimate in estimates:
+                for name, count in estimate['syscalls'].items():
+                    totals[name] = totals.get(name, 0) + count
+            calls = ' '.join(f"{name}={count}" for name, count in totals.items() if count)
+            for line in textwrap.wrap(calls, 56):
+                print(f"{Colors.FAIL}║    {line:<56}║{Colors.ENDC}")
+            print(f"{Colors.FAIL}╚{'═'*60}╝{Colors.ENDC}\n")
+            remove_manifests()
+            return estimates
         print(f"{Colors.FAIL}║{'':>60}║{Colors.ENDC}")
         print(f"{Colors.FAIL}║  ⚠️  ABSOLUTELY NO RECOVERY POSSIBLE{'':>26}║{Colors.ENDC}")
         print(f"{Colors.FAIL}║  ⚠️  FORENSIC TOOLS CANNOT RECOVER{'':>26}║{Colors.ENDC}")
@@ -336,98 +2300,359 @@ def destroy_directory(location, password, confirm=True, passes=3, method='secure
         confirmation = input(f"{Colors.FAIL}Type 'DESTROY' to confirm: {Colors.ENDC}")
         if confirmation != 'DESTROY':
             print(f"{Colors.OKGREEN}✓ Operation cancelled.{Colors.ENDC}")
+            remove_manifests()
+            engine.close()
             return
 
-    key, salt = create_key(password)
-    destroyed_count = 0
-    failed_count = 0
-    total_size_destroyed = 0
-
     print(f"\n{Colors.FAIL}🔥 Starting SECURE DELETION process...{Colors.ENDC}")
-    print(f"{Colors.WARNING}Method: {method.upper()} | Passes: {passes} | Platform: {CURRENT_OS}{Colors.ENDC}\n")
+    print(f"{Colors.WARNING}Method: {method.upper()} | Passes: {passes} | Platform: {CURRENT_OS}{Colors.ENDC}")
+    print(f"{Colors.WARNING}Workers: {workers} | Chunk: {engine.pool.buffer_size//1024} KB"
+          f"{f' | Memory budget: {memory_budget/(1024*1024):.1f} MB' if memory_budget else ''}"
+          f"{f' | Targets: {len(plans)}' if len(plans) > 1 else ''}"
+          f"{f' | Offload: {offload_processes} procs' if offload_processes else ''}{Colors.ENDC}\n")
 
     try:
-        for root, _, files in os.walk(location, topdown=False):
-            for fil in files:
-                fname = os.path.join(root, fil)
-                file_size = get_file_size(fname)
-
-                if method == 'secure':
-                    # Full secure deletion
-                    if secure_delete_file(fname, passes=passes, encrypt=True, key=key):
-                        destroyed_count += 1
-                        total_size_destroyed += file_size
-                        print(f"{Colors.OKGREEN}✓ DESTROYED{Colors.ENDC} {fname} ({file_size/1024:.1f} KB)")
-                    else:
-                        failed_count += 1
-                        print(f"{Colors.FAIL}✗ FAILED{Colors.ENDC} {fname}")
-
-                elif method == 'wipe':
-                    # Overwrite + delete (no encryption)
-                    if secure_delete_file(fname, passes=passes, encrypt=False, key=None):
-                        destroyed_count += 1
-                        total_size_destroyed += file_size
-                        print(f"{Colors.OKGREEN}✓ WIPED{Colors.ENDC} {fname}")
-                    else:
-                        failed_count += 1
-                        print(f"{Colors.FAIL}✗ FAILED{Colors.ENDC} {fname}")
-
-                elif method == 'encrypt':
-                    # Legacy encryption-only mode
-                    try:
-                        with open(fname, 'rb') as f:
-                            data = f.read()
-                        encrypted = encrypt_data(data, key)
-                        with open(fname, 'wb') as f:
-                            f.write(encrypted)
-                        destroyed_count += 1
-                        print(f"{Colors.WARNING}✓ ENCRYPTED{Colors.ENDC} {fname}")
-                    except Exception as e:
-                        failed_count += 1
-                        print(f"{Colors.FAIL}✗ FAILED{Colors.ENDC} {fname}")
-
-        # Remove empty directories
-        for root, dirs, _ in os.walk(location, topdown=False):
-            for d in dirs:
-                try:
-                    os.rmdir(os.path.join(root, d))
-                except:
-                    pass
-
-        print(f"\n{Colors.OKGREEN}{'═'*60}{Colors.ENDC}")
-        print(f"{Colors.OKGREEN}✓ DESTRUCTION COMPLETE!{Colors.ENDC}")
-        print(f"{Colors.OKGREEN}  Destroyed: {destroyed_count} files ({total_size_destroyed/(1024*1024):.1f} MB){Colors.ENDC}")
-        if failed_count > 0:
-            print(f"{Colors.WARNING}  Failed: {failed_count} files{Colors.ENDC}")
-        print(f"{Colors.OKGREEN}  Method: {method.upper()}{Colors.ENDC}")
-        print(f"{Colors.OKGREEN}  Passes: {passes}{Colors.ENDC}")
-        print(f"{Colors.OKGREEN}{'═'*60}{Colors.ENDC}\n")
-
+        results = engine.execute_all(plans)
+        print_summary(WipeResult.combine(results), results if len(results) > 1 else None)
     except Exception as e:
         logging.error(f"Error during destruction: {e}")
         print(f"{Colors.FAIL}❌ Destruction process encountered an error.{Colors.ENDC}")
+    finally:
+        engine.close()
+        remove_manifests()
+
+def print_summary(result, per_target=None):
+    """Print the end-of-run summary for a WipeResult (plus optional per-target results)."""
+    print(f"\n{Colors.OKGREEN}{'═'*60}{Colors.ENDC}")
+    print(f"{Colors.OKGREEN}✓ DESTRUCTION COMPLETE!{Colors.ENDC}")
+    print(f"{Colors.OKGREEN}  Destroyed: {result.destroyed} files ({result.bytes_destroyed/(1024*1024):.1f} MB){Colors.ENDC}")
+    if result.method != 'encrypt':
+        print(f"{Colors.OKGREEN}  Logical: {result.logical_bytes/(1024*1024):.1f} MB | "
+              f"Allocated wiped: {result.allocated_bytes/(1024*1024):.1f} MB | "
+              f"Written: {result.bytes_written/(1024*1024):.1f} MB{Colors.ENDC}")
+    if result.pruned_dirs or result.excluded_files:
+        print(f"{Colors.OKGREEN}  Filter: {result.destroyed + result.failed} matched | "
+              f"{result.pruned_dirs} dirs pruned | {result.excluded_files} files excluded{Colors.ENDC}")
+    if result.hardlinks:
+        print(f"{Colors.OKGREEN}  Inodes wiped once: {result.inodes} ({result.hardlinks} extra hardlink names unlinked){Colors.ENDC}")
+    if result.failed > 0:
+        print(f"{Colors.WARNING}  Failed: {result.failed} files{Colors.ENDC}")
+    if result.cancelled:
+        print(f"{Colors.WARNING}  Cancelled before all files were processed{Colors.ENDC}")
+    print(f"{Colors.OKGREEN}  Buffer pool: peak {result.pool_peak_bytes/(1024*1024):.1f} MB "
+          f"({result.pool_peak_buffers} x {result.pool_buffer_size//1024} KB, {result.pool_waits} waits){Colors.ENDC}")
+    if result.throttle_seconds or result.peak_utilization is not None:
+        print(f"{Colors.OKGREEN}  Throttle wait: {result.throttle_seconds:.1f}s across workers"
+              f"{f' | Peak disk utilization: {result.peak_utilization:.0f}%' if result.peak_utilization is not None else ''}{Colors.ENDC}")
+    if result.reflinked_inodes:
+        print(f"{Colors.WARNING}  Reflinked: {result.reflinked_inodes} files had {result.shared_extents} shared extents "
+              f"({result.shared_bytes/(1024*1024):.1f} MB, {result.shared_within_target} shared inside target){Colors.ENDC}")
+        print(f"{Colors.WARNING}  ⚠️  Shared extents are copy-on-write: data may survive in other reflinked copies.{Colors.ENDC}")
+    if per_target:
+        print(f"{Colors.OKGREEN}  Targets:{Colors.ENDC}")
+        for target in per_target:
+            print(f"{Colors.OKGREEN}    {target.location}: {target.destroyed} files "
+                  f"({target.bytes_destroyed/(1024*1024):.1f} MB, {target.method}/{target.passes} passes)"
+                  f"{Colors.ENDC}{f'{Colors.WARNING}, {target.failed} failed{Colors.ENDC}' if target.failed else ''}")
+    print(f"{Colors.OKGREEN}  Method: {str(result.method).upper()}{Colors.ENDC}")
+    print(f"{Colors.OKGREEN}  Passes: {result.passes}{Colors.ENDC}")
+    print(f"{Colors.OKGREEN}  Elapsed: {result.elapsed:.1f}s{Colors.ENDC}")
+    print(f"{Colors.OKGREEN}{'═'*60}{Colors.ENDC}\n")
+
+_HTTP_SESSION = None
+_POLLERS = {}
+
+def http_session():
+    """Shared keep-alive requests.Session for all trigger and heartbeat polls."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests
+        _HTTP_SESSION = requests.Session()
+        _HTTP_SESSION.headers['User-Agent'] = 'rwipe'
+    return _HTTP_SESSION
+
+class URLPoller:
+    """
+    Cheap repeated check of one URL for a keyword ('start' or 'alive').
+
+    Polls reuse the shared keep-alive session, send If-None-Match /
+    If-Modified-Since so an unchanged page costs a bodyless 304 (which
+    repeats the previous answer), and read at most max_body bytes.
+    Latency of every poll is recorded for reporting.
+    """
+
+    MAX_BODY = 64 * 1024
+
+    def __init__(self, url, keyword, timeout=10, max_body=MAX_BODY):
+        self.url = url
+        self.keyword = keyword.lower().encode()
+        self.timeout = timeout
+        self.max_body = max_body
+        self.etag = None
+        self.last_modified = None
+        self.last_result = False
+        self.last_status = None
+        self.last_latency = None
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+        self.polls = 0
+        self.not_modified = 0
+        self.errors = 0
+
+    def poll(self):
+        """Fetch the URL and return True if the keyword is present."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        started = time.perf_counter()
+        try:
+            with http_session().get(self.url, headers=headers, timeout=self.timeout, stream=True) as response:
+                self.last_status = response.status_code
+                if response.status_code == 304:
+                    self.not_modified += 1
+                elif response.status_code == 200:
+                    body = bytearray()
+                    # Reading to the end lets the connection go back to the pool
+                    for chunk in response.iter_content(8192):
+                        body += chunk
+                        if len(body) >= self.max_body:
+                            break
+                    self.last_result = self.keyword in bytes(body[:self.max_body]).lower()
+                    self.etag = response.headers.get('ETag')
+                    self.last_modified = response.headers.get('Last-Modified')
+                else:
+                    self.last_result = False
+                    self.etag = self.last_modified = None
+        except Exception as e:
+            self.errors += 1
+            self.last_status = None
+            logging.debug(f"Error polling {self.url}: {e}")
+            return False
+        finally:
+            self.last_latency = time.perf_counter() - started
+            self.max_latency = max(self.max_latency, self.last_latency)
+            self.total_latency += self.last_latency
+            self.polls += 1
+        return self.last_result
+
+    def stats(self):
+        """Poll counters and latency (ms) for reporting."""
+        return {
+            'polls': self.polls,
+            'not_modified': self.not_modified,
+            'errors': self.errors,
+            'last_ms': round((self.last_latency or 0) * 1000, 2),
+            'avg_ms': round(self.total_latency / self.polls * 1000, 2) if self.polls else 0,
+            'max_ms': round(self.max_latency * 1000, 2),
+        }
+
+def url_poller(url, keyword):
+    """Shared URLPoller for a (url, keyword) pair, so validators persist across polls."""
+    poller = _POLLERS.get((url, keyword))
+    if poller is None:
+        poller = _POLLERS[(url, keyword)] = URLPoller(url, keyword)
+    return poller
+
+class EndpointWatcher:
+    """
+    Concurrent checks of redundant trigger or heartbeat URLs.
+
+    Each round polls every endpoint at once from an asyncio event loop,
+    with its own timeout; the polls run on a dedicated thread pool through
+    the shared keep-alive session. An endpoint whose previous poll is
+    still stuck is counted as a miss instead of being polled again, so one
+    stalled endpoint never holds up the others.
+
+    triggered() needs `quorum` endpoints to report the keyword (1 = any);
+    alive() needs just one.
+    """
+
+    def __init__(self, urls, keyword, quorum=1, timeout=10):
+        import asyncio
+        if isinstance(urls, str):
+            urls = [urls]
+        if not 1 <= quorum <= len(urls):
+            raise ValueError(f"Quorum must be between 1 and {len(urls)}")
+        self.urls = list(urls)
+        self.quorum = quorum
+        self.timeout = timeout
+        self.pollers = [url_poller(url, keyword) for url in self.urls]
+        for poller in self.pollers:
+            poller.timeout = timeout
+        self.last_hits = 0
+        self.last_misses = []
+        self._inflight = {}
+        self._executor = ThreadPoolExecutor(max_workers=len(self.urls))
+        self._loop = asyncio.new_event_loop()
+
+    async def _check(self, poller):
+        import asyncio
+        future = self._inflight.get(poller.url)
+        if future is not None and not future.done():
+            return False  # Still stuck in the previous round
+        future = self._inflight[poller.url] = self._loop.run_in_executor(self._executor, poller.poll)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            logging.debug(f"Endpoint {poller.url} timed out after {self.timeout}s")
+            return False
+
+    async def _round(self):
+        import asyncio
+        return await asyncio.gather(*(self._check(p) for p in self.pollers))
+
+    def check(self):
+        """Poll every endpoint concurrently; returns the number reporting the keyword."""
+        results = self._loop.run_until_complete(self._round())
+        self.last_hits = sum(1 for r in results if r)
+        self.last_misses = [p.url for p, r in zip(self.pollers, results) if not r]
+        return self.last_hits
+
+    def triggered(self):
+        return self.check() >= self.quorum
+
+    def alive(self):
+        return self.check() >= 1
+
+    def stats(self):
+        """Poll counters and latency (ms) summed / maxed over all endpoints."""
+        per = [p.stats() for p in self.pollers]
+        polls = sum(s['polls'] for s in per)
+        return {
+            'polls': polls,
+            'not_modified': sum(s['not_modified'] for s in per),
+            'errors': sum(s['errors'] for s in per),
+            'last_ms': max(s['last_ms'] for s in per),
+            'avg_ms': round(sum(s['avg_ms'] * s['polls'] for s in per) / polls, 2) if polls else 0,
+            'max_ms': max(s['max_ms'] for s in per),
+        }
+
+    def describe(self):
+        if len(self.urls) == 1:
+            return self.urls[0]
+        return f"{len(self.urls)} endpoints (quorum {self.quorum} of {len(self.urls)})"
+
+class TriggerStream:
+    """
+    Held-open trigger channel for remote mode.
+
+    kind='sse': a Server-Sent Events stream; an event named 'trigger', or
+    whose data contains the keyword, fires. kind='longpoll': the server
+    holds each request until it has something to say; a response body
+    containing the keyword fires, anything else reconnects at once.
+
+    Dropped connections reconnect with exponential backoff (plus jitter,
+    or the server's SSE 'retry:' hint). While the stream is down an
+    optional fallback poll is run once per reconnect attempt.
+    """
+
+    def __init__(self, url, kind='sse', keyword='start', read_timeout=90, max_backoff=60):
+        if kind not in ('sse', 'longpoll'):
+            raise ValueError(f"Invalid stream type: {kind}")
+        self.url = url
+        self.kind = kind
+        self.keyword = keyword.lower()
+        self.read_timeout = read_timeout
+        self.max_backoff = max_backoff
+        self.last_event_id = None
+        self.retry = None
+        self.connects = 0
+        self.events = 0
+
+    def _events(self, response):
+        """Parse an SSE stream into (event, data) pairs."""
+        event, data = 'message', []
+        # chunk_size=1 hands over each line as soon as it arrives, whatever
+        # the transfer encoding; event streams are small
+        for raw in response.iter_lines(chunk_size=1):
+            line = raw.decode('utf-8', 'replace')
+            if not line:
+                if data:
+                    yield event, '\n'.join(data)
+                event, data = 'message', []
+                continue
+            if line.startswith(':'):
+                continue  # Comment / keep-alive
+            field, _, value = line.partition(':')
+            value = value[1:] if value.startswith(' ') else value
+            if field == 'event':
+                event = value
+            elif field == 'data':
+                data.append(value)
+            elif field == 'id':
+                self.last_event_id = value
+            elif field == 'retry' and value.isdigit():
+                self.retry = int(value) / 1000
+
+    def _listen(self):
+        """One connection; returns True on a trigger, False when it ends."""
+        headers = {'Cache-Control': 'no-cache'}
+        if self.kind == 'sse':
+            headers['Accept'] = 'text/event-stream'
+            if self.last_event_id:
+                headers['Last-Event-ID'] = self.last_event_id
+        with http_session().get(self.url, headers=headers, stream=True,
+                                timeout=(10, self.read_timeout)) as response:
+            response.raise_for_status()
+            self.connects += 1
+            if self.kind == 'sse':
+                for event, data in self._events(response):
+                    self.events += 1
+                    logging.debug(f"Stream event {event}: {data[:80]!r}")
+                    if event == 'trigger' or self.keyword in data.lower():
+                        return True
+                return False
+            body = bytearray()
+            for chunk in response.iter_content(8192):
+                body += chunk
+                if len(body) >= URLPoller.MAX_BODY:
+                    break
+            self.events += 1
+            return self.keyword.encode() in bytes(body).lower()
+
+    def wait(self, fallback=None):
+        """Block until a trigger arrives (or the fallback poll reports one)."""
+        backoff = 1.0
+        while True:
+            started = time.monotonic()
+            try:
+                if self._listen():
+                    return True
+                healthy = True
+            except Exception as e:
+                logging.debug(f"Trigger stream {self.url} dropped: {e}")
+                healthy = False
+            held = time.monotonic() - started
+            if healthy and self.kind == 'longpoll' and held >= 1.0:
+                backoff = 1.0
+                continue  # A normal long-poll cycle: ask again straight away
+            if healthy or held > self.max_backoff:
+                backoff = 1.0
+            if fallback is not None and fallback():
+                return True
+            delay = self.retry if self.retry is not None else backoff * random.uniform(0.5, 1.0)
+            logging.debug(f"Reconnecting trigger stream in {delay:.1f}s")
+            sleep(delay)
+            backoff = min(backoff * 2, self.max_backoff)
 
 def check_url(url):
     """Check URL for trigger command."""
-    try:
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200 and "start" in response.text.lower():
-            return True
-    except Exception as e:
-        logging.debug(f"Error checking URL: {e}")
-    return False
+    poller = url_poller(url, 'start')
+    triggered = poller.poll()
+    logging.debug(f"Poll {url}: {poller.last_status} in {poller.last_latency*1000:.1f} ms")
+    return triggered
 
 def check_alive_signal(url):
     """Check for alive signal from URL (dead man switch)."""
-    try:
-        response = requests.get(url, timeout=10)
-        if response.status_code == 200 and "alive" in response.text.lower():
-            return True
-    except Exception as e:
-        logging.debug(f"Error checking alive signal: {e}")
-    return False
+    poller = url_poller(url, 'alive')
+    alive = poller.poll()
+    logging.debug(f"Poll {url}: {poller.last_status} in {poller.last_latency*1000:.1f} ms")
+    return alive
 
-def listener_local(location, password, passes, method):
+def listener_local(location, password, passes, method, wipe_options=None):
     """Local mode: Manual trigger via keyboard input."""
     print(f"{Colors.OKCYAN}🎯 Local Mode Active{Colors.ENDC}")
     print(f"{Colors.BOLD}Press 'Y' and Enter to start SECURE DELETION.{Colors.ENDC}\n")
@@ -436,60 +2661,540 @@ def listener_local(location, password, passes, method):
         response = input(f"{Colors.WARNING}> {Colors.ENDC}")
         if response.lower() == 'y':
             print(f"\n{Colors.FAIL}--SECURE DELETION Started!--{Colors.ENDC}")
-            destroy_directory(location, password, passes=passes, method=method)
+            destroy_directory(location, password, passes=passes, method=method, **(wipe_options or {}))
             break
         elif response.lower() == 'q':
             print(f"{Colors.OKGREEN}✓ Exiting...{Colors.ENDC}")
             break
 
-def listener_remote(url, interval, location, password, passes, method):
-    """Remote mode: Trigger via URL monitoring."""
+def listener_remote(url, interval, location, password, passes, method, wipe_options=None,
+                    stream_url=None, stream_type='sse', quorum=1, endpoint_timeout=10):
+    """
+    Remote mode: Trigger via URL monitoring or a held-open trigger stream.
+
+    url may be a list of redundant endpoints, polled concurrently; quorum
+    of them must report 'start' to trigger.
+    """
     print(f"{Colors.OKCYAN}📡 Remote Mode Active{Colors.ENDC}")
-    print(f"{Colors.BOLD}Monitoring: {url}{Colors.ENDC}")
+    watcher = EndpointWatcher(url, 'start', quorum, endpoint_timeout) if url else None
+    if stream_url:
+        print(f"{Colors.BOLD}Stream ({stream_type}): {stream_url}{Colors.ENDC}")
+        if watcher:
+            print(f"{Colors.BOLD}Fallback poll: {watcher.describe()}{Colors.ENDC}")
+        print(f"{Colors.OKGREEN}Status: Listening...{Colors.ENDC}")
+
+        stream = TriggerStream(stream_url, stream_type)
+        last_poll = [0.0]
+
+        def fallback():
+            # Poll while the stream is down, at most once per interval
+            if not watcher or time.monotonic() - last_poll[0] < interval:
+                return False
+            last_poll[0] = time.monotonic()
+            return watcher.triggered()
+
+        stream.wait(fallback)
+        print(f"\n{Colors.FAIL}🚨 TRIGGER DETECTED!{Colors.ENDC}")
+        print(f"{Colors.FAIL}--SECURE DELETION Started!--{Colors.ENDC}")
+        destroy_directory(location, password, confirm=False, passes=passes, method=method,
+                          **(wipe_options or {}))
+        return
+
+    print(f"{Colors.BOLD}Monitoring: {watcher.describe()}{Colors.ENDC}")
     print(f"{Colors.BOLD}Check interval: {interval}s{Colors.ENDC}\n")
     print(f"{Colors.OKGREEN}Status: Listening...{Colors.ENDC}")
 
     while True:
-        if check_url(url):
+        if watcher.triggered():
+            stats = watcher.stats()
             print(f"\n{Colors.FAIL}🚨 TRIGGER DETECTED!{Colors.ENDC}")
+            print(f"{Colors.WARNING}Polls: {stats['polls']} ({stats['not_modified']} unchanged) | "
+                  f"latency avg {stats['avg_ms']} ms, max {stats['max_ms']} ms{Colors.ENDC}")
             print(f"{Colors.FAIL}--SECURE DELETION Started!--{Colors.ENDC}")
-            destroy_directory(location, password, confirm=False, passes=passes, method=method)
+            destroy_directory(location, password, confirm=False, passes=passes, method=method,
+                              **(wipe_options or {}))
             break
         sleep(interval)
 
-def listener_deadman(url, check_interval, grace_period, location, password, passes, method):
-    """Dead man switch mode: Activate if no alive signal received."""
+class DeadlineTimer:
+    """
+    Grace-period deadline on the monotonic clock.
+
+    wait() sleeps until exactly the deadline (re-sleeping when reset()
+    pushes it out), independently of how long heartbeat checks take, and
+    is immune to wall-clock jumps. The clock and the wait primitive can be
+    injected, e.g. a fake clock whose wait advances time.
+    """
+
+    def __init__(self, grace_period, clock=time.monotonic, wait=None):
+        self.grace_period = grace_period
+        self.clock = clock
+        self._cond = threading.Condition()
+        self._wait = wait or self._cond.wait
+        self.deadline = clock() + grace_period
+        self.resets = 0
+        self.slip = None
+
+    def reset(self):
+        """Push the deadline out to one grace period from now."""
+        with self._cond:
+            self.deadline = self.clock() + self.grace_period
+            self.resets += 1
+            self._cond.notify_all()
+
+    def remaining(self):
+        return max(0.0, self.deadline - self.clock())
+
+    def wait(self):
+        """Block until the deadline passes; returns the slip (seconds late)."""
+        with self._cond:
+            while True:
+                now = self.clock()
+                if now >= self.deadline:
+                    self.slip = now - self.deadline
+                    return self.slip
+                self._wait(self.deadline - now)
+
+HEARTBEAT_MAX_SKEW = 30  # Seconds a heartbeat timestamp may differ from our clock
+
+def heartbeat_message(key, timestamp=None):
+    """Build a heartbeat datagram: b'<unix timestamp> <hex HMAC-SHA256 of it>'."""
+    import hmac
+    import hashlib
+    stamp = f"{time.time() if timestamp is None else timestamp:.6f}".encode()
+    return stamp + b' ' + hmac.new(key, stamp, hashlib.sha256).hexdigest().encode()
+
+def claim_unix_socket(path, kind):
+    """
+    Remove a stale Unix socket file left at path by a previous run.
+
+    Raises:
+        OSError (EADDRINUSE) if a live process still accepts connections on
+        it, so a second instance cannot take over a running one's socket.
+    """
+    import socket
+    if not os.path.exists(path) or not stat.S_ISSOCK(os.stat(path).st_mode):
+        return  # Nothing there, or not a socket: bind() reports the problem
+    probe = socket.socket(socket.AF_UNIX, kind)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        os.remove(path)  # Nobody listening: stale
+        return
+    except FileNotFoundError:
+        return
+    finally:
+        probe.close()
+    raise OSError(errno.EADDRINUSE, "Socket is in use by a running process", path)
+
+def parse_heartbeat_address(address):
+    """'host:port' or '[v6]:port' -> UDP address; anything else is a Unix socket path."""
+    host, sep, port = address.rpartition(':')
+    if sep and port.isdigit() and '/' not in address:
+        return (host.strip('[]') or '127.0.0.1', int(port))
+    return address
+
+def send_heartbeat(address, key):
+    """Send one authenticated heartbeat to a Unix datagram socket path or UDP host:port."""
+    import socket
+    target = parse_heartbeat_address(address)
+    if isinstance(target, tuple):
+        family = socket.AF_INET6 if ':' in target[0] else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_DGRAM)
+    else:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    with sock:
+        sock.sendto(heartbeat_message(key), target)
+
+class HeartbeatListener:
+    """
+    Push heartbeats for deadman mode on a local Unix datagram socket and/or
+    a UDP port.
+
+    Each datagram carries a timestamp and an HMAC-SHA256 of it under a
+    shared key. A beat is accepted if the HMAC matches, the timestamp is
+    within HEARTBEAT_MAX_SKEW of our clock, and it is newer than the last
+    accepted one (so captured datagrams cannot be replayed). Accepted
+    beats call on_beat() from the listener thread; nothing is polled.
+    """
+
+    def __init__(self, addresses, key, on_beat):
+        import socket
+        self.key = key
+        self.on_beat = on_beat
+        self.accepted = 0
+        self.rejected = 0
+        self.last_stamp = 0.0
+        self.sockets = []
+        self._paths = []
+        for address in addresses:
+            target = parse_heartbeat_address(address)
+            if isinstance(target, tuple):
+                family = socket.AF_INET6 if ':' in target[0] else socket.AF_INET
+                sock = socket.socket(family, socket.SOCK_DGRAM)
+                sock.bind(target)
+            else:
+                claim_unix_socket(target, socket.SOCK_DGRAM)
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                old_umask = os.umask(0o177)
+                try:
+                    sock.bind(target)  # Owner-only socket file
+                finally:
+                    os.umask(old_umask)
+                self._paths.append(target)
+            self.sockets.append(sock)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='rwipe-heartbeat-socket', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def verify(self, data):
+        """Return True if data is a valid, fresh, non-replayed heartbeat."""
+        import hmac
+        import hashlib
+        stamp, _, digest = data.strip().partition(b' ')
+        expected = hmac.new(self.key, stamp, hashlib.sha256).hexdigest().encode()
+        if not hmac.compare_digest(digest, expected):
+            return False
+        try:
+            value = float(stamp)
+        except ValueError:
+            return False
+        if abs(time.time() - value) > HEARTBEAT_MAX_SKEW or value <= self.last_stamp:
+            return False
+        self.last_stamp = value
+        return True
+
+    def _run(self):
+        import selectors
+        with selectors.DefaultSelector() as selector:
+            for sock in self.sockets:
+                selector.register(sock, selectors.EVENT_READ)
+            while not self._stop.is_set():
+                for key, _ in selector.select(timeout=1.0):
+                    try:
+                        data = key.fileobj.recv(512)
+                    except OSError:
+                        continue
+                    if self.verify(data):
+                        self.accepted += 1
+                        self.on_beat()
+                    else:
+                        self.rejected += 1
+                        logging.debug(f"Rejected heartbeat datagram ({len(data)} bytes)")
+
+    def close(self):
+        self._stop.set()
+        for sock in self.sockets:
+            sock.close()
+        for path in self._paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def listener_deadman(url, check_interval, grace_period, location, password, passes, method,
+                     wipe_options=None, endpoint_timeout=10, heartbeat_addresses=None,
+                     heartbeat_key=None):
+    """
+    Dead man switch mode: Activate if no alive signal received.
+
+    url may be a list of redundant endpoints; an alive signal from any of
+    them resets the deadline. Checks run on a background thread; the
+    trigger fires from a DeadlineTimer at the grace deadline itself, not
+    at the next check. heartbeat_addresses (Unix socket paths or UDP
+    host:port) additionally accept HMAC-signed push heartbeats.
+    """
+    watcher = EndpointWatcher(url, 'alive', 1, endpoint_timeout) if url else None
     print(f"{Colors.FAIL}☠️  Dead Man Switch Mode Active{Colors.ENDC}")
-    print(f"{Colors.BOLD}Monitoring: {url}{Colors.ENDC}")
+    if watcher:
+        print(f"{Colors.BOLD}Monitoring: {watcher.describe()}{Colors.ENDC}")
+    for address in heartbeat_addresses or []:
+        print(f"{Colors.BOLD}Heartbeat socket: {address}{Colors.ENDC}")
     print(f"{Colors.BOLD}Check interval: {check_interval}s{Colors.ENDC}")
     print(f"{Colors.BOLD}Grace period: {grace_period}s{Colors.ENDC}\n")
 
-    last_alive = datetime.now()
-    grace_deadline = last_alive + timedelta(seconds=grace_period)
+    timer = DeadlineTimer(grace_period)
+    fired = threading.Event()
+
+    def deadline_text():
+        return (datetime.now() + timedelta(seconds=timer.remaining())).strftime('%Y-%m-%d %H:%M:%S')
 
     print(f"{Colors.WARNING}⏱️  Dead man switch armed.{Colors.ENDC}")
-    print(f"{Colors.WARNING}⏱️  Grace period ends: {grace_deadline.strftime('%Y-%m-%d %H:%M:%S')}{Colors.ENDC}\n")
+    print(f"{Colors.WARNING}⏱️  Grace period ends: {deadline_text()}{Colors.ENDC}\n")
+
+    def heartbeat_loop():
+        while not fired.is_set():
+            if watcher.alive() and not fired.is_set():
+                timer.reset()
+                print(f"{Colors.OKGREEN}✓ Alive signal received at {datetime.now().strftime('%H:%M:%S')}"
+                      f" ({watcher.last_hits}/{len(watcher.urls)} endpoints, {watcher.stats()['last_ms']} ms){Colors.ENDC}")
+                print(f"{Colors.OKGREEN}  Next deadline: {deadline_text()}{Colors.ENDC}")
+            elif not fired.is_set():
+                print(f"{Colors.WARNING}⏳ No signal. Time until trigger: {int(timer.remaining())}s{Colors.ENDC}")
+            fired.wait(check_interval)
+
+    if watcher:
+        threading.Thread(target=heartbeat_loop, name='rwipe-heartbeat', daemon=True).start()
+
+    sockets = None
+    if heartbeat_addresses:
+        last_beat = [0.0]
+
+        def on_beat():
+            if fired.is_set():
+                return
+            timer.reset()
+            now = time.monotonic()
+            if now - last_beat[0] > check_interval:
+                # Beats can arrive every second; only report after a quiet spell
+                print(f"{Colors.OKGREEN}✓ Local heartbeat at {datetime.now().strftime('%H:%M:%S')}"
+                      f" | next deadline: {deadline_text()}{Colors.ENDC}")
+            last_beat[0] = now
+
+        sockets = HeartbeatListener(heartbeat_addresses, heartbeat_key, on_beat).start()
 
-    while True:
-        if check_alive_signal(url):
-            last_alive = datetime.now()
-            grace_deadline = last_alive + timedelta(seconds=grace_period)
-            print(f"{Colors.OKGREEN}✓ Alive signal received at {last_alive.strftime('%H:%M:%S')}{Colors.ENDC}")
-            print(f"{Colors.OKGREEN}  Next deadline: {grace_deadline.strftime('%Y-%m-%d %H:%M:%S')}{Colors.ENDC}")
-        else:
-            time_since_alive = (datetime.now() - last_alive).total_seconds()
+    try:
+        slip = timer.wait()
+        fired.set()
+    finally:
+        if sockets:
+            sockets.close()
+    silent = grace_period + slip
+    print(f"\n{Colors.FAIL}☠️  DEAD MAN SWITCH TRIGGERED!{Colors.ENDC}")
+    print(f"{Colors.FAIL}⚠️  No alive signal for {int(silent)}s (grace: {grace_period}s, "
+          f"deadline slip: {slip*1000:.1f} ms){Colors.ENDC}")
+    print(f"{Colors.FAIL}--SECURE DELETION Started!--{Colors.ENDC}")
+    destroy_directory(location, password, confirm=False, passes=passes, method=method,
+                      **(wipe_options or {}))
+
+
+def listener_calibrate(location, probe_size, force=False):
+    """Calibrate mode: Measure the target device and cache its I/O profile."""
+    print(f"{Colors.OKCYAN}📏 Calibration Mode{Colors.ENDC}")
+    key, _ = device_identity(location)
+    cached = calibrated_profile(location)
+    if cached is not None and not force:
+        print(f"{Colors.OKGREEN}✓ Device {key} already calibrated at {cached['calibrated_at']} "
+              f"(use --recalibrate to measure again){Colors.ENDC}")
+        profile = cached
+    else:
+        print(f"{Colors.BOLD}Device: {key} | Probe: {probe_size/(1024*1024):.0f} MB per setting{Colors.ENDC}\n")
+
+        def show_probe(label, mbps):
+            print(f"{Colors.WARNING}  {label:<20} {mbps:8.1f} MB/s{Colors.ENDC}")
+
+        profile = calibrate_device(location, probe_size, progress=show_probe)
+        print(f"\n{Colors.OKGREEN}✓ Profile saved to {profile_cache_path()}{Colors.ENDC}")
+
+    print(f"{Colors.OKGREEN}  Chunk size: {profile['chunk_size']//1024} KB{Colors.ENDC}")
+    print(f"{Colors.OKGREEN}  Queue depth: {profile['queue_depth']} (concurrent range writers per split file){Colors.ENDC}")
+    print(f"{Colors.OKGREEN}  Workers: {profile['workers']}{Colors.ENDC}")
+    print(f"{Colors.OKGREEN}  Throughput: {profile['write_mbps']:.1f} MB/s | fsync: {profile['fsync_ms']:.2f} ms"
+          f" | per file: {profile['file_ms']:.2f} ms{Colors.ENDC}")
+
+
+def default_control_socket():
+    """Default daemon control socket: in $XDG_RUNTIME_DIR, else the temp dir, per user."""
+    import tempfile
+    base = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, 'getuid') else 0
+    return os.path.join(base, f"rwipe-{uid}.sock")
+
+def control_request(command, socket_path=None, timeout=10, **params):
+    """Send one command to a running daemon and return its JSON reply."""
+    import socket
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path or default_control_socket())
+        sock.sendall(json.dumps(dict(params, cmd=command)).encode() + b'\n')
+        reply = sock.makefile('rb').readline()
+    return json.loads(reply)
+
+class WipeDaemon:
+    """
+    Resident wipe engine behind a local control socket.
 
-            if time_since_alive >= grace_period:
-                print(f"\n{Colors.FAIL}☠️  DEAD MAN SWITCH TRIGGERED!{Colors.ENDC}")
-                print(f"{Colors.FAIL}⚠️  No alive signal for {int(time_since_alive)}s (grace: {grace_period}s){Colors.ENDC}")
-                print(f"{Colors.FAIL}--SECURE DELETION Started!--{Colors.ENDC}")
-                destroy_directory(location, password, confirm=False, passes=passes, method=method)
-                break
+    The key is derived and the engine built once at startup, so a trigger
+    costs one small write to the socket instead of an interpreter start,
+    imports and the KDF. Commands are one JSON object per line:
+
+        {"cmd": "arm"}      scan the targets now and hold the plans
+        {"cmd": "trigger"}  start wiping (scans first if not armed; while
+                            an arm scan runs, starts as soon as it ends)
+        {"cmd": "status"}   state, progress and the last result
+        {"cmd": "cancel"}   stop a running wipe, or abort a scan / disarm
+
+    Only one wipe runs at a time; state moves idle/armed -> scanning ->
+    armed -> running -> finished/cancelled/failed under one lock.
+
+    The socket is created owner-only; anyone who can reach it can trigger.
+    """
+
+    def __init__(self, engine, targets, socket_path=None):
+        self.engine = engine
+        self.targets = as_targets(targets)
+        self.socket_path = socket_path or default_control_socket()
+        self.state = 'idle'
+        self.plans = None
+        self.progress = {'files': 0, 'failed': 0, 'bytes': 0}
+        self.result = None
+        self.error = None
+        self._lock = threading.Lock()
+        self._job = None
+        self._scan = 0  # Generation of the current arm scan
+        self._trigger_pending = False
+        self._server = None
+        engine.progress = self._on_progress
+
+    def _on_progress(self, path, size, ok, result):
+        with self._lock:
+            self.progress['files' if ok else 'failed'] += 1
+            if ok:
+                self.progress['bytes'] += size
+
+    def _plan(self):
+        return [self.engine.plan(t['path'], method=t.get('method'), passes=t.get('passes'),
+                                 priority=t.get('priority', 0)) for t in self.targets]
+
+    def _run(self, plans):
+        try:
+            if plans is None:
+                plans = self._plan()
+            results = self.engine.execute_all(plans)
+            with self._lock:
+                self.result = WipeResult.combine(results).to_dict()
+                self.state = 'cancelled' if self.result['cancelled'] else 'finished'
+        except Exception as e:
+            logging.error(f"Daemon wipe failed: {e}")
+            with self._lock:
+                self.error = str(e)
+                self.state = 'failed'
+
+    def _start(self):
+        """Start the wipe on the armed plans (or a fresh scan). Caller holds the lock."""
+        plans, self.plans = self.plans, None
+        self._trigger_pending = False
+        self.state = 'running'
+        self.progress = {'files': 0, 'failed': 0, 'bytes': 0}
+        self.result = self.error = None
+        # No run is active, so a cancel still held by the engine is left over
+        # from the end of the previous run and must not stop this one
+        self.engine._cancel.clear()
+        self._job = threading.Thread(target=self._run, args=(plans,), name='rwipe-daemon-job')
+        self._job.start()
+
+    def handle(self, request):
+        """Execute one control command and return the reply dict."""
+        cmd = request.get('cmd')
+        with self._lock:
+            if cmd == 'status':
+                return {'ok': True, 'state': self.state, 'progress': dict(self.progress),
+                        'targets': [t['path'] for t in self.targets], 'result': self.result,
+                        'error': self.error, 'trigger_pending': self._trigger_pending}
+            if cmd == 'arm':
+                if self.state in ('running', 'scanning'):
+                    return {'ok': False, 'error': f"Cannot arm while {self.state}"}
+                self.state = 'scanning'
+                self.plans = None
+                self._scan += 1
+                scan = self._scan
+            elif cmd == 'trigger':
+                if self.state == 'running':
+                    return {'ok': True, 'state': 'running'}
+                if self.state == 'scanning':
+                    # Start on the arm scan's plans as soon as it completes
+                    self._trigger_pending = True
+                    return {'ok': True, 'state': 'scanning', 'queued': True}
+                self._start()
+                return {'ok': True, 'state': 'running'}
+            elif cmd == 'cancel':
+                if self.state == 'running':
+                    self.engine.cancel()  # Also honoured while the trigger's own scan runs
+                    return {'ok': True, 'state': 'cancelling'}
+                self.plans = None
+                self._trigger_pending = False
+                self.state = 'idle'  # An arm scan in progress is discarded when it ends
+                return {'ok': True, 'state': 'idle'}
             else:
-                remaining = grace_period - int(time_since_alive)
-                print(f"{Colors.WARNING}⏳ No signal. Time until trigger: {remaining}s{Colors.ENDC}")
+                return {'ok': False, 'error': f"Unknown command: {cmd}"}
 
-        sleep(check_interval)
+        # arm: scan outside the lock so status stays responsive
+        try:
+            plans = self._plan()
+        except Exception as e:
+            with self._lock:
+                if self.state == 'scanning' and self._scan == scan:
+                    self.state = 'idle'
+                    self._trigger_pending = False
+            return {'ok': False, 'error': str(e)}
+        with self._lock:
+            if self.state != 'scanning' or self._scan != scan:
+                return {'ok': False, 'error': 'Scan was cancelled'}
+            self.plans = plans
+            self.state = 'armed'
+            files = sum(plan.total_files for plan in plans)
+            if self._trigger_pending:
+                self._start()
+                return {'ok': True, 'state': 'running', 'files': files}
+        return {'ok': True, 'state': 'armed', 'files': files}
+
+    def serve_forever(self):
+        import socketserver
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline(65536)
+                if not line:
+                    return  # Connection probe (see claim_unix_socket)
+                try:
+                    reply = daemon.handle(json.loads(line))
+                except ValueError:
+                    reply = {'ok': False, 'error': 'Invalid JSON'}
+                self.wfile.write(json.dumps(reply).encode() + b'\n')
+
+        import socket
+        claim_unix_socket(self.socket_path, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            self._server = socketserver.ThreadingUnixStreamServer(self.socket_path, Handler)
+        finally:
+            os.umask(old_umask)
+        self._server.daemon_threads = True
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            try:
+                os.remove(self.socket_path)
+            except OSError:
+                pass
+
+    def shutdown(self):
+        if self._server:
+            self._server.shutdown()
+
+def listener_daemon(location, password, passes, method, wipe_options=None, socket_path=None):
+    """Daemon mode: Resident engine controlled over a local socket (see rwipectl.py)."""
+    options = dict(wipe_options or {})
+    options.pop('manifest_path', None)  # Plans stay in memory while armed
+    engine = WipeEngine(password=password, passes=passes, method=method, **options)
+    targets = as_targets(location)
+    for method_used in {t.get('method') or method for t in targets}:
+        engine.get_key(method_used)  # Pay the KDF now, not at trigger time
+
+    daemon = WipeDaemon(engine, targets, socket_path)
+    print(f"{Colors.OKCYAN}🛰️  Daemon Mode Active{Colors.ENDC}")
+    print(f"{Colors.BOLD}Control socket: {daemon.socket_path}{Colors.ENDC}")
+    print(f"{Colors.BOLD}Targets: {', '.join(t['path'] for t in targets)}{Colors.ENDC}")
+    print(f"{Colors.OKGREEN}Status: Waiting for commands (python3 rwipectl.py trigger)...{Colors.ENDC}")
+    try:
+        daemon.serve_forever()
+    finally:
+        engine.close()
 
 
 def listener_cloud(platforms_str=None, cloud_all=False):
@@ -645,22 +3350,39 @@ def listener_cloud(platforms_str=None, cloud_all=False):
 
 
 if __name__ == '__main__':
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='RWIPE v3.0 - TRUE Secure Deletion System + Multi-Cloud Support',
         epilog='Use responsibly. For authorized data protection only.'
     )
 
     # Required arguments
-    parser.add_argument('-d', '--directory', action='store', dest='location',
-                        help='Directory to be destroyed (not required for cloud mode)', required=False)
+    parser.add_argument('-d', '--directory', action='store', dest='location', nargs='+',
+                        help='Directory (or directories) to be destroyed (not required for cloud mode)', required=False)
     parser.add_argument('-m', '--mode', action='store', dest='mode',
-                        help="Mode: 'local', 'remote', 'deadman', or 'cloud'", required=True)
+                        help="Mode: 'local', 'remote', 'deadman', 'cloud', 'calibrate', 'daemon', or 'checkin' (send a heartbeat)", required=True)
     parser.add_argument('-p', '--password', action='store', dest='password',
                         help='Password for key derivation (not required for cloud mode)', required=False)
 
     # Optional arguments
-    parser.add_argument('-u', '--url', action='store', dest='url',
-                        help='URL for remote/deadman mode')
+    parser.add_argument('-u', '--url', action='store', dest='url', nargs='+',
+                        help='URL(s) for remote/deadman mode; several URLs are polled concurrently')
+    parser.add_argument('--quorum', action='store', dest='quorum', type=int, default=1,
+                        help='Remote mode: number of URLs that must report the trigger (default: 1 = any)')
+    parser.add_argument('--endpoint-timeout', action='store', dest='endpoint_timeout', type=float, default=10,
+                        help='Timeout per URL check in seconds (default: 10)')
+    parser.add_argument('--stream-url', action='store', dest='stream_url',
+                        help='Remote mode: hold this SSE or long-poll trigger endpoint open (-u becomes the fallback poll)')
+    parser.add_argument('--stream-type', action='store', dest='stream_type', default='sse',
+                        choices=['sse', 'longpoll'], help="Trigger stream protocol (default: 'sse')")
+    parser.add_argument('--heartbeat-socket', action='append', dest='heartbeat_addresses', default=[],
+                        metavar='PATH|HOST:PORT',
+                        help='Deadman mode: accept signed heartbeats on this Unix socket path or UDP host:port (repeatable); with -m checkin, send one')
+    parser.add_argument('--heartbeat-key', action='store', dest='heartbeat_key',
+                        help='Shared HMAC key for heartbeats (default: $RWIPE_HEARTBEAT_KEY)')
+    parser.add_argument('--control-socket', action='store', dest='control_socket',
+                        help='Daemon mode: control socket path (default: $XDG_RUNTIME_DIR/rwipe-<uid>.sock)')
     parser.add_argument('-i', '--interval', action='store', dest='interval',
                         help='Check interval in seconds (default: 60)',
                         required=False, type=int, default=60)
@@ -675,6 +3397,67 @@ if __name__ == '__main__':
                         help="Deletion method: 'secure' (default), 'wipe', or 'encrypt'",
                         required=False, default='secure',
                         choices=['secure', 'wipe', 'encrypt'])
+    parser.add_argument('--workers', action='store', dest='workers',
+                        help='Number of files wiped concurrently (default: calibrated value, else 1)',
+                        required=False, type=int, default=None)
+    parser.add_argument('--memory-budget', action='store', dest='memory_budget',
+                        help='Cap on wipe buffer memory shared by all workers, e.g. 64M (default: one 1MB buffer per worker)',
+                        required=False, type=parse_size, default=None)
+    parser.add_argument('--max-mbps', action='store', dest='max_mbps',
+                        help='Limit aggregate write bandwidth of all workers (MB/s)',
+                        required=False, type=float, default=None)
+    parser.add_argument('--max-iops', action='store', dest='max_iops',
+                        help='Limit aggregate write/fsync operations per second',
+                        required=False, type=int, default=None)
+    parser.add_argument('--adaptive-throttle', action='store_true', dest='adaptive_throttle',
+                        help='Back off while disk utilization is above --util-threshold')
+    parser.add_argument('--util-threshold', action='store', dest='util_threshold',
+                        help='Disk utilization percent that triggers adaptive backoff (default: 80)',
+                        required=False, type=float, default=80.0)
+    parser.add_argument('--job-file', action='store', dest='job_file',
+                        help='JSON file listing targets with per-target method, passes and priority',
+                        required=False, default=None)
+    parser.add_argument('--offload-procs', action='store', dest='offload_processes',
+                        help='Generate random passes and run the encryption layer in this many worker processes (default: 0, in-process)',
+                        required=False, type=int, default=0)
+    parser.add_argument('--split-threshold', action='store', dest='split_threshold',
+                        help='Overwrite files at least this large as parallel ranges when --workers > 1 (default: 1G)',
+                        required=False, type=parse_size, default=DEFAULT_SPLIT_THRESHOLD)
+    parser.add_argument('--range-size', action='store', dest='range_size',
+                        help='Size of each parallel range of a split file (default: 64M)',
+                        required=False, type=parse_size, default=DEFAULT_RANGE_SIZE)
+    parser.add_argument('--cover-slack', action='store_true', dest='cover_slack',
+                        help='Round every pass up to the filesystem block size to overwrite slack after EOF, using aligned buffers')
+    parser.add_argument('--manifest-file', action='store', dest='manifest_path',
+                        help='Keep the scan manifest memory-mapped in this file (for huge trees; wiped after the run)',
+                        required=False, default=None)
+    parser.add_argument('--include', action='append', dest='include', default=[], metavar='GLOB',
+                        help="Only wipe files matching this glob (repeatable, e.g. '*.sqlite')")
+    parser.add_argument('--exclude', action='append', dest='exclude', default=[], metavar='GLOB',
+                        help="Skip files/directories matching this glob (repeatable, e.g. '.git'); excluded directories are not descended into")
+    parser.add_argument('--include-regex', action='append', dest='include_regex', default=[], metavar='REGEX',
+                        help='Only wipe files whose relative path matches this regex (repeatable)')
+    parser.add_argument('--exclude-regex', action='append', dest='exclude_regex', default=[], metavar='REGEX',
+                        help='Skip files/directories whose relative path matches this regex (repeatable)')
+    parser.add_argument('--min-size', action='store', dest='min_size', type=parse_size, default=None,
+                        help='Only wipe files at least this large, e.g. 4K')
+    parser.add_argument('--max-size', action='store', dest='max_size', type=parse_size, default=None,
+                        help='Only wipe files at most this large, e.g. 1G')
+    parser.add_argument('--older-than', action='store', dest='older_than', type=parse_duration, default=None,
+                        help='Only wipe files last modified longer ago than this, e.g. 30d')
+    parser.add_argument('--newer-than', action='store', dest='newer_than', type=parse_duration, default=None,
+                        help='Only wipe files modified within this period, e.g. 12h')
+    parser.add_argument('--probe-size', action='store', dest='probe_size',
+                        help='Bytes written per calibration probe (default: 32M)',
+                        required=False, type=parse_size, default=32 * 1024 * 1024)
+    parser.add_argument('--recalibrate', action='store_true', dest='recalibrate',
+                        help='Calibrate again even if a profile for the device is cached')
+    parser.add_argument('--dry-run', action='store_true', dest='dry_run',
+                        help='Scan and print the plan with I/O and time estimates, then exit without modifying anything')
+    parser.add_argument('--check-deps', action='store_true', dest='check_deps',
+                        help='Check for (and install) missing dependencies before starting')
+    parser.add_argument('--no-banner', action='store_true', dest='no_banner',
+                        help='Do not print the startup banner')
     parser.add_argument('-v', '--verbose', action='store_true',
                         help='Enable verbose logging')
     parser.add_argument('--no-confirm', action='store_true',
@@ -689,21 +3472,53 @@ if __name__ == '__main__':
 
     argv = parser.parse_args()
 
+    if not argv.no_banner:
+        print(BANNER)
+
+    if argv.check_deps:
+        check_dependencies()
+
     # Setup logging
     setup_logging(argv.verbose)
 
-    # Validate directory (not required for cloud mode)
-    if argv.mode != 'cloud':
-        if not argv.location:
-            print(f"{Colors.FAIL}❌ Error: Directory (-d) is required for {argv.mode} mode{Colors.ENDC}")
+    heartbeat_key = argv.heartbeat_key or os.environ.get('RWIPE_HEARTBEAT_KEY')
+    if argv.heartbeat_addresses and not heartbeat_key:
+        print(f"{Colors.FAIL}❌ Error: --heartbeat-key or $RWIPE_HEARTBEAT_KEY is required for heartbeat sockets{Colors.ENDC}")
+        sys.exit(1)
+
+    if argv.mode == 'checkin':
+        if not argv.heartbeat_addresses:
+            print(f"{Colors.FAIL}❌ Error: --heartbeat-socket is required for checkin mode{Colors.ENDC}")
             sys.exit(1)
-        if not os.path.exists(argv.location):
-            print(f"{Colors.FAIL}❌ Error: Directory does not exist: {argv.location}{Colors.ENDC}")
+        for address in argv.heartbeat_addresses:
+            send_heartbeat(address, heartbeat_key.encode())
+        sys.exit(0)
+
+    # Validate directories (not required for cloud mode)
+    targets = [{'path': location} for location in argv.location or []]
+    if argv.job_file:
+        try:
+            targets += load_job_file(argv.job_file, argv.method, argv.passes)
+        except (OSError, ValueError) as e:
+            print(f"{Colors.FAIL}❌ Error: Cannot load job file: {e}{Colors.ENDC}")
+            sys.exit(1)
+
+    if argv.mode != 'cloud':
+        if not targets:
+            print(f"{Colors.FAIL}❌ Error: Directory (-d) or --job-file is required for {argv.mode} mode{Colors.ENDC}")
             sys.exit(1)
-        if not os.path.isdir(argv.location):
-            print(f"{Colors.FAIL}❌ Error: Path is not a directory: {argv.location}{Colors.ENDC}")
+        overlap = overlapping_targets([target['path'] for target in targets])
+        if overlap:
+            print(f"{Colors.FAIL}❌ Error: Targets overlap: {overlap[0]} and {overlap[1]}{Colors.ENDC}")
             sys.exit(1)
-        if not argv.password:
+        for target in targets:
+            if not os.path.exists(target['path']):
+                print(f"{Colors.FAIL}❌ Error: Directory does not exist: {target['path']}{Colors.ENDC}")
+                sys.exit(1)
+            if not os.path.isdir(target['path']):
+                print(f"{Colors.FAIL}❌ Error: Path is not a directory: {target['path']}{Colors.ENDC}")
+                sys.exit(1)
+        if not argv.password and not argv.dry_run and argv.mode != 'calibrate':
             print(f"{Colors.FAIL}❌ Error: Password (-p) is required for {argv.mode} mode{Colors.ENDC}")
             sys.exit(1)
 
@@ -712,31 +3527,81 @@ if __name__ == '__main__':
         print(f"{Colors.WARNING}⚠️  WARNING: 'encrypt' method does NOT securely delete!{Colors.ENDC}")
         print(f"{Colors.WARNING}⚠️  Original data may be recoverable. Use 'secure' or 'wipe' for true deletion.{Colors.ENDC}\n")
 
+    # Reuse the calibrated I/O profile of the (first) target device, if any
+    profile = calibrated_profile(targets[0]['path']) if targets and argv.mode != 'calibrate' else None
+    if argv.workers is None:
+        argv.workers = profile['workers'] if profile else 1
+    if argv.workers < 1:
+        print(f"{Colors.FAIL}❌ Error: --workers must be at least 1{Colors.ENDC}")
+        sys.exit(1)
+
+    try:
+        scan_filter = ScanFilter(argv.include, argv.exclude, argv.include_regex, argv.exclude_regex,
+                                 argv.min_size, argv.max_size, argv.older_than, argv.newer_than)
+    except re.error as e:
+        print(f"{Colors.FAIL}❌ Error: Invalid filter regex: {e}{Colors.ENDC}")
+        sys.exit(1)
+
+    if argv.memory_budget is not None and argv.memory_budget < MIN_CHUNK_SIZE:
+        print(f"{Colors.FAIL}❌ Error: --memory-budget must be at least {MIN_CHUNK_SIZE // 1024}K{Colors.ENDC}")
+        sys.exit(1)
+
+    wipe_options = {'workers': argv.workers, 'memory_budget': argv.memory_budget,
+                    'manifest_path': argv.manifest_path, 'scan_filter': scan_filter,
+                    'chunk_size': profile['chunk_size'] if profile else DEFAULT_CHUNK_SIZE,
+                    'offload_processes': max(0, argv.offload_processes),
+                    'split_threshold': argv.split_threshold, 'range_size': argv.range_size,
+                    'cover_slack': argv.cover_slack,
+                    'range_streams': profile.get('queue_depth') if profile else None}
+    if argv.max_mbps or argv.max_iops or argv.adaptive_throttle:
+        wipe_options['throttle'] = IOThrottle(argv.max_mbps, argv.max_iops,
+                                              argv.adaptive_throttle, argv.util_threshold)
+
+    # A single plain -d keeps the classic single-target banner and summary
+    location = targets[0]['path'] if len(targets) == 1 and not argv.job_file else targets
+
     # Execute based on mode
     try:
-        if argv.mode == 'local':
-            listener_local(argv.location, argv.password, argv.passes, argv.method)
+        if argv.dry_run and argv.mode != 'cloud':
+            destroy_directory(location, argv.password, passes=argv.passes, method=argv.method,
+                              dry_run=True, **wipe_options)
+
+        elif argv.mode == 'local':
+            listener_local(location, argv.password, argv.passes, argv.method, wipe_options)
 
         elif argv.mode == 'remote':
-            if not argv.url:
-                print(f"{Colors.FAIL}❌ Error: URL (-u) is required for remote mode.{Colors.ENDC}")
+            if not argv.url and not argv.stream_url:
+                print(f"{Colors.FAIL}❌ Error: URL (-u) or --stream-url is required for remote mode.{Colors.ENDC}")
+                sys.exit(1)
+            if argv.url and not 1 <= argv.quorum <= len(argv.url):
+                print(f"{Colors.FAIL}❌ Error: --quorum must be between 1 and the number of URLs.{Colors.ENDC}")
                 sys.exit(1)
-            listener_remote(argv.url, argv.interval, argv.location, argv.password,
-                          argv.passes, argv.method)
+            listener_remote(argv.url, argv.interval, location, argv.password,
+                          argv.passes, argv.method, wipe_options, argv.stream_url, argv.stream_type,
+                          argv.quorum, argv.endpoint_timeout)
 
         elif argv.mode == 'deadman':
-            if not argv.url:
-                print(f"{Colors.FAIL}❌ Error: URL (-u) is required for deadman mode.{Colors.ENDC}")
+            if not argv.url and not argv.heartbeat_addresses:
+                print(f"{Colors.FAIL}❌ Error: URL (-u) or --heartbeat-socket is required for deadman mode.{Colors.ENDC}")
                 sys.exit(1)
             listener_deadman(argv.url, argv.interval, argv.grace_period,
-                           argv.location, argv.password, argv.passes, argv.method)
+                           location, argv.password, argv.passes, argv.method, wipe_options,
+                           argv.endpoint_timeout, argv.heartbeat_addresses,
+                           heartbeat_key.encode() if heartbeat_key else None)
+
+        elif argv.mode == 'daemon':
+            listener_daemon(location, argv.password, argv.passes, argv.method, wipe_options,
+                            argv.control_socket)
+
+        elif argv.mode == 'calibrate':
+            listener_calibrate(targets[0]['path'], argv.probe_size, argv.recalibrate)
 
         elif argv.mode == 'cloud':
             listener_cloud(argv.cloud_platforms, argv.cloud_all)
 
         else:
             print(f"{Colors.FAIL}❌ Invalid mode: {argv.mode}{Colors.ENDC}")
-            print(f"{Colors.WARNING}Valid modes: local, remote, deadman, cloud{Colors.ENDC}")
+            print(f"{Colors.WARNING}Valid modes: local, remote, deadman, cloud, calibrate, daemon, checkin{Colors.ENDC}")
             sys.exit(1)
 
     except KeyboardInterrupt:
@@ -0,0 +1,464 @@
+#!/usr/bin/python3
+
+"""
+RWIPE Benchmarks - performance measurements for rwipe.py
+
+Original Concept: Utku Sen (Jani) | utkusen.com
+Enhanced: Shadow Dev | 2024
+
+Benchmarks:
+- importtime: cold-start import cost of rwipe (python -X importtime),
+              checked against a budget so slow imports fail loudly
+- manifest:   memory per file of the compact Manifest vs a dict per file
+- offload:    random-pass and encryption throughput in-process vs the
+              CryptoOffload process pool, for a growing number of cores
+- latency:    end-to-end reaction of remote / deadman mode against a local
+              HTTP stand-in: time to detection, first file and completion
+
+Usage:
+    python3 rwipe_bench.py importtime --budget-ms 50
+    python3 rwipe_bench.py importtime --runs 10 --json bench_importtime.json
+    python3 rwipe_bench.py manifest --files 2000000
+    python3 rwipe_bench.py offload --size 512M
+    python3 rwipe_bench.py latency --dir /tmp/scratch --mode deadman --intervals 0.5,2
+
+WARNING: Some benchmarks create and destroy scratch files. Only point them
+at scratch directories.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure_import(module='rwipe'):
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        (import_us, process_s) - cumulative import time of the module in
+        microseconds, and wall time of the whole interpreter process.
+    """
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # Let the warm-up run cache bytecode
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          cwd=HERE, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr}")
+
+    for line in proc.stderr.splitlines():
+        parts = [p.strip() for p in line.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]), elapsed
+    raise RuntimeError(f"No importtime entry for {module}")
+
+
+def measure_interpreter():
+    """Wall time of a bare interpreter start, as the floor for process time."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', 'pass'], check=True)
+    return time.perf_counter() - start
+
+
+def bench_importtime(args):
+    """Median cold-start import time of rwipe against a budget."""
+    # Warm-up run writes the bytecode cache so we measure imports, not compile
+    measure_import()
+    baseline = statistics.median(measure_interpreter() for _ in range(args.runs))
+    samples = [measure_import() for _ in range(args.runs)]
+    import_ms = statistics.median(s[0] for s in samples) / 1000
+    process_ms = statistics.median(s[1] for s in samples) * 1000
+
+    result = {
+        'benchmark': 'importtime',
+        'runs': args.runs,
+        'import_ms': round(import_ms, 2),
+        'process_ms': round(process_ms, 2),
+        'interpreter_baseline_ms': round(baseline * 1000, 2),
+        'budget_ms': args.budget_ms,
+        'within_budget': import_ms <= args.budget_ms,
+    }
+
+    print(f"import rwipe: {import_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"process:      {process_ms:.1f} ms (bare interpreter {baseline * 1000:.1f} ms)")
+    return result
+
+
+def synthetic_tree(files, files_per_dir=200):
+    """Yield (directory, name, stat) for a fake tree; every 50th file is hardlinked."""
+    for i in range(files):
+        directory = f"/srv/tenant{i // 100000:03d}/data/part{i // files_per_dir:07d}"
+        ino = i - 1 if i % 50 == 1 else i
+        st = SimpleNamespace(st_dev=2049, st_ino=ino, st_nlink=2 if i % 50 in (0, 1) else 1)
+        yield directory, f"record-{i:09d}.sqlite", st
+
+
+def bench_manifest(args):
+    """Heap bytes per file: compact Manifest vs the naive dict-per-file layout."""
+    import rwipe
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    manifest = rwipe.Manifest()
+    last_dir, parent = None, None
+    for directory, name, st in synthetic_tree(args.files):
+        if directory != last_dir:
+            parent, last_dir = manifest.add_directory(directory), directory
+        manifest.add(parent, name, st, 4096)
+    build_s = time.perf_counter() - start
+    manifest_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    sample = min(args.files, args.baseline_files)
+    tracemalloc.start()
+    entries = {}
+    for directory, name, st in synthetic_tree(sample):
+        entry = entries.get((st.st_dev, st.st_ino))
+        if entry is None:
+            entries[(st.st_dev, st.st_ino)] = {'paths': [os.path.join(directory, name)], 'size': 4096}
+        else:
+            entry['paths'].append(os.path.join(directory, name))
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entries
+
+    result = {
+        'benchmark': 'manifest',
+        'files': args.files,
+        'build_seconds': round(build_s, 3),
+        'manifest_bytes_per_file': round(manifest_bytes / args.files, 1),
+        'manifest_column_bytes_per_file': round(manifest.nbytes / args.files, 1),
+        'dict_bytes_per_file': round(dict_bytes / sample, 1),
+        'dict_sample_files': sample,
+    }
+
+    if args.mmap:
+        path = args.mmap
+        manifest.save(path)
+        start = time.perf_counter()
+        mapped = rwipe.Manifest.load(path)
+        for i in range(0, len(mapped), max(1, len(mapped) // 1000)):
+            mapped.path(i)  # Touch a sample of records through the mapping
+        result['mmap_open_seconds'] = round(time.perf_counter() - start, 4)
+        result['mmap_file_bytes'] = os.path.getsize(path)
+        os.remove(path)
+
+    print(f"files:    {args.files:,} (built in {build_s:.2f}s under tracemalloc)")
+    print(f"manifest: {result['manifest_bytes_per_file']} bytes/file "
+          f"({result['manifest_column_bytes_per_file']} in columns + arena)")
+    print(f"dict:     {result['dict_bytes_per_file']} bytes/file (sampled on {sample:,} files)")
+    return result
+
+
+def offload_run(rwipe, processes, threads, total, chunk_size):
+    """MB/s of random fill + CBC encryption of `total` bytes by `threads` writer threads."""
+    import threading
+    from Crypto.Cipher import AES
+
+    pool = rwipe.BufferPool(workers=threads, chunk_size=chunk_size, shared=processes > 0)
+    offload = rwipe.CryptoOffload(processes) if processes else None
+    key = os.urandom(32)
+    per_thread = total // threads // chunk_size
+
+    def writer():
+        buf = pool.acquire()
+        view = memoryview(buf)
+        iv = os.urandom(16)
+        cipher = AES.new(key, AES.MODE_CBC, iv)
+        for _ in range(per_thread):
+            if offload:
+                offload.fill_random(pool, buf, chunk_size)
+                iv = offload.encrypt(pool, buf, chunk_size, key, iv)
+            else:
+                rwipe.random_keystream().encrypt(view, output=view)
+                cipher.encrypt(view, output=view)
+        del view
+        pool.release(buf)
+
+    if offload:
+        # Start the worker processes before timing
+        buf = pool.acquire()
+        for _ in range(processes * 2):
+            offload.fill_random(pool, buf, 16)
+        pool.release(buf)
+
+    workers = [threading.Thread(target=writer) for _ in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+    if offload:
+        offload.close()
+    pool.close()
+    return per_thread * threads * chunk_size / elapsed / (1024 * 1024)
+
+
+def bench_offload(args):
+    """Throughput of the CPU side of a wipe with 0..N offload processes."""
+    import rwipe
+
+    total = rwipe.parse_size(args.size)
+    chunk_size = rwipe.parse_size(args.chunk)
+    max_procs = args.max_procs or os.cpu_count() or 1
+    counts = [0] + [n for n in (1, 2, 4, 8, 16, 32, 64) if n <= max_procs]
+    if max_procs not in counts:
+        counts.append(max_procs)
+
+    rows = []
+    for processes in counts:
+        threads = max(1, processes)
+        mbps = offload_run(rwipe, processes, threads, total, chunk_size)
+        rows.append({'processes': processes, 'threads': threads, 'mb_per_s': round(mbps, 1)})
+        print(f"processes {processes:>3} | writer threads {threads:>3} | {mbps:8.1f} MB/s"
+              f" | x{mbps / rows[0]['mb_per_s']:.2f}")
+
+    return {
+        'benchmark': 'offload',
+        'cpu_count': os.cpu_count(),
+        'bytes': total,
+        'chunk_size': chunk_size,
+        'runs': rows,
+    }
+
+
+class StandIn:
+    """
+    Local HTTP stand-in for a trigger / heartbeat page.
+
+    Serves `body` at every path with an ETag, so conditional polls get
+    304s as they would from a real static host.
+    """
+
+    def __init__(self):
+        import hashlib
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        stand_in = self
+        self.body = b'waiting'
+        self.lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with stand_in.lock:
+                    body = stand_in.body
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server.server_port}/{path}"
+
+    def set(self, body):
+        with self.lock:
+            self.body = body
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def make_tree(root, files, file_size, files_per_dir=100):
+    """Scratch tree of `files` random files of `file_size` bytes."""
+    for i in range(files):
+        directory = os.path.join(root, f"d{i // files_per_dir:05d}")
+        if i % files_per_dir == 0:
+            os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"f{i:07d}.bin"), 'wb') as f:
+            f.write(os.urandom(file_size))
+
+
+def latency_run(rwipe, stand_in, args, run, mode, interval, files):
+    """
+    Arm one listener on a fresh tree, flip the stand-in and time the reaction.
+
+    Returns:
+        dict of seconds from the flip to detection, to the first file
+        destroyed and to completion (None if it did not happen in time).
+    """
+    import contextlib
+    import shutil
+    import tempfile
+    import threading
+
+    root = tempfile.mkdtemp(prefix='rwipe-latency-', dir=args.dir)
+    make_tree(root, files, args.file_size)
+    url = stand_in.url(f"run{run}")  # Fresh URL per run, so no cached poller state
+    marks = {}
+    record = rwipe.WipeEngine._record
+    destroy = rwipe.destroy_directory
+
+    def timed_record(engine, plan, result, index, paths, ok, file_stats):
+        marks.setdefault('first_file', time.perf_counter())
+        return record(engine, plan, result, index, paths, ok, file_stats)
+
+    def timed_destroy(*a, **kw):
+        marks['detected'] = time.perf_counter()
+        try:
+            return destroy(*a, **kw)
+        finally:
+            marks['done'] = time.perf_counter()
+
+    wipe_options = {'workers': args.workers}
+    if mode == 'remote':
+        stand_in.set(b'waiting')
+        target = rwipe.listener_remote
+        target_args = ([url], interval, root, args.password, args.passes, args.method, wipe_options)
+    else:
+        stand_in.set(b'alive')
+        target = rwipe.listener_deadman
+        target_args = ([url], interval, args.grace, root, args.password, args.passes, args.method,
+                       wipe_options)
+
+    rwipe.WipeEngine._record = timed_record
+    rwipe.destroy_directory = timed_destroy
+    try:
+        with open(os.devnull, 'w') as quiet, contextlib.redirect_stdout(quiet):
+            listener = threading.Thread(target=target, args=target_args, daemon=True)
+            listener.start()
+            time.sleep(args.settle if mode == 'remote' else max(args.settle, interval * 2))
+            flipped = time.perf_counter()
+            stand_in.set(b'start' if mode == 'remote' else b'offline')
+            listener.join(args.timeout)
+    finally:
+        rwipe.WipeEngine._record = record
+        rwipe.destroy_directory = destroy
+        shutil.rmtree(root, ignore_errors=True)
+
+    def since(name):
+        return round(marks[name] - flipped, 4) if name in marks else None
+
+    row = {'mode': mode, 'interval': interval, 'files': files,
+           'detect_s': since('detected'), 'first_file_s': since('first_file'),
+           'complete_s': since('done'), 'timed_out': listener.is_alive()}
+    if mode == 'deadman':
+        row['grace'] = args.grace
+    return row
+
+
+def bench_latency(args):
+    """Trigger-to-wipe latency of remote / deadman mode across poll intervals and tree sizes."""
+    import logging
+    import rwipe
+
+    logging.disable(logging.WARNING)
+    intervals = [float(i) for i in args.intervals.split(',')]
+    sizes = [int(n) for n in args.files.split(',')]
+    modes = ['remote', 'deadman'] if args.mode == 'both' else [args.mode]
+    stand_in = StandIn()
+    rows = []
+    run = 0
+    try:
+        for mode in modes:
+            for interval in intervals:
+                if mode == 'deadman' and interval >= args.grace:
+                    # Heartbeats this sparse fire the switch between polls, before any flip
+                    print(f"deadman  interval {interval:>5}s | skipped: not below grace {args.grace}s")
+                    continue
+                for files in sizes:
+                    for _ in range(args.repeat):
+                        run += 1
+                        row = latency_run(rwipe, stand_in, args, run, mode, interval, files)
+                        rows.append(row)
+                        print(f"{mode:<8} interval {interval:>5}s | files {files:>7} | "
+                              f"detect {row['detect_s']}s | first file {row['first_file_s']}s | "
+                              f"complete {row['complete_s']}s{' | TIMED OUT' if row['timed_out'] else ''}")
+    finally:
+        stand_in.close()
+
+    return {
+        'benchmark': 'latency',
+        'method': args.method,
+        'passes': args.passes,
+        'file_size': args.file_size,
+        'workers': args.workers,
+        'runs': rows,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='RWIPE performance benchmarks')
+    sub = parser.add_subparsers(dest='benchmark', required=True)
+
+    p = sub.add_parser('importtime', help='Cold-start import cost of rwipe')
+    p.add_argument('--runs', type=int, default=5, help='Number of fresh interpreters (default: 5)')
+    p.add_argument('--budget-ms', type=float, default=50.0,
+                   help='Fail if the median import time exceeds this (default: 50)')
+    p.add_argument('--json', dest='json_path', help='Write results as JSON to this file')
+    p.set_defaults(func=bench_importtime)
+
+    p = sub.add_parser('manifest', help='Memory per file of the compact manifest')
+    p.add_argument('--files', type=int, default=1000000, help='Synthetic files (default: 1,000,000)')
+    p.add_argument('--baseline-files', type=int, default=200000,
+                   help='Files used for the dict-per-file baseline (default: 200,000)')
+    p.add_argument('--mmap', metavar='PATH', help='Also save to PATH and time a memory-mapped reopen')
+    p.add_argument('--json', dest='json_path', help='Write results as JSON to this file')
+    p.set_defaults(func=bench_manifest)
+
+    p = sub.add_parser('offload', help='Random/encryption throughput with the process-pool offload')
+    p.add_argument('--size', default='256M', help='Bytes processed per configuration (default: 256M)')
+    p.add_argument('--chunk', default='1M', help='Buffer size (default: 1M)')
+    p.add_argument('--max-procs', type=int, default=None, help='Largest process count (default: CPU count)')
+    p.add_argument('--json', dest='json_path', help='Write results as JSON to this file')
+    p.set_defaults(func=bench_offload)
+
+    p = sub.add_parser('latency', help='End-to-end trigger latency of remote / deadman mode')
+    p.add_argument('--dir', required=True, help='Scratch directory for the synthetic trees')
+    p.add_argument('--mode', choices=['remote', 'deadman', 'both'], default='both',
+                   help='Listener to measure (default: both)')
+    p.add_argument('--intervals', default='0.5,1,2', help='Poll intervals in seconds (default: 0.5,1,2)')
+    p.add_argument('--files', default='100,1000', help='Tree sizes in files (default: 100,1000)')
+    p.add_argument('--file-size', type=int, default=4096, help='Bytes per file (default: 4096)')
+    p.add_argument('--grace', type=float, default=2.0, help='Deadman grace period (default: 2)')
+    p.add_argument('--repeat', type=int, default=1, help='Runs per configuration (default: 1)')
+    p.add_argument('--method', choices=['secure', 'wipe', 'encrypt'], default='wipe',
+                   help='Wipe method (default: wipe)')
+    p.add_argument('--passes', type=int, default=1, help='Overwrite passes (default: 1)')
+    p.add_argument('--workers', type=int, default=1, help='Worker threads (default: 1)')
+    p.add_argument('--password', default='bench-password', help='Password for encrypt/secure')
+    p.add_argument('--settle', type=float, default=0.5, help='Seconds armed before the flip (default: 0.5)')
+    p.add_argument('--timeout', type=float, default=120, help='Give up on a run after this (default: 120)')
+    p.add_argument('--json', dest='json_path', help='Write results as JSON to this file')
+    p.set_defaults(func=bench_latency)
+
+    args = parser.parse_args()
+    result = args.func(args)
+
+    if getattr(args, 'json_path', None):
+        with open(args.json_path, 'w') as f:
+            json.dump(result, f, indent=2)
+
+    if result.get('within_budget') is False:
+        print("❌ Over budget")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -39,12 +39,21 @@ def check_dependencies():
 
 check_dependencies()
 
-from flask import Flask, render_template_string, request, jsonify, session
+from flask import Flask, Response, render_template_string, request, jsonify, session
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from time import sleep
 import secrets
 import threading
 import json
 import hashlib
+import hmac
+import logging
+import heapq
+import time
+
+import rwipe
 
 app = Flask(__name__)
 app.secret_key = secrets.token_hex(32)
@@ -57,14 +66,378 @@ activation_state = {
     'target_directory': None
 }
 
-# Dead man switch state
+# Remote trigger token (armed switches live in the DeadmanScheduler below).
+# The same token unlocks the job-control and status routes.
 deadman_state = {
-    'enabled': False,
-    'last_checkin': None,
-    'grace_period': 3600,  # 1 hour default
     'url_token': secrets.token_hex(16)
 }
 
+def valid_token(token):
+    return bool(token) and hmac.compare_digest(token, deadman_state['url_token'])
+
+def authorized():
+    """True for a browser session opened with the startup link, or a request carrying the token."""
+    token = request.headers.get('X-Rwipe-Token') or request.args.get('token')
+    return session.get('authorized', False) or valid_token(token)
+
+def requires_token(view):
+    """Reject requests without the trigger token, so job paths and controls stay private."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not authorized():
+            return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+        return view(*args, **kwargs)
+    return wrapper
+
+class EventHub:
+    """
+    Change notification for /events streams.
+
+    Jobs call notify() on every file, which only bumps a counter; each
+    stream wakes on a change, but sends at most one snapshot per
+    min_interval, so a wipe of a million small files stays cheap to watch.
+    """
+
+    def __init__(self, min_interval=0.5, keepalive=15):
+        self.min_interval = min_interval
+        self.keepalive = keepalive
+        self.version = 0
+        self._cond = threading.Condition()
+
+    def notify(self):
+        with self._cond:
+            self.version += 1
+            self._cond.notify_all()
+
+    def wait(self, seen):
+        """Block until the version moves past seen (or keepalive expires); return the version."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.version != seen, timeout=self.keepalive)
+            return self.version
+
+events = EventHub()
+
+# Job engine limits (override with RWIPE_WEB_MAX_JOBS / RWIPE_WEB_MAX_QUEUED / RWIPE_WEB_WORKERS)
+MAX_RUNNING_JOBS = int(os.environ.get('RWIPE_WEB_MAX_JOBS', 1))
+MAX_QUEUED_JOBS = int(os.environ.get('RWIPE_WEB_MAX_QUEUED', 16))
+WIPE_WORKERS = int(os.environ.get('RWIPE_WEB_WORKERS', 2))
+
+class WipeJob:
+    """One activation: a target directory wiped by an in-process WipeEngine."""
+
+    def __init__(self, directory, password, source, method='secure', passes=3):
+        self.id = secrets.token_hex(8)
+        self.directory = directory
+        self.source = source
+        self.method = method
+        self.passes = passes
+        self.state = 'queued'  # queued, scanning, running, finished, cancelled, failed
+        self.created = datetime.now()
+        self.started = None
+        self.finished = None
+        self.total_files = 0
+        self.total_bytes = 0
+        self.files_done = 0
+        self.bytes_done = 0
+        self.errors = 0
+        self.result = None
+        self.message = None
+        self.cancel_requested = False
+        self.engine = None
+        self.future = None
+        self._password = password
+        self._lock = threading.Lock()
+
+    def on_progress(self, path, size, ok, result):
+        with self._lock:
+            if ok:
+                self.files_done += 1
+                self.bytes_done += size
+            else:
+                self.errors += 1
+        events.notify()
+
+    @property
+    def active(self):
+        return self.state in ('queued', 'scanning', 'running')
+
+    def run(self):
+        """Scan and wipe the directory; runs on a job manager thread."""
+        with self._lock:
+            if self.state != 'queued':
+                return
+            self.state = 'scanning'
+            self.started = datetime.now()
+        events.notify()
+        try:
+            self.engine = rwipe.WipeEngine(password=self._password, passes=self.passes,
+                                           method=self.method, workers=WIPE_WORKERS,
+                                           progress=self.on_progress)
+            self._password = None
+            plan = self.engine.plan(self.directory)
+            with self._lock:
+                self.total_files, self.total_bytes = plan.total_files, plan.total_size
+                proceed = self.state == 'scanning' and not self.cancel_requested
+                if proceed:
+                    self.state = 'running'
+            if proceed:
+                result = self.engine.execute(plan)
+                with self._lock:
+                    self.result = result.to_dict()
+                    self.state = 'cancelled' if result.cancelled else 'finished'
+        except Exception as e:
+            logging.error(f"Job {self.id} failed: {e}")
+            with self._lock:
+                self.message = str(e)
+                self.state = 'failed'
+        finally:
+            if self.engine:
+                self.engine.close()
+            with self._lock:
+                self.finished = datetime.now()
+            events.notify()
+
+    def to_dict(self):
+        with self._lock:
+            elapsed = ((self.finished or datetime.now()) - self.started).total_seconds() if self.started else 0
+            throughput = self.bytes_done / elapsed if elapsed > 0 else 0
+            eta = None
+            if self.state == 'running' and throughput:
+                eta = max(0, self.total_bytes - self.bytes_done) / throughput
+            return {
+                'id': self.id,
+                'directory': self.directory,
+                'source': self.source,
+                'method': self.method,
+                'state': self.state,
+                'created': self.created.isoformat(),
+                'started': self.started.isoformat() if self.started else None,
+                'finished': self.finished.isoformat() if self.finished else None,
+                'total_files': self.total_files,
+                'total_bytes': self.total_bytes,
+                'files_done': self.files_done,
+                'bytes_done': self.bytes_done,
+                'errors': self.errors,
+                'cancel_requested': self.cancel_requested,
+                'throughput': round(throughput),
+                'eta': round(eta, 1) if eta is not None else None,
+                'message': self.message,
+                'result': self.result,
+            }
+
+class JobManager:
+    """
+    In-process wipe jobs: a bounded queue in front of max_running worker
+    threads. Activations no longer start a new interpreter (nor put the
+    password on a command line), and every job can be listed and cancelled.
+    """
+
+    def __init__(self, max_running=MAX_RUNNING_JOBS, max_queued=MAX_QUEUED_JOBS):
+        self.max_queued = max_queued
+        self.jobs = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_running, thread_name_prefix='rwipe-job')
+        self._lock = threading.Lock()
+
+    def submit(self, directory, password, source, method='secure', passes=3):
+        """
+        Queue a wipe of directory.
+
+        Returns:
+            (job, created) - an already active job on the same directory is
+            returned instead of queueing a duplicate.
+        Raises:
+            RuntimeError if the queue is full.
+        """
+        directory = os.path.abspath(directory)
+        with self._lock:
+            for job in self.jobs.values():
+                if job.active and job.directory == directory:
+                    return job, False
+            if sum(job.state == 'queued' for job in self.jobs.values()) >= self.max_queued:
+                raise RuntimeError('Job queue is full')
+            job = WipeJob(directory, password, source, method, passes)
+            self.jobs[job.id] = job
+            job.future = self._executor.submit(job.run)
+        activation_state['activated'] = True
+        activation_state['timestamp'] = job.created
+        activation_state['target_directory'] = directory
+        events.notify()
+        return job, True
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """Cancel a queued job, or stop a running one after its in-flight files."""
+        job = self.jobs.get(job_id)
+        if job is None or not job.active:
+            return False
+        with job._lock:
+            job.cancel_requested = True
+            if job.future.cancel():
+                job.state = 'cancelled'
+                job.finished = datetime.now()
+            elif job.state in ('queued', 'scanning'):
+                job.state = 'cancelled'
+            elif job.engine:
+                # Held by the engine until its run schedules the next file
+                job.engine.cancel()
+        events.notify()
+        return True
+
+    def list(self):
+        with self._lock:
+            jobs = list(self.jobs.values())
+        return [job.to_dict() for job in jobs]
+
+jobs = JobManager()
+
+class DeadmanScheduler:
+    """
+    Named dead man switches on one timer thread.
+
+    Deadlines (monotonic) sit in a heap; the thread sleeps on a condition
+    until the earliest one and fires it exactly then. A check-in pushes a
+    new heap entry in O(log n) and leaves the old one behind, skipped as
+    stale when it surfaces; disarming removes the switch's entries. All
+    switch state is guarded by the condition. With threaded=False no
+    thread is started and run_pending() fires due switches (e.g. driven
+    by a fake clock).
+    """
+
+    def __init__(self, clock=time.monotonic, threaded=True):
+        self.clock = clock
+        self.threaded = threaded
+        self.switches = {}  # name -> switch dict
+        self._heap = []  # (deadline, seq, name)
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def _push(self, name, switch):
+        switch['deadline'] = self.clock() + switch['grace_period']
+        switch['last_checkin'] = datetime.now()
+        self._seq += 1
+        heapq.heappush(self._heap, (switch['deadline'], self._seq, name))
+        self._cond.notify()
+
+    def arm(self, name, directory, password, grace_period):
+        """Arm (or re-arm with new settings) the switch called name."""
+        with self._cond:
+            switch = {'directory': directory, 'password': password, 'grace_period': grace_period}
+            self.switches[name] = switch
+            self._push(name, switch)
+            if self.threaded and self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='rwipe-deadman', daemon=True)
+                self._thread.start()
+        events.notify()
+
+    def checkin(self, name=None):
+        """Push out the deadline of one switch, or of all of them. Returns the names checked in."""
+        with self._cond:
+            names = [name] if name is not None else list(self.switches)
+            names = [n for n in names if n in self.switches]
+            for n in names:
+                self._push(n, self.switches[n])
+        if names:
+            events.notify()
+        return names
+
+    def disarm(self, name):
+        with self._cond:
+            found = self.switches.pop(name, None) is not None
+            if found:
+                self._heap = [entry for entry in self._heap if entry[2] != name]
+                heapq.heapify(self._heap)
+                self._cond.notify()
+        if found:
+            events.notify()
+        return found
+
+    def fire(self, name=None):
+        """Fire one switch, or all of them, now. Returns the names fired."""
+        with self._cond:
+            names = [name] if name is not None else list(self.switches)
+            fired = [(n, self.switches.pop(n)) for n in names if n in self.switches]
+        for n, switch in fired:
+            self._activate(n, switch, f"trigger:{n}")
+        return [n for n, _ in fired]
+
+    def _activate(self, name, switch, source):
+        logging.warning(f"Dead man switch '{name}' fired for {switch['directory']}")
+        try:
+            jobs.submit(switch['directory'], switch['password'], source)
+        except RuntimeError as e:
+            logging.error(f"Dead man switch '{name}' could not queue its wipe: {e}")
+        events.notify()
+
+    def _pop_due(self):
+        """Pop switches past their deadline; returns (due, seconds to the next deadline or None)."""
+        due = []
+        while self._heap:
+            deadline, _, name = self._heap[0]
+            switch = self.switches.get(name)
+            if switch is None or switch['deadline'] != deadline:
+                heapq.heappop(self._heap)  # Left behind by a check-in
+                continue
+            delay = deadline - self.clock()
+            if delay > 0:
+                return due, delay
+            heapq.heappop(self._heap)
+            due.append((name, self.switches.pop(name)))
+        return due, None
+
+    def run_pending(self):
+        """Fire every switch whose deadline has passed; returns seconds until the next one (None if none)."""
+        with self._cond:
+            due, delay = self._pop_due()
+        for name, switch in due:
+            self._activate(name, switch, f"deadman:{name}")
+        return delay
+
+    def _run(self):
+        while True:
+            with self._cond:
+                due, delay = self._pop_due()
+                if not due:
+                    self._cond.wait(delay)  # Woken early by arm, check-in and disarm
+                    continue
+            for name, switch in due:
+                self._activate(name, switch, f"deadman:{name}")
+
+    def list(self):
+        with self._cond:
+            now = self.clock()
+            return [{'name': name, 'directory': switch['directory'],
+                     'grace_period': switch['grace_period'],
+                     'last_checkin': switch['last_checkin'].isoformat(),
+                     'remaining': round(max(0, switch['deadline'] - now), 1)}
+                    for name, switch in sorted(self.switches.items())]
+
+deadman = DeadmanScheduler()
+
+def status_snapshot():
+    """Activation status with progress totals over all jobs, for /status and /events."""
+    job_list = jobs.list()
+    running = [job for job in job_list if job['state'] == 'running']
+    files_done = sum(job['files_done'] for job in job_list)
+    activation_state['files_encrypted'] = files_done
+    etas = [job['eta'] for job in running if job['eta'] is not None]
+    return {
+        'activated': activation_state['activated'],
+        'deadman': deadman.list(),
+        'files_encrypted': files_done,
+        'bytes_done': sum(job['bytes_done'] for job in job_list),
+        'errors': sum(job['errors'] for job in job_list),
+        'throughput': sum(job['throughput'] for job in running),
+        'eta': max(etas) if etas else None,
+        'timestamp': str(activation_state.get('timestamp', '')),
+        'jobs': [{name: job[name] for name in ('id', 'directory', 'source', 'state', 'files_done',
+                                               'total_files', 'bytes_done', 'total_bytes', 'errors',
+                                               'throughput', 'eta', 'message')}
+                 for job in job_list],
+    }
+
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
 <html lang="en">
@@ -339,6 +712,8 @@ HTML_TEMPLATE = '''
             ✓ System Ready | No Active Protocol
         </div>
 
+        <div id="jobs"></div>
+
         <div class="cards">
             <div class="card">
                 <h3>🎯 Local Panic Mode</h3>
@@ -368,6 +743,11 @@ HTML_TEMPLATE = '''
                     <input type="text" id="dms-directory" placeholder="/path/to/directory">
                 </div>
 
+                <div class="input-group">
+                    <label for="dms-name">Switch Name:</label>
+                    <input type="text" id="dms-name" value="default">
+                </div>
+
                 <div class="input-group">
                     <label for="dms-grace">Grace Period (seconds):</label>
                     <input type="number" id="dms-grace" value="3600" min="60">
@@ -394,7 +774,7 @@ HTML_TEMPLATE = '''
                 <div class="info-box">
                     <p><strong>Trigger URL:</strong></p>
                     <p style="word-break: break-all; font-family: monospace; font-size: 0.9rem;">
-                        http://localhost:5000/trigger/{{ trigger_token }}
+                        {% if trigger_token %}http://localhost:5000/trigger/{{ trigger_token }}{% else %}Open the link printed when the server started to see this URL and job status.{% endif %}
                     </p>
                 </div>
 
@@ -465,6 +845,7 @@ HTML_TEMPLATE = '''
 
         function enableDeadManSwitch() {
             const directory = document.getElementById('dms-directory').value;
+            const name = document.getElementById('dms-name').value || 'default';
             const grace = document.getElementById('dms-grace').value;
             const password = document.getElementById('dms-password').value;
 
@@ -476,13 +857,13 @@ HTML_TEMPLATE = '''
             fetch('/enable-deadman', {
                 method: 'POST',
                 headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify({directory, grace_period: parseInt(grace), password})
+                body: JSON.stringify({name, directory, grace_period: parseInt(grace), password})
             })
             .then(r => r.json())
             .then(data => {
                 if (data.success) {
                     document.getElementById('status').className = 'status status-warning';
-                    document.getElementById('status').textContent = '☠️ DEAD MAN SWITCH ARMED | Grace Period: ' + grace + 's';
+                    document.getElementById('status').textContent = '☠️ DEAD MAN SWITCH "' + name + '" ARMED | Grace Period: ' + grace + 's';
                     alert('Dead man switch enabled! Remember to check in regularly.');
                 } else {
                     alert('Error: ' + data.message);
@@ -520,17 +901,64 @@ HTML_TEMPLATE = '''
             }
         }
 
-        // Status check every 5 seconds
-        setInterval(() => {
-            fetch('/status')
+        function cancelJob(id) {
+            fetch('/jobs/' + id + '/cancel', {method: 'POST'})
             .then(r => r.json())
-            .then(data => {
-                if (data.activated) {
-                    document.getElementById('status').className = 'status status-danger';
-                    document.getElementById('status').textContent = '🔥 ACTIVE | ' + data.files_encrypted + ' files encrypted';
+            .then(data => { if (!data.success) alert('Error: ' + data.message); });
+        }
+
+        function formatBytes(n) {
+            const units = ['B', 'KB', 'MB', 'GB', 'TB'];
+            let i = 0;
+            while (n >= 1024 && i < units.length - 1) { n /= 1024; i++; }
+            return n.toFixed(i ? 1 : 0) + ' ' + units[i];
+        }
+
+        function formatEta(seconds) {
+            if (seconds === null) return '';
+            if (seconds < 60) return ' | ETA ' + Math.ceil(seconds) + 's';
+            return ' | ETA ' + Math.floor(seconds / 60) + 'm ' + Math.ceil(seconds % 60) + 's';
+        }
+
+        {% if trigger_token %}
+        // Live progress pushed by the server (Server-Sent Events); reconnects on its own
+        const stream = new EventSource('/events');
+        stream.onmessage = (event) => {
+            const data = JSON.parse(event.data);
+            const status = document.getElementById('status');
+            if (!data.activated && data.deadman.length) {
+                status.className = 'status status-warning';
+                status.textContent = '☠️ ' + data.deadman.length + ' DEAD MAN SWITCH(ES) ARMED | '
+                    + data.deadman.map(s => s.name + ' (' + s.grace_period + 's grace)').join(' | ');
+            }
+            if (data.activated) {
+                status.className = 'status status-danger';
+                status.textContent = '🔥 ACTIVE | ' + data.files_encrypted + ' files encrypted | '
+                    + formatBytes(data.bytes_done) + ' | ' + formatBytes(data.throughput) + '/s'
+                    + formatEta(data.eta) + (data.errors ? ' | ' + data.errors + ' errors' : '');
+            }
+
+            const list = document.getElementById('jobs');
+            list.innerHTML = '';
+            data.jobs.forEach(job => {
+                const row = document.createElement('div');
+                row.className = 'info-box';
+                row.textContent = job.state.toUpperCase() + ' | ' + job.directory + ' | '
+                    + job.files_done + '/' + job.total_files + ' files | '
+                    + formatBytes(job.bytes_done) + ' of ' + formatBytes(job.total_bytes)
+                    + formatEta(job.eta) + (job.errors ? ' | ' + job.errors + ' errors' : '')
+                    + (job.message ? ' | ' + job.message : '');
+                if (['queued', 'scanning', 'running'].includes(job.state)) {
+                    const button = document.createElement('button');
+                    button.className = 'btn btn-primary';
+                    button.textContent = 'Cancel';
+                    button.onclick = () => cancelJob(job.id);
+                    row.appendChild(button);
                 }
+                list.appendChild(row);
             });
-        }, 5000);
+        };
+        {% endif %}
     </script>
 </body>
 </html>
@@ -538,7 +966,10 @@ HTML_TEMPLATE = '''
 
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE, trigger_token=deadman_state['url_token'])
+    if valid_token(request.args.get('token')):
+        session['authorized'] = True
+    token = deadman_state['url_token'] if session.get('authorized') else None
+    return render_template_string(HTML_TEMPLATE, trigger_token=token)
 
 @app.route('/activate-panic', methods=['POST'])
 def activate_panic():
@@ -553,20 +984,8 @@ def activate_panic():
         if not os.path.exists(directory):
             return jsonify({'success': False, 'message': 'Directory does not exist'})
 
-        # Launch rwipe.py in background
-        subprocess.Popen([
-            sys.executable, 'rwipe.py',
-            '-d', directory,
-            '-m', 'local',
-            '-p', password,
-            '--no-confirm'
-        ])
-
-        activation_state['activated'] = True
-        activation_state['timestamp'] = datetime.now()
-        activation_state['target_directory'] = directory
-
-        return jsonify({'success': True})
+        job, _ = jobs.submit(directory, password, 'panic')
+        return jsonify({'success': True, 'job_id': job.id})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
@@ -574,67 +993,86 @@ def activate_panic():
 def enable_deadman():
     try:
         data = request.json
-        deadman_state['enabled'] = True
-        deadman_state['last_checkin'] = datetime.now()
-        deadman_state['grace_period'] = data.get('grace_period', 3600)
-        deadman_state['directory'] = data.get('directory')
-        deadman_state['password'] = data.get('password')
-
-        # Start monitoring thread
-        threading.Thread(target=monitor_deadman, daemon=True).start()
+        directory = data.get('directory')
+        password = data.get('password')
+        if not directory or not password:
+            return jsonify({'success': False, 'message': 'Missing parameters'})
 
-        return jsonify({'success': True})
+        name = data.get('name') or 'default'
+        deadman.arm(name, directory, password, float(data.get('grace_period', 3600)))
+        return jsonify({'success': True, 'name': name})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
 @app.route('/checkin', methods=['POST'])
 def checkin():
-    if deadman_state['enabled']:
-        deadman_state['last_checkin'] = datetime.now()
-        return jsonify({'success': True, 'message': 'Check-in successful'})
+    """Check in one switch (name in the JSON body or query string), or all of them."""
+    data = request.get_json(silent=True) or {}
+    names = deadman.checkin(data.get('name') or request.args.get('name'))
+    if names:
+        return jsonify({'success': True, 'message': 'Check-in successful', 'switches': names})
     return jsonify({'success': False, 'message': 'Dead man switch not enabled'})
 
+@app.route('/disable-deadman', methods=['POST'])
+@requires_token
+def disable_deadman():
+    data = request.get_json(silent=True) or {}
+    if deadman.disarm(data.get('name') or 'default'):
+        return jsonify({'success': True})
+    return jsonify({'success': False, 'message': 'No such dead man switch'})
+
 @app.route('/trigger/<token>')
 def trigger(token):
-    if token == deadman_state['url_token']:
-        # Activate panic mode
-        if deadman_state.get('directory') and deadman_state.get('password'):
-            subprocess.Popen([
-                sys.executable, 'rwipe.py',
-                '-d', deadman_state['directory'],
-                '-m', 'local',
-                '-p', deadman_state['password'],
-                '--no-confirm'
-            ])
+    if valid_token(token):
+        # Fire every armed switch now
+        if deadman.fire():
             return "Protocol Activated", 200
     return "Invalid Token", 403
 
 @app.route('/status')
+@requires_token
 def status():
-    return jsonify({
-        'activated': activation_state['activated'],
-        'files_encrypted': activation_state.get('files_encrypted', 0),
-        'timestamp': str(activation_state.get('timestamp', ''))
-    })
-
-def monitor_deadman():
-    """Monitor dead man switch and activate if no check-in."""
-    while deadman_state['enabled']:
-        if deadman_state['last_checkin']:
-            elapsed = (datetime.now() - deadman_state['last_checkin']).total_seconds()
-            if elapsed > deadman_state['grace_period']:
-                # Activate!
-                if deadman_state.get('directory') and deadman_state.get('password'):
-                    subprocess.Popen([
-                        sys.executable, 'rwipe.py',
-                        '-d', deadman_state['directory'],
-                        '-m', 'local',
-                        '-p', deadman_state['password'],
-                        '--no-confirm'
-                    ])
-                    deadman_state['enabled'] = False
-                    break
-        sleep(10)
+    return jsonify(status_snapshot())
+
+@app.route('/events')
+@requires_token
+def event_stream():
+    """Server-Sent Events: a status snapshot on connect and after each (coalesced) change."""
+    def generate():
+        seen = events.version
+        yield f"data: {json.dumps(status_snapshot())}\n\n"
+        while True:
+            version = events.wait(seen)
+            if version == seen:
+                yield ": keepalive\n\n"
+                continue
+            seen = version
+            sleep(events.min_interval)  # Coalesce the burst of updates behind this one
+            seen = events.version
+            yield f"data: {json.dumps(status_snapshot())}\n\n"
+
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/jobs')
+@requires_token
+def list_jobs():
+    return jsonify({'jobs': jobs.list()})
+
+@app.route('/jobs/<job_id>')
+@requires_token
+def get_job(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'message': 'Unknown job'}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/jobs/<job_id>/cancel', methods=['POST'])
+@requires_token
+def cancel_job(job_id):
+    if jobs.cancel(job_id):
+        return jsonify({'success': True})
+    return jsonify({'success': False, 'message': 'No such active job'})
 
 if __name__ == '__main__':
     print("""
@@ -644,13 +1082,14 @@ if __name__ == '__main__':
 ║                                                          ║
 ╚══════════════════════════════════════════════════════════╝
 
-Starting web interface on http://localhost:5000
+Starting web interface on http://localhost:5000/?token={token}
 
-Access from mobile: http://YOUR-IP-ADDRESS:5000
+Access from mobile: http://YOUR-IP-ADDRESS:5000/?token={token}
+Status, job control and the trigger URL need this token; keep it secret.
 
 ⚠️  WARNING: This tool performs PERMANENT data destruction.
    Use only for authorized emergency protection.
 
 Press Ctrl+C to stop the server.
-""")
+""".format(token=deadman_state['url_token']))
     app.run(host='0.0.0.0', port=5000, debug=False)
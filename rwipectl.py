@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+
+"""
+RWIPE Control - thin client for a resident `rwipe.py -m daemon`
+
+Original Concept: Utku Sen (Jani) | utkusen.com
+Enhanced: Shadow Dev | 2024
+
+Commands:
+- arm:     scan the daemon's targets now so a trigger starts wiping at once
+- trigger: start the wipe (one small write to the control socket)
+- status:  state, progress and the last result
+- cancel:  stop a running wipe, or disarm
+
+Usage:
+    python3 rwipectl.py trigger
+    python3 rwipectl.py --socket /run/rwipe.sock status
+"""
+
+import argparse
+import json
+import sys
+
+from rwipe import control_request
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Control a running rwipe daemon')
+    parser.add_argument('command', choices=['arm', 'trigger', 'status', 'cancel'])
+    parser.add_argument('--socket', dest='socket_path', help='Control socket (default: as rwipe.py -m daemon)')
+    parser.add_argument('--timeout', type=float, default=10, help='Seconds to wait for a reply (default: 10)')
+    args = parser.parse_args()
+
+    try:
+        reply = control_request(args.command, args.socket_path, timeout=args.timeout)
+    except OSError as e:
+        print(f"Cannot reach rwipe daemon: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    print(json.dumps(reply, indent=2))
+    sys.exit(0 if reply.get('ok') else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""DeadlineTimer driven by an injected fake clock and wait."""
+
+import rwipe
+
+
+class FakeClock:
+    """
+    Monotonic clock that only moves inside wait(). A wait ends early at
+    the next scheduled event (e.g. a heartbeat), like a notify would.
+    """
+
+    def __init__(self, start=1000.0, overshoot=0.0):
+        self.now = start
+        self.overshoot = overshoot
+        self.events = []  # (time, callback), in order
+        self.waits = []
+
+    def __call__(self):
+        return self.now
+
+    def at(self, when, callback):
+        self.events.append((when, callback))
+
+    def wait(self, timeout):
+        self.waits.append(timeout)
+        wake = self.now + timeout
+        if self.events and self.events[0][0] < wake:
+            self.now, callback = self.events.pop(0)
+            callback()
+        else:
+            self.now = wake + self.overshoot
+
+
+def test_fires_exactly_at_the_deadline():
+    clock = FakeClock()
+    timer = rwipe.DeadlineTimer(30, clock=clock, wait=clock.wait)
+
+    slip = timer.wait()
+
+    assert clock.now == 1030.0
+    assert clock.waits == [30]
+    assert slip == 0.0
+
+
+def test_reset_pushes_the_deadline_out():
+    clock = FakeClock()
+    timer = rwipe.DeadlineTimer(30, clock=clock, wait=clock.wait)
+    clock.at(1010.0, timer.reset)  # Heartbeat 10 s in
+
+    slip = timer.wait()
+
+    assert timer.resets == 1
+    assert clock.waits == [30, 30]  # Re-slept a full grace period after the beat
+    assert clock.now == 1040.0
+    assert slip == 0.0
+
+
+def test_slip_is_reported():
+    clock = FakeClock(overshoot=0.25)
+    timer = rwipe.DeadlineTimer(5, clock=clock, wait=clock.wait)
+
+    assert timer.wait() == 0.25
+    assert timer.slip == 0.25
@@ -0,0 +1,81 @@
+"""Web GUI DeadmanScheduler driven by a fake clock, without its timer thread."""
+
+import pytest
+
+pytest.importorskip('flask')
+
+import rwipe_web
+
+
+class FakeClock:
+    def __init__(self, start=1000.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+class RecordingScheduler(rwipe_web.DeadmanScheduler):
+    """Records fired switches instead of queueing wipe jobs."""
+
+    def __init__(self, clock):
+        super().__init__(clock=clock, threaded=False)
+        self.fired = []
+
+    def _activate(self, name, switch, source):
+        self.fired.append((name, switch['directory'], source))
+
+
+def make_scheduler():
+    clock = FakeClock()
+    return clock, RecordingScheduler(clock)
+
+
+def test_fires_at_the_deadline():
+    clock, scheduler = make_scheduler()
+    scheduler.arm('docs', '/srv/docs', 'pw', 30)
+
+    clock.now = 1029.9
+    assert scheduler.run_pending() == pytest.approx(0.1)
+    assert scheduler.fired == []
+
+    clock.now = 1030.0
+    assert scheduler.run_pending() is None
+    assert scheduler.fired == [('docs', '/srv/docs', 'deadman:docs')]
+    assert scheduler.switches == {} and scheduler._heap == []
+
+
+def test_checkin_rearms_a_full_grace_period():
+    clock, scheduler = make_scheduler()
+    scheduler.arm('docs', '/srv/docs', 'pw', 30)
+    scheduler.arm('mail', '/srv/mail', 'pw', 60)
+
+    clock.now = 1020.0
+    assert scheduler.checkin('docs') == ['docs']
+
+    clock.now = 1030.0  # The original deadline: its stale heap entry is skipped
+    assert scheduler.run_pending() == pytest.approx(20.0)
+    assert scheduler.fired == []
+
+    clock.now = 1050.0
+    scheduler.run_pending()
+    assert [name for name, _, _ in scheduler.fired] == ['docs']
+
+    clock.now = 1060.0
+    scheduler.run_pending()
+    assert [name for name, _, _ in scheduler.fired] == ['docs', 'mail']
+
+
+def test_disarm_removes_the_heap_entry():
+    clock, scheduler = make_scheduler()
+    scheduler.arm('docs', '/srv/docs', 'pw', 30)
+    scheduler.checkin('docs')
+    scheduler.arm('mail', '/srv/mail', 'pw', 60)
+
+    assert scheduler.disarm('docs')
+    assert [name for _, _, name in scheduler._heap] == ['mail']
+    assert not scheduler.disarm('docs')
+
+    clock.now = 1030.0
+    assert scheduler.run_pending() == pytest.approx(30.0)
+    assert scheduler.fired == []
@@ -0,0 +1,50 @@
+"""WipeEngine.cancel() requests that arrive before the run schedules files."""
+
+import rwipe
+
+
+def make_tree(root, files=20):
+    for i in range(files):
+        (root / f"f{i}").write_bytes(b'x' * 1000)
+
+
+def test_cancel_before_execute_stops_the_run(tmp_path):
+    make_tree(tmp_path)
+    engine = rwipe.WipeEngine(method='wipe', passes=1)
+    plan = engine.plan(str(tmp_path))
+
+    engine.cancel()
+    result = engine.execute(plan)
+
+    assert result.cancelled
+    assert result.destroyed == 0
+    assert len(list(tmp_path.iterdir())) == 20
+
+
+def test_cancel_during_key_derivation_is_kept(tmp_path, monkeypatch):
+    make_tree(tmp_path)
+    engine = rwipe.WipeEngine(method='secure', passes=1, key=b'k' * 32)
+    plan = engine.plan(str(tmp_path))
+    derive = engine.get_key
+
+    def slow_key(method=None):
+        engine.cancel()  # Arrives while the KDF would be running
+        return derive(method)
+
+    monkeypatch.setattr(engine, 'get_key', slow_key)
+    result = engine.execute(plan)
+
+    assert result.cancelled
+    assert len(list(tmp_path.iterdir())) == 20
+
+
+def test_cancel_is_consumed_by_the_run(tmp_path):
+    make_tree(tmp_path, files=3)
+    engine = rwipe.WipeEngine(method='wipe', passes=1)
+    engine.cancel()
+    engine.execute(engine.plan(str(tmp_path)))
+
+    result = engine.execute(engine.plan(str(tmp_path)))
+
+    assert not result.cancelled
+    assert result.destroyed == 3
@@ -0,0 +1,30 @@
+"""Extra hardlink names of a wiped inode are unlinked relative to their own parent."""
+
+import os
+
+import rwipe
+
+
+def test_names_in_other_directories_are_unlinked(tmp_path):
+    (tmp_path / 'a').mkdir()
+    (tmp_path / 'b' / 'deep').mkdir(parents=True)
+    (tmp_path / 'a' / 'data').write_bytes(os.urandom(4096))
+    os.link(tmp_path / 'a' / 'data', tmp_path / 'b' / 'deep' / 'same')
+    engine = rwipe.WipeEngine(method='wipe', passes=1)
+
+    result = engine.execute(engine.plan(str(tmp_path)))
+
+    assert not (tmp_path / 'a' / 'data').exists()
+    assert not (tmp_path / 'b' / 'deep' / 'same').exists()
+    assert (result.destroyed, result.failed) == (2, 0)
+
+
+def test_remove_name_relative_to_dir_fd(tmp_path):
+    (tmp_path / 'name').write_bytes(b'x')
+    dir_fd = os.open(tmp_path, os.O_RDONLY)
+    try:
+        assert rwipe.remove_name(str(tmp_path / 'name'), dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
+
+    assert os.listdir(tmp_path) == []
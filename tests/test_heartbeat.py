@@ -0,0 +1,59 @@
+"""HMAC-authenticated push heartbeats for deadman mode."""
+
+import threading
+import time
+
+import rwipe
+
+KEY = b'shared heartbeat key'
+
+
+def make_listener(addresses=(), on_beat=lambda: None):
+    return rwipe.HeartbeatListener(list(addresses), KEY, on_beat)
+
+
+def test_valid_beat_is_accepted():
+    listener = make_listener()
+
+    assert listener.verify(rwipe.heartbeat_message(KEY))
+
+
+def test_wrong_key_is_rejected():
+    listener = make_listener()
+
+    assert not listener.verify(rwipe.heartbeat_message(b'some other key'))
+    assert listener.last_stamp == 0.0
+
+
+def test_stale_and_future_timestamps_are_rejected():
+    listener = make_listener()
+    skew = rwipe.HEARTBEAT_MAX_SKEW
+
+    assert not listener.verify(rwipe.heartbeat_message(KEY, time.time() - skew - 5))
+    assert not listener.verify(rwipe.heartbeat_message(KEY, time.time() + skew + 5))
+    assert listener.verify(rwipe.heartbeat_message(KEY, time.time() - skew + 5))
+
+
+def test_replayed_datagram_is_rejected():
+    listener = make_listener()
+    beat = rwipe.heartbeat_message(KEY)
+
+    assert listener.verify(beat)
+    assert not listener.verify(beat)
+    # An older (captured) beat is rejected too, a newer one still passes
+    assert not listener.verify(rwipe.heartbeat_message(KEY, time.time() - 1))
+    assert listener.verify(rwipe.heartbeat_message(KEY, time.time() + 1))
+
+
+def test_beat_over_unix_socket_calls_on_beat(tmp_path):
+    address = str(tmp_path / 'hb.sock')
+    beat = threading.Event()
+    listener = make_listener([address], beat.set).start()
+    try:
+        rwipe.send_heartbeat(address, b'wrong key')
+        rwipe.send_heartbeat(address, KEY)
+
+        assert beat.wait(5)
+        assert (listener.accepted, listener.rejected) == (1, 1)
+    finally:
+        listener.close()
@@ -0,0 +1,24 @@
+"""Importing rwipe stays cheap: heavy dependencies load lazily."""
+
+import statistics
+import subprocess
+import sys
+
+import rwipe_bench
+
+IMPORT_BUDGET_MS = 50  # Same default as `rwipe_bench.py importtime`
+
+
+def test_import_within_budget():
+    rwipe_bench.measure_import()  # Warm-up writes the bytecode cache
+    samples = [rwipe_bench.measure_import()[0] for _ in range(5)]
+
+    assert statistics.median(samples) / 1000 <= IMPORT_BUDGET_MS
+
+
+def test_heavy_dependencies_are_not_imported_eagerly():
+    code = "import sys, rwipe; print(' '.join(m for m in ('Crypto', 'requests', 'psutil') if m in sys.modules))"
+    proc = subprocess.run([sys.executable, '-c', code], cwd=rwipe_bench.HERE,
+                          capture_output=True, text=True, check=True)
+
+    assert proc.stdout.strip() == ''
@@ -0,0 +1,35 @@
+"""Job file validation happens at load time, before any mode arms."""
+
+import json
+
+import pytest
+
+import rwipe
+
+
+def write_job(tmp_path, targets):
+    path = tmp_path / 'jobs.json'
+    path.write_text(json.dumps(targets))
+    return str(path)
+
+
+def test_valid_job_file(tmp_path):
+    targets = rwipe.load_job_file(write_job(tmp_path, [
+        {'path': '/srv/a', 'method': 'wipe', 'passes': 7, 'priority': 127}, '/srv/b']))
+
+    assert targets == [
+        {'path': '/srv/a', 'method': 'wipe', 'passes': 7, 'priority': 127},
+        {'path': '/srv/b', 'method': 'secure', 'passes': 3, 'priority': 0},
+    ]
+
+
+@pytest.mark.parametrize('priority', [128, 200, -129])
+def test_out_of_range_priority_is_rejected(tmp_path, priority):
+    with pytest.raises(ValueError, match='priority'):
+        rwipe.load_job_file(write_job(tmp_path, [{'path': '/srv/a', 'priority': priority}]))
+
+
+def test_plan_rejects_out_of_range_priority(tmp_path):
+    engine = rwipe.WipeEngine(method='wipe')
+    with pytest.raises(ValueError, match='priority'):
+        engine.plan(str(tmp_path), priority=200)
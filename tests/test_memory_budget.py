@@ -0,0 +1,30 @@
+"""BufferPool memory budget and the encrypt-only method staying within it."""
+
+import os
+
+import pytest
+
+import rwipe
+
+
+def test_budget_below_one_buffer_is_rejected():
+    with pytest.raises(ValueError):
+        rwipe.BufferPool(budget=rwipe.MIN_CHUNK_SIZE - 1)
+
+
+def test_budget_caps_buffers():
+    pool = rwipe.BufferPool(budget=256 * 1024, workers=8, chunk_size=1024 * 1024)
+    assert pool.buffer_size * pool.capacity <= 256 * 1024
+
+
+def test_encrypt_method_works_through_the_pool(tmp_path):
+    data = os.urandom(1024 * 1024 + 7)
+    (tmp_path / 'f').write_bytes(data)
+    engine = rwipe.WipeEngine(method='encrypt', key=b'k' * 32, memory_budget=128 * 1024)
+
+    result = engine.execute(engine.plan(str(tmp_path)))
+
+    encrypted = (tmp_path / 'f').read_bytes()
+    assert result.failed == 0
+    assert len(encrypted) == len(data) and encrypted != data
+    assert engine.pool.peak_bytes <= 128 * 1024
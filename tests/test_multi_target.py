@@ -0,0 +1,34 @@
+"""Several targets through one WipeEngine.execute_all() run."""
+
+import os
+
+import pytest
+
+import rwipe
+
+
+def test_nested_and_repeated_targets_are_rejected(tmp_path):
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'f').write_bytes(b'x')
+    engine = rwipe.WipeEngine(method='wipe', passes=1)
+
+    for locations in ([tmp_path, tmp_path / 'sub'], [tmp_path / 'sub', tmp_path / 'sub']):
+        with pytest.raises(ValueError):
+            engine.execute_all([engine.plan(str(path)) for path in locations])
+    assert (tmp_path / 'sub' / 'f').exists()
+
+
+def test_inode_hardlinked_into_two_targets_is_wiped_once(tmp_path):
+    a, b = tmp_path / 'a', tmp_path / 'b'
+    a.mkdir()
+    b.mkdir()
+    (a / 'data').write_bytes(os.urandom(4096))
+    os.link(a / 'data', b / 'same')
+    engine = rwipe.WipeEngine(method='wipe', passes=1, workers=4)
+
+    results = engine.execute_all([engine.plan(str(a)), engine.plan(str(b))])
+
+    assert os.listdir(a) == [] and os.listdir(b) == []
+    assert sum(r.failed for r in results) == 0
+    assert sum(r.destroyed for r in results) == 2
+    assert sum(r.bytes_written for r in results) == 4096
@@ -0,0 +1,47 @@
+"""In-place overwrite passes of secure_overwrite_file."""
+
+import os
+
+import pytest
+
+import rwipe
+
+
+def test_aligned_overwrite_without_pool_writes_whole_blocks(tmp_path):
+    small = tmp_path / 'small'
+    small.write_bytes(b'secret' * 100)
+    block = os.stat(small).st_blksize
+    stats = {}
+
+    assert rwipe.secure_overwrite_file(str(small), passes=1, stats=stats, align=True)
+
+    # The pass runs out to the block boundary; secure_delete_file truncates afterwards
+    assert stats['bytes_written'] == block
+    assert b'secret' not in small.read_bytes()
+
+
+def test_sparse_file_keeps_its_holes(tmp_path):
+    sparse = tmp_path / 'sparse'
+    mb = 1024 * 1024
+    data = [(1 * mb, b'A' * 65536), (8 * mb, b'B' * 65536)]
+    with open(sparse, 'wb') as f:
+        f.truncate(16 * mb)
+        for offset, chunk in data:
+            f.seek(offset)
+            f.write(chunk)
+    blocks = os.stat(sparse).st_blocks
+    if blocks * 512 >= 16 * mb:
+        pytest.skip('filesystem does not keep holes')
+    stats = {}
+
+    assert rwipe.secure_overwrite_file(str(sparse), passes=3, stats=stats)
+
+    assert os.stat(sparse).st_blocks == blocks
+    assert stats['allocated_bytes'] == 2 * 65536
+    assert stats['bytes_written'] == 3 * 2 * 65536
+    with open(sparse, 'rb') as f:
+        for offset, chunk in data:
+            f.seek(offset)
+            assert f.read(len(chunk)) != chunk
+        f.seek(4 * mb)
+        assert f.read(65536) == bytes(65536)  # A hole still reads as zeros
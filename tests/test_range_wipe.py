@@ -0,0 +1,35 @@
+"""Split (RangeWipe) overwrite of large files on the shared worker pool."""
+
+import os
+
+import rwipe
+
+
+def make_engine(**options):
+    return rwipe.WipeEngine(method='wipe', passes=1, workers=2, split_threshold=1024 * 1024,
+                            range_size=256 * 1024, **options)
+
+
+def test_sparse_file_without_data_extents_is_deleted(tmp_path):
+    holes = tmp_path / 'holes'
+    with open(holes, 'wb') as f:
+        f.truncate(4 * 1024 * 1024)
+
+    engine = make_engine()
+    result = engine.execute(engine.plan(str(tmp_path)))
+
+    assert not holes.exists()
+    assert (result.destroyed, result.failed) == (1, 0)
+
+
+def test_split_file_is_overwritten_and_deleted(tmp_path):
+    big = tmp_path / 'big'
+    big.write_bytes(os.urandom(3 * 1024 * 1024))
+    written = []
+
+    engine = make_engine(progress=lambda path, size, ok, result: written.append(ok))
+    result = engine.execute(engine.plan(str(tmp_path)))
+
+    assert not big.exists()
+    assert written == [True]
+    assert result.bytes_written == 3 * 1024 * 1024
@@ -0,0 +1,53 @@
+"""ScanFilter include/exclude rules applied while scanning a small tree."""
+
+import os
+
+import rwipe
+
+
+def make_tree(root):
+    for rel in ('.git/objects/pack', 'src/.git', 'src/lib', 'docs'):
+        (root / rel).mkdir(parents=True)
+    for rel in ('.git/HEAD', '.git/objects/pack/p.pack', 'src/.git/config', 'src/main.py',
+                'src/lib/util.py', 'src/lib/keep_me.py', 'src/notes.txt', 'docs/index.py'):
+        (root / rel).write_bytes(b'x')
+
+
+def scan(root, scan_filter, monkeypatch):
+    """Scan root, returning (relative paths matched, directories opened, info)."""
+    opened = []
+    real_scandir = os.scandir
+
+    def scandir(path):
+        opened.append(os.path.relpath(path, root))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', scandir)
+    manifest, info = rwipe.build_manifest(str(root), detect_reflinks=False, scan_filter=scan_filter)
+    paths = sorted(os.path.relpath(manifest.path(i), root) for i in range(len(manifest)))
+    return paths, opened, info
+
+
+def test_excluded_directories_are_never_descended(tmp_path, monkeypatch):
+    make_tree(tmp_path)
+
+    paths, opened, info = scan(tmp_path, rwipe.ScanFilter(exclude=['.git']), monkeypatch)
+
+    assert not any('.git' in rel for rel in opened)
+    assert not any('.git' in rel for rel in paths)
+    assert info['pruned_dirs'] == 2
+    assert paths == ['docs/index.py', 'src/lib/keep_me.py', 'src/lib/util.py',
+                     'src/main.py', 'src/notes.txt']
+
+
+def test_include_and_exclude_precedence(tmp_path, monkeypatch):
+    make_tree(tmp_path)
+    scan_filter = rwipe.ScanFilter(include=['*.py'], exclude=['.git', 'keep_*', 'docs/*'])
+
+    paths, opened, info = scan(tmp_path, scan_filter, monkeypatch)
+
+    # Exclude wins over include; files outside every include rule are skipped
+    assert paths == ['src/lib/util.py', 'src/main.py']
+    assert info['excluded_files'] == 3  # keep_me.py, notes.txt, docs/index.py
+    # Include rules only select files, they never prune directories
+    assert {'docs', 'src/lib'} <= set(opened)
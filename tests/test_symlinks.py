@@ -0,0 +1,58 @@
+"""Symlinks and special files in a wiped tree: unlink the name, never open it."""
+
+import os
+
+import rwipe
+
+
+def wipe(path, **options):
+    engine = rwipe.WipeEngine(method='wipe', passes=1, **options)
+    return engine.execute(engine.plan(str(path)))
+
+
+def test_dangling_symlink_is_unlinked(tmp_path):
+    tree = tmp_path / 'tree'
+    tree.mkdir()
+    os.symlink(tmp_path / 'missing', tree / 'dangling')
+
+    result = wipe(tree)
+
+    assert not os.path.lexists(tree / 'dangling')
+    assert (result.destroyed, result.failed) == (1, 0)
+
+
+def test_symlink_target_outside_tree_is_untouched(tmp_path):
+    tree = tmp_path / 'tree'
+    tree.mkdir()
+    outside = tmp_path / 'outside'
+    outside.write_bytes(b'keep me')
+    os.symlink(outside, tree / 'link')
+
+    wipe(tree)
+
+    assert not os.path.lexists(tree / 'link')
+    assert outside.read_bytes() == b'keep me'
+
+
+def test_symlink_to_file_in_tree_does_not_hide_the_file(tmp_path):
+    tree = tmp_path / 'tree'
+    tree.mkdir()
+    (tree / 'a_link').symlink_to(tree / 'data')
+    (tree / 'data').write_bytes(os.urandom(8192))
+
+    result = wipe(tree)
+
+    assert os.listdir(tree) == []
+    assert result.bytes_written == 8192  # The file itself was overwritten, not just unlinked
+
+
+def test_fifo_is_unlinked_without_being_opened(tmp_path):
+    tree = tmp_path / 'tree'
+    tree.mkdir()
+    os.mkfifo(tree / 'pipe')
+
+    assert rwipe.open_regular(str(tree / 'pipe')) is None
+    result = wipe(tree)
+
+    assert os.listdir(tree) == []
+    assert (result.destroyed, result.failed, result.bytes_written) == (1, 0, 0)